@@ -14,6 +14,10 @@
             + pgcd_binaire(a,b), la méthode binaire de calcul du pgcd (doit être codée)
             + pgcd_std(a,b), la méthode de calcul du pgcd disponible avec numpy
                 (cette méthode est déjà codée dans la classe de base PgcdBase de labo_config.py)
+            + pgcd_many(a_array, b_array), le pgcd de nombreuses paires en un seul appel (tableaux numpy)
+            + pgcd_hgcd(a, b), le pgcd basé sur le demi-pgcd récursif, pour les très grands nombres
+            + xgcd(a, b) et inverse_many(values, n), Euclide étendu et inversion modulaire en lot
+            + pgcd_reduce(iterable) et lcm_reduce(iterable), pgcd et ppcm d'un nombre quelconque de valeurs
 
             Vous pouvez tester le temps d'exécution et la validité de ces méthodes en utilisant testlabo.py,
             avec les arguments -pgcd_euclide, -pgcd_binaire, -pgcd_std
@@ -24,6 +28,24 @@
             + power_monty(a, w, n),  la méthode basée sur la multiplication de Montgomery (doit être codée)
             + power_std(a, w, n), la méthode standard de mise à une puissance de Python
                 (cette méthode est déjà codée dans la classe de base PowerModBase de labo_config.py)
+            + chiffres=k (constructeur), la multiplication de Montgomery k chiffres à la fois (super-base base^k)
+            + MULT_MONTGOMERY_REDC, la multiplication de Montgomery par mot (une seule réduction REDC par produit)
+            + power_struct_k_aire(a, w) et power_struct_fenetre(a, w), exponentiation par fenêtres
+                (choisies avec le paramètre exposant du constructeur: EXPOSANT_K_AIRE ou EXPOSANT_FENETRE)
+            + EXPOSANT_COMPILE et EXPOSANT_WNAF, plans d'exposant compilés (wNAF pour les chiffres signés)
+                et mémorisés par exposant (compile_exposant)
+            + power_ladder(a, w), l'échelle de Montgomery à temps constant (POWER_LADDER, -exposant_ladder)
+            + les contextes de Montgomery (B, B^2, n', multiples de n, etc.) sont conservés dans un cache LRU
+                partagé (PowerMod.contextes): init_Montgomery n'est appelée qu'une fois par (n, base, mode)
+            + power_many(bases, exponents), la mise à une puissance d'un lot de nombres modulo le même n
+            + power_crt(a, w), la mise à une puissance par les restes chinois (Garner),
+                si les facteurs premiers de n sont passés au constructeur (paramètre facteurs)
+            + multi_power([(a, x), (b, y), ...]), la multi-exponentiation simultanée a^x * b^y * ... (Straus)
+            + MontgomeryInt (montgomery_int(a)), un entier conservé sous forme "tilde" (*, +, -, ** sans conversion)
+            + fixed_base(a, max_bits), la mise à une puissance répétée d'un nombre fixe (table précalculée, FixedBase)
+            + MULT_BARRETT, la multiplication avec réduction de Barrett (aucune division par produit)
+            + AsyncPowerMod, un frontal asyncio qui regroupe les demandes en micro-lots par modulo
+            + PowerModPool, la mise à une puissance de nombreuses tâches (a, w, n) en parallèle sur plusieurs processus
 
             Vous pouvez tester le temps d'exécution et la validité de ces méthodes en utilisant testlabo.py,
             avec les arguments -exposant_binaire, -exposant_Montgomery, -exposant_std
@@ -39,6 +61,16 @@
             avec les arguments -mult_prim, -mult_ko, -mult_std
             ou -mult (ce dernier argument teste les trois méthodes de multiplication)
 
+        - BatchPgcd: pgcd de chacun des modules avec le produit de tous les autres (arbres de produits et de restes)
+
+        - Primalite: tests de primalité (division d'essai, Miller-Rabin, Lucas fort, BPSW) et is_prime_many(candidats)
+
+        - GenerateurPremiers: nombres premiers et clés RSA par crible incrémental (en parallèle si désiré)
+
+        - Factorisation: factorisation par la méthode rho de Pollard (Brent), un seul pgcd par bloc d'itérations
+
+        - LogDiscret: logarithme discret (pas de bébé pas de géant, rho de Pollard, Pohlig-Hellman)
+
         - Note: vous pouvez tester votre code en utilisant les commandes:
             + "python testlabo.py -all" (teste l'ensemble des méthodes)
             + "python testlabo.py -h" (donne la liste des arguments possibles)
@@ -47,6 +79,19 @@
     Copyright 2007-2022, F. Mailhot et Université de Sherbrooke
 """
 
+import asyncio
+import collections
+import collections.abc
+import concurrent.futures
+import functools
+import math
+import os
+import pickle
+import random
+import sys
+import tempfile
+import timeit
+import numpy
 import labo_config
 
 
@@ -56,11 +101,195 @@ class Pgcd(labo_config.PgcdBase):
     - l'algorithme de Euclide
     - la méthode binaire de calcul du pgcd
     - le calcul standard du pgcd (méthode fournie par numpy et fournie dans la classe de base PgcdBase)
+
+    Le demi-pgcd (PGCD_HGCD) manipule des matrices 2x2 de cofacteurs de déterminant 1,
+    conservées dans un tuple (m00, m01, m10, m11), telles que (a, b) = m * (alpha, beta).
     """
 
+    HGCD_IDENTITE = (1, 0, 0, 1)
+
+    # Types de multiplication implémentés dans la classe Mult (mult_n2 et mult_ko sont encore à coder):
+    #   ajouter MULT_N2 et MULT_KO ici une fois ces méthodes complétées
+    MULT_SUPPORTES = (labo_config.MultBase.MULT_STANDARD,)
+
+    def __init__(self, op_type, mult_type=labo_config.MultBase.MULT_STANDARD):
+        """Constructeur d'un objet de type Pgcd:
+
+        Args:
+            op_type (int): Le type de calcul de pgcd effectué (voir PgcdBase)
+            mult_type (int): Le type de multiplication (voir MultBase) utilisé par le demi-pgcd (PGCD_HGCD)
+
+        Returns:
+            void: ne fait que l'initialisation de l'objet de type Pgcd
+
+        Raises:
+            ValueError: Le type de multiplication n'est pas implémenté (voir MULT_SUPPORTES)
+        """
+        self.mult = Pgcd.mult_supportee(mult_type)
+        labo_config.PgcdBase.__init__(self, op_type)
+        return
+
+    @staticmethod
+    def mult_supportee(mult_type):
+        """Retourne la multiplication de type mult_type, si elle est implémentée
+
+        Args:
+            mult_type (int): Le type de multiplication (voir MultBase)
+
+        Returns:
+            function: La méthode mult d'un objet Mult
+
+        Raises:
+            ValueError: Le type de multiplication n'est pas dans MULT_SUPPORTES
+        """
+        if mult_type not in Pgcd.MULT_SUPPORTES:
+            raise ValueError("Erreur: type de multiplication non supporté ({})".format(mult_type))
+        return Mult(mult_type).mult
+
+    def hgcd_produit(self, m, n):
+        """Produit de deux matrices de cofacteurs, effectué avec la multiplication self.mult
+
+        Args:
+            m (tuple): La matrice de gauche
+            n (tuple): La matrice de droite
+
+        Returns:
+            tuple: La matrice m * n
+        """
+        mult = self.mult
+        m00, m01, m10, m11 = m
+        n00, n01, n10, n11 = n
+        return (
+            mult(m00, n00) + mult(m01, n10),
+            mult(m00, n01) + mult(m01, n11),
+            mult(m10, n00) + mult(m11, n10),
+            mult(m10, n01) + mult(m11, n11),
+        )
+
+    def hgcd_appliquer(self, m, a, b):
+        """Applique l'inverse d'une matrice de cofacteurs à la paire (a, b):
+            - (alpha, beta) = m^-1 * (a, b), calculé avec la multiplication self.mult
+            - Comme le déterminant de m est 1, m^-1 = [[m11, -m01], [-m10, m00]]
+
+        Args:
+            m (tuple): La matrice (m00, m01, m10, m11)
+            a (long): Le premier nombre
+            b (long): Le deuxième nombre
+
+        Returns:
+            (long, long): La paire réduite (alpha, beta)
+        """
+        mult = self.mult
+        m00, m01, m10, m11 = m
+        return mult(m11, a) - mult(m01, b), mult(m00, b) - mult(m10, a)
+
+    @staticmethod
+    def hgcd_euclide(a, b, s, m, etapes=-1):
+        """Étapes d'Euclide avec seuil: le plus grand des deux nombres est réduit d'un multiple de l'autre:
+            - Le quotient est choisi pour que le résultat reste supérieur ou égal à 2^s
+            - Arrêt lorsque |a - b| < 2^s (aucune étape possible), ou après le nombre d'étapes demandé
+            - Chaque étape multiplie m à droite par [[1, q], [0, 1]] ou [[1, 0], [q, 1]]
+
+        Args:
+            a (long): Le premier nombre (a >= 2^s)
+            b (long): Le deuxième nombre (b >= 2^s)
+            s (int): Le seuil, en bits
+            m (tuple): La matrice de cofacteurs de départ
+            etapes (int): Le nombre maximal d'étapes (-1: pas de limite)
+
+        Returns:
+            (tuple, long, long): La matrice de cofacteurs et la paire réduite (alpha, beta)
+        """
+        seuil = 1 << s
+        m00, m01, m10, m11 = m
+        while etapes != 0:
+            etapes -= 1
+            if a > b:
+                if a - b < seuil:
+                    break
+                q = (a - seuil) // b
+                a -= q * b
+                m01 += q * m00
+                m11 += q * m10
+            else:
+                if b - a < seuil:
+                    break
+                q = (b - seuil) // a
+                b -= q * a
+                m00 += q * m01
+                m10 += q * m11
+        return (m00, m01, m10, m11), a, b
+
+    def hgcd(self, a, b):
+        """Demi-pgcd récursif (Schönhage / Möller):
+            - Pour des nombres de n bits, réduit la paire (a, b) tant que les deux nombres restent >= 2^s,
+                avec s = n/2 + 1 (arrêt lorsque |a - b| < 2^s)
+            - Première moitié: demi-pgcd récursif des bits de tête (a >> s, b >> s),
+                dont la matrice est appliquée à la paire complète
+            - Une étape d'Euclide avec seuil
+            - Deuxième moitié: demi-pgcd récursif des bits de tête de la paire obtenue,
+                tronquée pour que sa réduction reste au-dessus de 2^s
+            - Les matrices obtenues sur les bits de tête restent valides pour la paire complète (lemme de Möller):
+                les nombres obtenus sont toujours positifs
+            - Sous HGCD_SEUIL bits, les étapes d'Euclide sont faites directement
+            - Le coût est dominé par les produits de matrices (self.mult), d'où un coût sous-quadratique
+
+        Args:
+            a (long): Le premier nombre (a >= 0)
+            b (long): Le deuxième nombre (b >= 0)
+
+        Returns:
+            (tuple, long, long): La matrice m et la paire réduite (alpha, beta), avec (a, b) = m * (alpha, beta)
+        """
+        n = max(a, b).bit_length()
+        s = n // 2 + 1
+        if min(a, b) >> s == 0 or abs(a - b) >> s == 0:
+            return self.HGCD_IDENTITE, a, b
+        if n <= self.HGCD_SEUIL:
+            return self.hgcd_euclide(a, b, s, self.HGCD_IDENTITE)
+
+        m = self.hgcd(a >> s, b >> s)[0]
+        a, b = self.hgcd_appliquer(m, a, b)
+        m, a, b = self.hgcd_euclide(a, b, s, m, 1)
+
+        k = 2 * s - max(a, b).bit_length()
+        m2 = self.hgcd(a >> k, b >> k)[0]
+        a, b = self.hgcd_appliquer(m2, a, b)
+        return self.hgcd_euclide(a, b, s, self.hgcd_produit(m, m2))
+
+    def pgcd_hgcd(self, a, b):
+        """Calcul du pgcd basé sur le demi-pgcd (PGCD_HGCD):
+            - Chaque appel à self.hgcd divise par deux la taille de la paire, suivi d'une étape d'Euclide
+            - Sous HGCD_SEUIL bits, l'algorithme de Lehmer termine le calcul
+
+        Args:
+            a (long): Le premier nombre
+            b (long): Le deuxième nombre
+
+        Returns:
+            long: Le plus grand common diviseur entre les nombres a et b
+        """
+        a = abs(a)
+        b = abs(b)
+        while min(a, b).bit_length() > self.HGCD_SEUIL:
+            a, b = self.hgcd(a, b)[1:]
+            if a < b:
+                a, b = b, a
+            a, b = b, a % b
+        return self.pgcd_lehmer(a, b)
+
+    # Taille (en bits) sous laquelle pgcd_binaire passe à la boucle pour petits nombres
+    BINAIRE_MOT_BITS = 64
+
     @staticmethod
     def pgcd_binaire(a, b):
-        """Vous devez coder l'algorithme calcul binaire du pgcd
+        """Algorithme de calcul binaire du pgcd (algorithme de Stein):
+            - pgcd(0, b) = |b| et les nombres négatifs sont remplacés par leur valeur absolue
+            - La puissance de 2 commune à a et b est retirée dès le départ, puis remise à la fin
+            - Tous les zéros de poids faible sont retirés d'un seul coup:
+                + x & -x isole le bit à 1 le plus faible, son bit_length() - 1 est le nombre de zéros
+            - Tant que les deux nombres sont impairs, le plus petit est soustrait du plus grand
+            - Dès que les deux nombres tiennent sur BINAIRE_MOT_BITS bits, Pgcd.pgcd_binaire_mot termine le calcul
 
         Args:
             a (long): Le premier nombre
@@ -69,34 +298,462 @@ class Pgcd(labo_config.PgcdBase):
         Returns:
             long: Le plus grand common diviseur entre les nombres a et b
         """
+        a = abs(a)
+        b = abs(b)
+        if a == 0:
+            return b
+        if b == 0:
+            return a
+        ab = a | b
+        k = (ab & -ab).bit_length() - 1
+        a >>= (a & -a).bit_length() - 1
+        b >>= (b & -b).bit_length() - 1
+        mot_bits = Pgcd.BINAIRE_MOT_BITS
+        while (a | b) >> mot_bits:
+            if a > b:
+                a, b = b, a
+            b -= a
+            if b == 0:
+                return a << k
+            b >>= (b & -b).bit_length() - 1
+        return Pgcd.pgcd_binaire_mot(a, b) << k
+
+    @staticmethod
+    def pgcd_binaire_mot(a, b):
+        """Boucle de la méthode binaire du pgcd pour deux nombres impairs qui tiennent dans un mot:
+            - Même calcul que Pgcd.pgcd_binaire, sans la vérification de la taille des nombres à chaque itération
+
+        Args:
+            a (long): Le premier nombre (impair)
+            b (long): Le deuxième nombre (impair)
+
+        Returns:
+            long: Le plus grand common diviseur entre les nombres a et b
+        """
+        while a != b:
+            if a > b:
+                a, b = b, a
+            b -= a
+            b >>= (b & -b).bit_length() - 1
+        return a
+
+    @staticmethod
+    def reduce_order(iterable):
+        """Prépare une séquence de nombres pour Pgcd.pgcd_reduce et Pgcd.lcm_reduce:
+            - Une séquence déjà en mémoire (list, tuple ou numpy.ndarray) est triée, plus petits nombres en premier
+            - Tout autre itérable (générateur, fichier, range, autre séquence paresseuse, etc.)
+                est consommé tel quel, un nombre à la fois: il n'est jamais matérialisé
+
+        Args:
+            iterable (iterable): Les nombres
+
+        Returns:
+            iterable: Les nombres, dans l'ordre dans lequel ils doivent être traités
+        """
+        if isinstance(iterable, (list, tuple, numpy.ndarray)):
+            return sorted(iterable, key=abs)
+        return iterable
+
+    def pgcd_reduce(self, iterable):
+        """Calcule le pgcd de tous les nombres d'un itérable, avec la méthode self.pgcd:
+            - L'itérable est consommé un nombre à la fois (mémoire bornée, même pour un très grand fichier)
+            - Le calcul s'arrête dès que le pgcd courant vaut 1 (le reste de l'itérable n'est pas lu)
+            - Une séquence déjà en mémoire (list, tuple ou numpy.ndarray) est d'abord triée, plus petits nombres en premier
+            - Chaque nombre (et chaque pgcd, numpy.int64 pour PGCD_STD) est converti en entier Python
+
+        Args:
+            iterable (iterable): Les nombres
+
+        Returns:
+            long: Le pgcd de tous les nombres (0 si l'itérable est vide)
+        """
+        g = 0
+        for x in self.reduce_order(iterable):
+            g = int(self.pgcd(g, abs(int(x))))
+            if g == 1:
+                break
+        return g
+
+    def lcm_reduce(self, iterable):
+        """Calcule le ppcm de tous les nombres d'un itérable, avec la méthode self.pgcd:
+            - ppcm(l, x) = l / pgcd(l, x) * x
+            - L'itérable est consommé un nombre à la fois
+            - Le calcul s'arrête dès que le ppcm courant vaut 0 (un des nombres est nul)
+            - Une séquence déjà en mémoire (list, tuple ou numpy.ndarray) est d'abord triée, plus petits nombres en premier
+            - Le ppcm courant reste un entier Python (aucun débordement, même pour un tableau numpy.int64)
+
+        Args:
+            iterable (iterable): Les nombres
+
+        Returns:
+            long: Le ppcm de tous les nombres (1 si l'itérable est vide)
+        """
+        m = 1
+        for x in self.reduce_order(iterable):
+            x = abs(int(x))
+            if x == 0:
+                return 0
+            m = m // int(self.pgcd(m, x)) * x
+        return m
+
+    @staticmethod
+    def xgcd(a, b):
+        """Algorithme d'Euclide étendu:
+            - Calcule le pgcd g de a et b, ainsi que les coefficients de Bézout x et y
+            - a * x + b * y = g
+
+        Args:
+            a (long): Le premier nombre
+            b (long): Le deuxième nombre
+
+        Returns:
+            (long, long, long): Le pgcd g (positif) et les coefficients x et y
+        """
+        x0, x1 = 1, 0
+        y0, y1 = 0, 1
+        while b != 0:
+            q, r = divmod(a, b)
+            a, b = b, r
+            x0, x1 = x1, x0 - q * x1
+            y0, y1 = y1, y0 - q * y1
+        if a < 0:
+            return -a, -x0, -y0
+        return a, x0, y0
+
+    @staticmethod
+    def inverse(a, n):
+        """Calcule l'inverse modulaire de a modulo n, avec l'algorithme d'Euclide étendu
+
+        Args:
+            a (long): Le nombre à inverser
+            n (long): Le modulo
+
+        Returns:
+            long: La valeur x, 0 <= x < n, telle que a * x = 1 mod(n)
+
+        Raises:
+            ValueError: si n <= 0, ou si a n'est pas inversible modulo n (pgcd(a, n) != 1)
+        """
+        n = int(n)
+        if n <= 0:
+            raise ValueError("Erreur: le modulo doit être positif ({})".format(n))
+        g, x, _ = Pgcd.xgcd(int(a) % n, n)
+        if g != 1:
+            raise ValueError("Erreur: {} n'est pas inversible modulo {}".format(a, n))
+        return x % n
+
+    @staticmethod
+    def inverse_many(values, n):
+        """Inverse tous les nombres d'une séquence modulo n (astuce de Montgomery):
+            - Produits cumulatifs: c[i] = values[0] * ... * values[i] mod(n)   (N - 1 multiplications)
+            - Une seule inversion modulaire, celle du produit total c[N - 1]
+            - En remontant la séquence, chaque inverse est obtenu avec deux multiplications:
+                + values[i]^-1 = (c[i])^-1 * c[i - 1]
+                + (c[i - 1])^-1 = (c[i])^-1 * values[i]
+            - Coût total: une inversion et 3(N - 1) multiplications modulaires
+            - Les nombres sont convertis en entiers Python (les produits d'éléments numpy.int64 déborderaient)
+
+        Args:
+            values (list): Les nombres à inverser
+            n (long): Le modulo
+
+        Returns:
+            list: Les inverses de chacun des nombres, dans le même ordre
+
+        Raises:
+            ValueError: si n <= 0, ou si un des nombres n'est pas inversible modulo n
+        """
+        n = int(n)
+        if n <= 0:
+            raise ValueError("Erreur: le modulo doit être positif ({})".format(n))
+        values = [int(v) % n for v in values]
+        if len(values) == 0:
+            return []
+        cumul = [values[0]]
+        for v in values[1:]:
+            cumul.append(cumul[-1] * v % n)
+        g, inv, _ = Pgcd.xgcd(cumul[-1], n)
+        if g != 1:
+            for v in values:
+                if Pgcd.pgcd_euclide(v, n) != 1:
+                    raise ValueError(
+                        "Erreur: {} n'est pas inversible modulo {}".format(v, n)
+                    )
+        inv = inv % n
+        res = [0] * len(values)
+        for i in range(len(values) - 1, 0, -1):
+            res[i] = inv * cumul[i - 1] % n
+            inv = inv * values[i] % n
+        res[0] = inv
+        return res
+
+    @staticmethod
+    def trailing_zeros_many(x):
+        """Compte les zéros de poids faible de chacun des éléments d'un tableau uint64:
+            + Le bit le plus faible est isolé avec x & -x (complément à 2: ~x + 1)
+            + Le nombre de bits à 1 de (x & -x) - 1 donne le nombre de zéros (numpy.bitwise_count, numpy >= 2.0)
+            + Sinon, ce bit est une puissance de 2, donc son log2 (en virgule flottante) est exact
+            + Les éléments nuls doivent être traités par l'appelant
 
-        # voir si les chiffre sont impaire ou il y as un entre eux est pair
-        # est ce qu'il est pair ? => x mod(2) = 0 alors x est pair
+        Args:
+            x (numpy.ndarray): Tableau de nombres de type uint64
 
+        Returns:
+            numpy.ndarray: Le nombre de zéros de poids faible de chacun des éléments
+        """
+        low_bit = x & (~x + numpy.uint64(1))
+        if hasattr(numpy, "bitwise_count"):
+            return numpy.bitwise_count(low_bit - numpy.uint64(1))
+        low_bit[low_bit == 0] = 1
+        return numpy.log2(low_bit.astype(numpy.float64)).astype(numpy.uint64)
 
+    @staticmethod
+    def pgcd_binaire_uint64(a, b):
+        """Méthode binaire du pgcd, vectorisée sur des tableaux numpy de type uint64:
+            - Chaque étape est appliquée simultanément à toutes les paires (a[i], b[i])
+            - Les facteurs 2 communs sont retirés une seule fois au départ, puis remis à la fin
+            - À chaque itération, tous les zéros de poids faible de b sont retirés d'un coup,
+                puis le plus petit des deux nombres est soustrait du plus grand
+            - Le nombre d'itérations est borné par le nombre de bits (64), et non par le nombre de paires
+            - Version de référence de la méthode binaire: pgcd_many utilise numpy.gcd, environ 2.4 fois plus rapide
+                (boucle C par élément) que ces opérations numpy enchaînées (200000 paires: 0.11 s contre 0.27 s)
 
-        while a != b:  # quand on arrive a a = b alors on obtient le pgcd
-            if a % 2 == 0:
-                # print("a est pair")
+        Args:
+            a (numpy.ndarray): Le premier tableau de nombres (uint64)
+            b (numpy.ndarray): Le deuxième tableau de nombres (uint64), de même taille que a
 
-                a = a >> 1  # divider le nb sur 2
-            if b % 2 == 0:
-                # print("b est pair")
-                b = b >> 1  # diviser le nb sur 2
-            if b % 2 != 0 and a % 2 != 0:
+        Returns:
+            numpy.ndarray: Le pgcd de chacune des paires (uint64)
+        """
+        a = a.copy()
+        b = b.copy()
+        # pgcd(0, b) = b: ces paires sont retirées du calcul et leur résultat est remis à la fin
+        nul = (a == 0) | (b == 0)
+        res_nul = a[nul] | b[nul]
+        a[nul] = 1
+        b[nul] = 1
+        shift = Pgcd.trailing_zeros_many(a | b)
+        a >>= Pgcd.trailing_zeros_many(a)
+        # Seules les paires dont le calcul n'est pas terminé (b != 0) sont conservées
+        # dans les tableaux de travail, qui rapetissent au fil des itérations
+        actif = numpy.arange(a.size)
+        a_actif = a.ravel()
+        b_actif = b.ravel()
+        while actif.size != 0:
+            b_actif >>= Pgcd.trailing_zeros_many(b_actif)
+            petit = numpy.minimum(a_actif, b_actif)
+            b_actif = numpy.maximum(a_actif, b_actif) - petit
+            a_actif = petit
+            fini = b_actif == 0
+            if fini.any():
+                a.flat[actif[fini]] = a_actif[fini]
+                garde = ~fini
+                actif = actif[garde]
+                a_actif = a_actif[garde]
+                b_actif = b_actif[garde]
+        res = a << shift
+        res[nul] = res_nul
+        return res
 
-                # print("a et b sont impair")
-                if a > b:
-                    a = a - b  # faire une soustraction du plus grand nb
-                elif a < b:
-                    b = b - a
+    @staticmethod
+    def pgcd_many(a_array, b_array):
+        """Calcule le pgcd de nombreuses paires (a[i], b[i]) en un seul appel:
+            - Les paires qui tiennent sur 64 bits sont traitées par numpy.gcd sur des tableaux uint64
+                (une boucle C, aucun appel Python par paire): environ 1.6 fois plus rapide qu'une boucle
+                de math.gcd et 2.4 fois plus rapide que pgcd_binaire_uint64 (200000 paires)
+            - Les paires qui contiennent un grand nombre (plus de 64 bits) sont traitées
+                dans un tableau d'objets Python: numpy.gcd y appelle math.gcd pour chaque élément,
+                ce qui n'est pas plus rapide qu'une boucle Python (seulement plus commode)
+            - Les nombres négatifs sont remplacés par leur valeur absolue
 
-        # print(" resultat : a = ", a, "b = ", b)
+        Args:
+            a_array (numpy.ndarray ou list): Les premiers nombres
+            b_array (numpy.ndarray ou list): Les deuxièmes nombres (même taille que a_array)
 
-        if a == b:
-            res = a
+        Returns:
+            numpy.ndarray: Le pgcd de chacune des paires.  Le tableau est de type uint64 si les deux
+                entrées sont des tableaux numpy d'entiers, sinon il s'agit d'un tableau d'objets Python (long)
+        """
+        a = Pgcd.as_int_array(a_array)
+        b = Pgcd.as_int_array(b_array)
+        a, b = numpy.broadcast_arrays(a, b)
+        if a.dtype == numpy.uint64 and b.dtype == numpy.uint64:
+            return numpy.gcd(a, b)
+
+        a = numpy.abs(a.astype(object))
+        b = numpy.abs(b.astype(object))
+        res = numpy.empty(a.shape, dtype=object)
+        mot = (a < 2**64) & (b < 2**64)
+        mot = mot.astype(bool)
+        if mot.any():
+            res[mot] = numpy.gcd(a[mot].astype(numpy.uint64), b[mot].astype(numpy.uint64)).astype(object)
+        if not mot.all():
+            res[~mot] = numpy.gcd(a[~mot], b[~mot])
         return res
 
+    @staticmethod
+    def as_int_array(values):
+        """Convertit une séquence de nombres entiers en tableau numpy pour Pgcd.pgcd_many:
+            - Un tableau d'entiers signés est converti en valeurs absolues de type uint64
+            - Un tableau d'entiers non signés est converti en uint64
+            - Tout le reste (liste Python, tableau d'objets) devient un tableau d'objets Python
+
+        Args:
+            values (numpy.ndarray ou list): Les nombres à convertir
+
+        Returns:
+            numpy.ndarray: Tableau de type uint64 ou tableau d'objets Python
+        """
+        if isinstance(values, numpy.ndarray):
+            if values.dtype.kind == "u":
+                return values.astype(numpy.uint64)
+            if values.dtype.kind == "i":
+                return numpy.abs(values.astype(numpy.int64)).astype(numpy.uint64)
+        return numpy.array(values, dtype=object)
+
+
+class BatchPgcd:
+    """Classe BatchPgcd, utilisée pour calculer le pgcd de chacun des modules avec le produit de tous les autres
+    (algorithme de Bernstein, utile pour trouver les modules RSA qui partagent un facteur premier):
+
+    - Arbre de produits: chaque niveau contient les produits deux à deux du niveau précédent,
+        jusqu'au produit P de tous les modules
+    - Arbre de restes: en redescendant l'arbre, chaque noeud reçoit le reste du noeud parent modulo le carré du noeud
+        (à la feuille i, on obtient P mod N[i]^2)
+    - Le résultat pour le module N[i] est pgcd((P mod N[i]^2) / N[i], N[i]) = pgcd(N[i], P / N[i])
+    - Le coût est quasi linéaire en la taille totale des modules, au lieu de O(N^2) pgcd pour la méthode par paires
+    - Les produits sont effectués avec la multiplication de la classe Mult
+    - Pour les grands ensembles (spill_seuil modules ou plus), les niveaux de l'arbre de produits sont écrits
+        sur disque et relus un à la fois lors de la descente, ce qui borne la mémoire à deux niveaux
+    """
+
+    # Nombre de modules à partir duquel les niveaux de l'arbre sont écrits sur disque
+    SPILL_SEUIL = 1000000
+
+    def __init__(
+        self,
+        mult_type=labo_config.MultBase.MULT_STANDARD,
+        spill_dir=None,
+        spill_seuil=None,
+    ):
+        """Constructeur d'un objet de type BatchPgcd:
+
+        Args:
+            mult_type (int): Le type de multiplication (voir MultBase) utilisé pour les arbres
+            spill_dir (str): Le répertoire où écrire les niveaux de l'arbre (un répertoire temporaire par défaut)
+            spill_seuil (int): Le nombre de modules à partir duquel les niveaux sont écrits sur disque
+
+        Returns:
+            void: ne fait que l'initialisation de l'objet de type BatchPgcd
+
+        Raises:
+            ValueError: Le type de multiplication n'est pas implémenté (voir Pgcd.MULT_SUPPORTES)
+        """
+        self.mult = Pgcd.mult_supportee(mult_type)
+        self.spill_dir = spill_dir
+        self.spill_seuil = self.SPILL_SEUIL if spill_seuil is None else spill_seuil
+        self.spill = False
+        self.levels = []
+        return
+
+    def level_save(self, level):
+        """Conserve un niveau de l'arbre de produits, en mémoire ou sur disque (si self.spill)
+
+        Args:
+            level (list): Les noeuds du niveau
+
+        Returns:
+            void: Le niveau (ou le nom du fichier qui le contient) est ajouté à self.levels
+        """
+        if self.spill:
+            path = os.path.join(
+                self.spill_dir, "niveau_{}.pickle".format(len(self.levels))
+            )
+            with open(path, "wb") as f:
+                pickle.dump(level, f, pickle.HIGHEST_PROTOCOL)
+            self.levels.append(path)
+        else:
+            self.levels.append(level)
+
+    def level_load(self, index):
+        """Retourne un niveau de l'arbre de produits, relu du disque au besoin
+
+        Args:
+            index (int): L'indice du niveau (0: les modules, le dernier niveau: le produit de tous les modules)
+
+        Returns:
+            list: Les noeuds du niveau
+        """
+        level = self.levels[index]
+        if self.spill:
+            with open(level, "rb") as f:
+                level = pickle.load(f)
+        return level
+
+    def product_tree(self, moduli):
+        """Construit l'arbre de produits des modules, un niveau à la fois
+
+        Args:
+            moduli (list): Les modules
+
+        Returns:
+            long: Le produit de tous les modules (racine de l'arbre)
+        """
+        mult = self.mult
+        self.levels = []
+        level = list(moduli)
+        self.level_save(level)
+        while len(level) > 1:
+            suivant = [mult(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                suivant.append(level[-1])
+            level = suivant
+            self.level_save(level)
+        return level[0]
+
+    def remainder_tree(self):
+        """Descend l'arbre de produits construit par self.product_tree en calculant l'arbre de restes
+
+        Returns:
+            list: P mod N[i]^2, pour chacun des modules N[i]
+        """
+        mult = self.mult
+        restes = self.level_load(len(self.levels) - 1)
+        for index in range(len(self.levels) - 2, -1, -1):
+            level = self.level_load(index)
+            restes = [restes[i >> 1] % mult(x, x) for i, x in enumerate(level)]
+        return restes
+
+    def pgcd_batch(self, moduli):
+        """Calcule, pour chacun des modules, son pgcd avec le produit de tous les autres modules
+
+        Args:
+            moduli (list): Les modules (nombres positifs)
+
+        Returns:
+            list: pgcd(N[i], produit des N[j], j != i), pour chacun des modules N[i]
+        """
+        moduli = list(moduli)
+        if len(moduli) == 0:
+            return []
+        self.spill = len(moduli) >= self.spill_seuil
+        temp_dir = None
+        if self.spill and self.spill_dir is None:
+            temp_dir = tempfile.TemporaryDirectory()
+            self.spill_dir = temp_dir.name
+        try:
+            self.product_tree(moduli)
+            restes = self.remainder_tree()
+        finally:
+            if self.spill:
+                for path in self.levels:
+                    os.remove(path)
+            self.levels = []
+            if temp_dir is not None:
+                temp_dir.cleanup()
+                self.spill_dir = None
+        return [Pgcd.pgcd_lehmer(r // n, n) for r, n in zip(restes, moduli)]
+
 
 class PowerMod(labo_config.PowerModBase, labo_config.UtilFuncs):
     """Classe PowerMod, utilisée pour comparer les trois méthodes de mise à une puissance, modulo un certain nombre:
@@ -147,6 +804,13 @@ class PowerMod(labo_config.PowerModBase, labo_config.UtilFuncs):
             void: Aucune valeur retournée.  Les champs B, B2 (B^2), num_shift
                 et unite sont calculés et ajoutés à l'objet de type POWER_MOD
         """
+        self.num_shift = 0
+        self.B = 1
+        while self.B <= self.N:
+            self.B = self.B * self.base
+            self.num_shift = self.num_shift + 1
+        self.B2 = (self.B * self.B) % self.N
+        self.unite = self.B % self.N
         return
 
     def set_ordered_multiples(self):
@@ -171,6 +835,10 @@ class PowerMod(labo_config.PowerModBase, labo_config.UtilFuncs):
         Returns:
             void: Aucune valeur retournée.  Le tableau self.ordered_multiples[] est créé dans l'objet de type POWER_MOD
         """
+        self.ordered_multiples = [0] * self.base
+        for k in range(self.base):
+            multiple = k * self.N
+            self.ordered_multiples[(-multiple) % self.base] = multiple
         return
 
     def init_Montgomery(self):
@@ -201,14 +869,111 @@ class PowerMod(labo_config.PowerModBase, labo_config.UtilFuncs):
                 et comment obtenir le "chiffre" le plus faible d'un nombre
             + Une instance de la classe labo_config.UtilsFuncs
                 et certaines de ses méthodes pourraient s'avérer utiles
+            + n et la base doivent être premiers entre eux (sinon B n'est pas inversible modulo n)
 
         Rien n'est passé en paramètre, tout le nécessaire est déjà contenu dans l'objet
 
         Returns:
             void: Rien n'est retourné, cette méthode prépare l'objet pour l'utilisation de la méthode de Montgomery
+
+        Raises:
+            ValueError: pgcd(n, base) != 1 (ou n pair pour REDC)
+        """
+        if self.type == self.MULT_MONTGOMERY_REDC or self.type == self.POWER_LADDER:
+            self.init_montgomery_redc()
+            return
+        if Pgcd.pgcd_euclide(self.N, self.base) != 1:
+            raise ValueError(
+                "Erreur: n ({}) et la base ({}) doivent être premiers entre eux".format(self.N, self.base)
+            )
+        self.set_B2_numshift_and_unite()
+        self.set_ordered_multiples()
+        if self.chiffres > 1:
+            self.init_montgomery_super()
+        return
+
+    def init_montgomery_super(self):
+        """Méthode pour initialiser la multiplication de Montgomery par groupe de chiffres (super-base):
+
+            + La super-base est base^k, où k = self.chiffres (10^k en base 10, 2^(j*k) en base 2^j)
+            + super_prime = -n^-1 mod(base^k) remplace le tableau ordered_multiples pour la super-base:
+                le multiple de n à ajouter est calculé ((t mod(base^k)) * super_prime mod(base^k))
+            + super_shift = num_shift // k étapes par super-chiffre, puis num_shift % k étapes par chiffre:
+                la division totale est exactement B = base^num_shift, comme pour la méthode par chiffre
+
+        Rien n'est passé en paramètre, tout le nécessaire est déjà contenu dans l'objet
+
+        Returns:
+            void: Les champs super_base, super_prime et super_shift sont calculés
+        """
+        self.super_base = self.base**self.chiffres
+        self.super_prime = (-Pgcd.inverse(self.N % self.super_base, self.super_base)) % self.super_base
+        self.super_shift = self.num_shift // self.chiffres
+        return
+
+    def init_montgomery_redc(self):
+        """Méthode pour initialiser l'objet pour utiliser la multiplication de Montgomery par mot (REDC):
+
+            + R = 2^k, où k est le nombre de bits de n (R est la puissance de 2 immédiatement supérieure à n)
+            + n' = -n^-1 mod(R), calculé une seule fois avec l'algorithme d'Euclide étendu (Pgcd.inverse)
+            + B = R, B^2 mod(n) et "1 tilde" (R mod(n)) jouent le même rôle que pour la méthode par chiffre:
+                power_monty et power_struct sont donc utilisées sans modification
+            + n doit être impair
+
+        Rien n'est passé en paramètre, tout le nécessaire est déjà contenu dans l'objet
+
+        Returns:
+            void: Rien n'est retourné, cette méthode prépare l'objet pour l'utilisation de la méthode REDC
+        """
+        self.redc_bits = self.N.bit_length()
+        self.redc_mask = (1 << self.redc_bits) - 1
+        self.n_prime = (-Pgcd.inverse(self.N, 1 << self.redc_bits)) & self.redc_mask
+        self.B = 1 << self.redc_bits
+        self.num_shift = 1
+        self.B2 = (self.B * self.B) % self.N
+        self.unite = self.B % self.N
+        return
+
+    def init_barrett(self):
+        """Méthode pour initialiser l'objet pour utiliser la réduction de Barrett:
+
+            + k est le nombre de bits de n
+            + mu = plancher(4^k / n), calculé une seule fois (la seule division)
+
+        Rien n'est passé en paramètre, tout le nécessaire est déjà contenu dans l'objet
+
+        Returns:
+            void: Rien n'est retourné, les champs barrett_k et barrett_mu sont calculés
         """
+        self.barrett_k = self.N.bit_length()
+        self.barrett_mu = (1 << (2 * self.barrett_k)) // self.N
         return
 
+    def mult_barrett(self, a, b):
+        """Méthode de multiplication avec réduction de Barrett:
+
+            - x = a * b, avec a, b < n (donc x < 4^k)
+            - q = ((x / 2^(k-1)) * mu) / 2^(k+1), obtenu avec deux décalages binaires et une multiplication
+            - r = x - q * n: q sous-estime le quotient d'au plus 2, donc au plus deux soustractions de n
+            - Deux multiplications (q * mu et q * n) remplacent la division de mult_standard
+            - self.barrett_k et self.barrett_mu sont calculés par init_barrett
+
+        Args:
+            a (long): Le multiplicande
+            b (long): Le multiplicateur
+
+        Returns:
+            long: La valeur de a * b mod(n)
+        """
+        x = a * b
+        k = self.barrett_k
+        r = x - (((x >> (k - 1)) * self.barrett_mu) >> (k + 1)) * self.N
+        if r >= self.N:
+            r = r - self.N
+            if r >= self.N:
+                r = r - self.N
+        return r
+
     def mult_standard(self, a, b):
         """Méthode de multiplication standard, modulo un nombre N:
 
@@ -221,7 +986,7 @@ class PowerMod(labo_config.PowerModBase, labo_config.UtilFuncs):
         Returns:
             long: La valeur de a * b mod(n)
         """
-        return 42
+        return (a * b) % self.N
 
     def mult_montgomery(self, a, b):
         """Méthode de multiplication de Montgomery:
@@ -253,7 +1018,109 @@ class PowerMod(labo_config.PowerModBase, labo_config.UtilFuncs):
         Returns:
             long: La valeur de a * b mod(n)
         """
-        return 42
+        remainder = self.util.remainder
+        div_op = self.util.div_op
+        multiples = self.ordered_multiples
+        t = 0
+        for _ in range(self.num_shift):
+            t = t + remainder(b) * a
+            t = div_op(t + multiples[remainder(t)])
+            b = div_op(b)
+        if t >= self.N:
+            t = t - self.N
+        return t
+
+    def mult_montgomery_super(self, a, b):
+        """Méthode de multiplication de Montgomery, k chiffres à la fois (super-base base^k, MULT_MONTGOMERY):
+
+            - Même principe que mult_montgomery, mais avec un "chiffre" de la super-base base^k:
+                + environ k fois moins d'itérations (super_shift au lieu de num_shift)
+                + le multiple de n est calculé avec super_prime plutôt que lu dans ordered_multiples
+                + masque et décalage binaire si la base est une puissance de 2, modulo et division sinon
+            - Les num_shift % k derniers chiffres sont traités un à la fois, comme dans mult_montgomery
+            - Le multiple total de n ajouté est l'unique m < B tel que a * b + m * n est divisible par B:
+                le résultat est identique (bit pour bit) à celui de mult_montgomery
+            - self.super_base, self.super_prime et self.super_shift sont calculés par init_montgomery_super
+
+        Args:
+            a (long): Le multiplicande
+            b (long): Le multiplicateur
+
+        Returns:
+            long: La valeur de a * b / B mod(n)
+        """
+        n = self.N
+        r = self.super_base
+        n_prime = self.super_prime
+        t = 0
+        if self.util.base_is_power2:
+            mask = r - 1
+            bits = mask.bit_length()
+            for _ in range(self.super_shift):
+                t = t + (b & mask) * a
+                t = (t + (((t & mask) * n_prime) & mask) * n) >> bits
+                b = b >> bits
+        else:
+            for _ in range(self.super_shift):
+                t = t + (b % r) * a
+                t = (t + ((t % r) * n_prime % r) * n) // r
+                b = b // r
+        remainder = self.util.remainder
+        div_op = self.util.div_op
+        multiples = self.ordered_multiples
+        for _ in range(self.num_shift - self.super_shift * self.chiffres):
+            t = t + remainder(b) * a
+            t = div_op(t + multiples[remainder(t)])
+            b = div_op(b)
+        if t >= n:
+            t = t - n
+        return t
+
+    def mult_montgomery_redc(self, a, b):
+        """Méthode de multiplication de Montgomery par mot (REDC):
+
+            - Toute la réduction est faite en une seule étape, au lieu d'un "chiffre" à la fois:
+                + t = a * b
+                + m = (t * n') mod(R), obtenu avec un masque binaire
+                + u = (t + m * n) / R, obtenu avec un décalage binaire (t + m * n est un multiple de R)
+                + une seule soustraction de n au besoin, puisque u < 2n
+            - self.N (long) : Le nombre avec lequel le modulo est effectué
+            - self.n_prime, self.redc_mask et self.redc_bits sont calculés par init_montgomery_redc
+
+        Args:
+            a (long): Le multiplicande
+            b (long): Le multiplicateur
+
+        Returns:
+            long: La valeur de a * b / R mod(n)
+        """
+        t = a * b
+        m = ((t & self.redc_mask) * self.n_prime) & self.redc_mask
+        t = (t + m * self.N) >> self.redc_bits
+        if t >= self.N:
+            t = t - self.N
+        return t
+
+    def mult_montgomery_redc_masque(self, a, b):
+        """Méthode de multiplication de Montgomery par mot (REDC), utilisée par l'échelle de Montgomery:
+
+            - Même calcul que mult_montgomery_redc, mais la soustraction finale est faite sans branchement:
+                + d = u - n est toujours calculé (u < 2n, donc -n <= d < n < R)
+                + le masque d >> k (k = self.redc_bits) vaut -1 (tous les bits à 1) si d < 0, 0 autrement
+                + n & masque est ajouté à d: le résultat est u si u < n, u - n autrement
+            - Le déroulement ne dépend donc plus de la valeur de u (ni de l'exposant)
+
+        Args:
+            a (long): Le multiplicande
+            b (long): Le multiplicateur
+
+        Returns:
+            long: La valeur de a * b / R mod(n)
+        """
+        t = a * b
+        m = ((t & self.redc_mask) * self.n_prime) & self.redc_mask
+        d = ((t + m * self.N) >> self.redc_bits) - self.N
+        return d + (self.N & (d >> self.redc_bits))
 
     def power_struct(self, a, w):
         """Méthode binaire des exposants (structure):
@@ -275,15 +1142,46 @@ class PowerMod(labo_config.PowerModBase, labo_config.UtilFuncs):
         Returns:
             long: La valeur de a^w mod(n)
         """
-        return 42 * (
-            1 + (a - a + w - w) * self.base
-        )  # Expression bidon pour éliminer les warnings de PyCharm
+        res = self.unite
+        wi = self.util.inverse_exposant(w)
+        for _ in range(w.bit_length()):
+            res = self.mult(res, res)
+            if wi & 1:
+                res = self.mult(res, a)
+            wi = wi >> 1
+        return res
 
-    def power_mod(self, a, w):
-        """Méthode binaire des exposants traditionnelle:
-            - Calcul habituel de la mise à une puissance, modulo un nombre
-            - Une validation doit être faite pour assurer que le nombre "a" est plus petit que "n"
-            - self.n (long): Le nombre avec lequel le modulo est effectué
+    @staticmethod
+    def fenetre_taille(bits):
+        """Choisit la taille k des fenêtres selon le nombre de bits de l'exposant:
+            - Une fenêtre plus grande réduit le nombre de multiplications pendant le parcours de l'exposant,
+                mais augmente la taille de la table précalculée (2^k ou 2^(k-1) éléments)
+            - Les seuils correspondent au minimum du coût total (table + parcours)
+
+        Args:
+            bits (int): Le nombre de bits de l'exposant
+
+        Returns:
+            int: La taille k des fenêtres, en bits
+        """
+        if bits > 671:
+            return 6
+        if bits > 239:
+            return 5
+        if bits > 79:
+            return 4
+        if bits > 23:
+            return 3
+        return 1
+
+    def power_struct_k_aire(self, a, w):
+        """Méthode k-aire des exposants (structure):
+
+            - L'exposant est découpé en chiffres de k bits (base 2^k), du plus significatif au moins significatif
+            - Table précalculée: a^0, a^1, ..., a^(2^k - 1)  (2^k - 2 multiplications)
+            - Pour chaque chiffre d: k mises au carré, puis une multiplication par a^d (si d != 0)
+            - Les mises au carré de l'unité du départ sont évitées
+            - Utilise self.mult et self.unite, comme power_struct (standard ou Montgomery)
 
         Args:
             a (long): Le nombre à élever à une puissance
@@ -292,30 +1190,2000 @@ class PowerMod(labo_config.PowerModBase, labo_config.UtilFuncs):
         Returns:
             long: La valeur de a^w mod(n)
         """
-        return 42
+        mult = self.mult
+        k = self.fenetre_taille(w.bit_length())
+        table = [self.unite, a]
+        for _ in range(2, 1 << k):
+            table.append(mult(table[-1], a))
+        mask = (1 << k) - 1
+        shift = ((w.bit_length() + k - 1) // k) * k
+        res = self.unite
+        debut = True
+        while shift > 0:
+            shift -= k
+            d = (w >> shift) & mask
+            if not debut:
+                for _ in range(k):
+                    res = mult(res, res)
+                if d:
+                    res = mult(res, table[d])
+            elif d:
+                res = table[d]
+                debut = False
+        return res
 
-    def power_monty(self, a, w):
-        """Méthode de mise à une puissance utilisant la multiplication de Montgomery:
+    def power_struct_fenetre(self, a, w):
+        """Méthode de la fenêtre glissante (structure):
 
-            - Vous devez coder cette méthode
-            - Déterminez ce qui doit être fait pour préparer l'utilisation de la multiplication de Montgomery
-            - Inclure ces calculs préliminaires dans la méthode POWER_MOD.init_montgomery,
-                qui est appelée automatiquement par le constructeur
-            - Vous pouvez réutiliser la méthode POWER_MOD.power_struct,
-                qui utilise la méthode de multiplication appropriée:
-                + Le constructeur pointe POWER_MOD.mult vers la méthode de multiplication requise
-                par le type de calcul demandé (standard ou Montgomery)
-            - self.N (long): Le nombre avec lequel le modulo est effectué
+            - Table précalculée des puissances impaires: a^1, a^3, ..., a^(2^k - 1)  (2^(k-1) multiplications)
+            - L'exposant est parcouru du bit le plus significatif au moins significatif:
+                + Un bit à 0: une mise au carré
+                + Sinon: la plus longue fenêtre d'au plus k bits qui se termine par un 1 est lue,
+                    suivie d'autant de mises au carré que de bits dans la fenêtre et d'une multiplication
+            - Environ bits / (k + 1) multiplications en plus des mises au carré,
+                contre bits / 2 pour la méthode binaire
+            - Utilise self.mult et self.unite, comme power_struct (standard ou Montgomery)
 
         Args:
             a (long): Le nombre à élever à une puissance
             w (long): La puissance
 
-
         Returns:
             long: La valeur de a^w mod(n)
         """
-        return 42
+        mult = self.mult
+        k = self.fenetre_taille(w.bit_length())
+        a2 = mult(a, a)
+        table = [a]
+        for _ in range(1, 1 << (k - 1)):
+            table.append(mult(table[-1], a2))
+        res = self.unite
+        debut = True
+        i = w.bit_length() - 1
+        while i >= 0:
+            if not (w >> i) & 1:
+                res = mult(res, res)
+                i -= 1
+                continue
+            j = max(i - k + 1, 0)
+            while not (w >> j) & 1:
+                j += 1
+            d = (w >> j) & ((1 << (i - j + 1)) - 1)
+            if debut:
+                res = table[d >> 1]
+                debut = False
+            else:
+                for _ in range(i - j + 1):
+                    res = mult(res, res)
+                res = mult(res, table[d >> 1])
+            i = j - 1
+        return res
+
+    PLAN_CACHE = 1024
+
+    @staticmethod
+    @functools.lru_cache(maxsize=PLAN_CACHE)
+    def compile_exposant(w, k, signe=False):
+        """Compile l'exposant en un plan de mises au carré et de multiplications (mémorisé, cache LRU borné):
+
+            - Le plan ne dépend que de w et de k: un exposant réutilisé (par exemple, un exposant public)
+                n'est recodé qu'une seule fois (PowerMod.compile_exposant.cache_info() donne les statistiques)
+            - Chiffres non signés (signe=False): fenêtres glissantes d'au plus k bits (voir fenetre_positions)
+            - Chiffres signés (signe=True): forme wNAF de largeur k:
+                + chaque chiffre non nul est impair, |d| < 2^(k-1), et est suivi d'au moins k-1 zéros
+                + environ bits / (k + 1) chiffres non nuls, avec une table deux fois plus petite par signe
+            - Chaque étape est un couple (carres, d): carres mises au carré, puis une multiplication par a^d
+                (les mises au carré de la première étape sont ignorées, le premier chiffre est toujours positif)
+
+        Args:
+            w (long): La puissance
+            k (int): La taille des fenêtres (la largeur wNAF si signe), en bits
+            signe (bool): Utiliser des chiffres signés (wNAF)
+
+        Returns:
+            (((int, int), ...), int, int, int): Les étapes, les mises au carré finales,
+                le nombre de puissances impaires positives et négatives requises
+        """
+        if signe:
+            chiffres = []
+            j = 0
+            while w:
+                if w & 1:
+                    d = w & ((1 << k) - 1)
+                    if d >> (k - 1):
+                        d -= 1 << k
+                    w -= d
+                    chiffres.append((j, d))
+                w >>= 1
+                j += 1
+            chiffres.reverse()
+        else:
+            chiffres = [(j, 2 * indice + 1) for j, indice in PowerMod.fenetre_positions(w, k)]
+        if not chiffres:
+            return (), 0, 0, 0
+        etapes = []
+        precedent = chiffres[0][0]
+        for j, d in chiffres:
+            etapes.append((precedent - j, d))
+            precedent = j
+        positifs = max(d for _, d in chiffres) // 2 + 1
+        negatifs = max((-d // 2 + 1 for _, d in chiffres if d < 0), default=0)
+        return tuple(etapes), precedent, positifs, negatifs
+
+    def puissances_impaires(self, a, taille):
+        """Table des puissances impaires a^1, a^3, ..., a^(2 * taille - 1)
+
+        Args:
+            a (long): Le nombre (sous forme "tilde" au besoin)
+            taille (int): Le nombre de puissances impaires
+
+        Returns:
+            [long]: La table des puissances impaires
+        """
+        table = [a]
+        if taille > 1:
+            a2 = self.mult(a, a)
+            for _ in range(1, taille):
+                table.append(self.mult(table[-1], a2))
+        return table
+
+    def power_plan(self, a, w, signe):
+        """Exécute le plan compilé de l'exposant (voir compile_exposant):
+
+            - Aucun parcours bit par bit de l'exposant, aucune inversion des bits (inverse_exposant)
+            - Chiffres signés: la table des puissances négatives utilise l'inverse de a modulo n
+                (Euclide étendu, une seule fois par appel); si a n'est pas inversible, le plan non signé est utilisé
+            - Sous forme "tilde", l'inverse de a~ = a * B est a^-1 * B^-1, ramené à a^-1 * B
+                par deux multiplications par B^2 (sans effet pour la multiplication standard, où B^2 = 1)
+
+        Args:
+            a (long): Le nombre à élever à une puissance
+            w (long): La puissance
+            signe (bool): Utiliser des chiffres signés (wNAF)
+
+        Returns:
+            long: La valeur de a^w mod(n)
+        """
+        mult = self.mult
+        k = self.fenetre_taille(w.bit_length())
+        if signe:
+            k = k + 1
+        etapes, fin, positifs, negatifs = self.compile_exposant(w, k, signe)
+        if not etapes:
+            return self.unite
+        negative = []
+        if negatifs:
+            try:
+                inverse = Pgcd.inverse(a, self.N)
+            except ValueError:
+                return self.power_plan(a, w, False)
+            if self.type in self.TYPES_MONTGOMERY:
+                inverse = mult(mult(inverse, self.B2), self.B2)
+            negative = self.puissances_impaires(inverse, negatifs)
+        positive = self.puissances_impaires(a, positifs)
+        res = positive[etapes[0][1] >> 1]
+        for carres, d in etapes[1:]:
+            for _ in range(carres):
+                res = mult(res, res)
+            if d > 0:
+                res = mult(res, positive[d >> 1])
+            else:
+                res = mult(res, negative[-d >> 1])
+        for _ in range(fin):
+            res = mult(res, res)
+        return res
+
+    def power_struct_compile(self, a, w):
+        """Fenêtre glissante avec plan compilé et mémorisé (EXPOSANT_COMPILE, voir power_plan)
+
+        Args:
+            a (long): Le nombre à élever à une puissance
+            w (long): La puissance
+
+        Returns:
+            long: La valeur de a^w mod(n)
+        """
+        return self.power_plan(a, w, False)
+
+    def power_struct_wnaf(self, a, w):
+        """Chiffres signés wNAF avec plan compilé et mémorisé (EXPOSANT_WNAF, voir power_plan)
+
+        Args:
+            a (long): Le nombre à élever à une puissance
+            w (long): La puissance
+
+        Returns:
+            long: La valeur de a^w mod(n)
+        """
+        return self.power_plan(a, w, True)
+
+    def power_mod(self, a, w):
+        """Méthode binaire des exposants traditionnelle:
+            - Calcul habituel de la mise à une puissance, modulo un nombre
+            - Une validation doit être faite pour assurer que le nombre "a" est plus petit que "n"
+            - self.n (long): Le nombre avec lequel le modulo est effectué
+
+        Args:
+            a (long): Le nombre à élever à une puissance
+            w (long): La puissance
+
+        Returns:
+            long: La valeur de a^w mod(n)
+        """
+        return self.exposant_struct(a % self.N, w)
+
+    def power_barrett(self, a, w):
+        """Méthode binaire des exposants avec la réduction de Barrett (MULT_BARRETT):
+
+            - Les nombres restent des résidus ordinaires: aucune conversion vers (ou hors de) la forme "tilde"
+            - Pour n = 1, tous les résidus valent 0 (même a^0): la réduction de Barrett n'est pas définie pour k = 1
+
+        Args:
+            a (long): Le nombre à élever à une puissance
+            w (long): La puissance
+
+        Returns:
+            long: La valeur de a^w mod(n)
+        """
+        if self.N == 1:
+            return 0
+        return self.exposant_struct(a % self.N, w)
+
+    def power_monty(self, a, w):
+        """Méthode de mise à une puissance utilisant la multiplication de Montgomery:
+
+            - Les calculs préliminaires (B^2 mod(n), "1 tilde", multiples ordonnés de n ou n' pour REDC)
+                sont faits une seule fois par init_Montgomery, appelée par le constructeur (ou obtenus du cache)
+            - a est converti sous forme "tilde" par une multiplication de Montgomery par B^2 mod(n)
+            - La structure d'exponentiation choisie (self.exposant_struct: binaire, k-aire, fenêtre glissante,
+                plan compilé ou wNAF) utilise self.mult, qui pointe vers la multiplication de Montgomery
+                (par chiffre, super-base ou REDC)
+            - Le résultat est reconverti par une multiplication de Montgomery par 1
+            - self.N (long): Le nombre avec lequel le modulo est effectué
+
+        Args:
+            a (long): Le nombre à élever à une puissance
+            w (long): La puissance
+
+        Returns:
+            long: La valeur de a^w mod(n)
+        """
+        a_tilde = self.mult(a % self.N, self.B2)
+        res = self.exposant_struct(a_tilde, w)
+        return self.mult(res, 1)
+
+    def power_ladder(self, a, w):
+        """Méthode de mise à une puissance à temps constant (échelle de Montgomery, POWER_LADDER):
+
+            - Invariant: r1 = r0 * a, avec r0 = 1 "tilde" et r1 = a "tilde" au départ
+            - Pour chaque bit de l'exposant, exactement une multiplication (r0 * r1) et une mise au carré,
+                peu importe la valeur du bit:
+                + bit à 0: r1 = r0 * r1, r0 = r0 * r0
+                + bit à 1: r0 = r0 * r1, r1 = r1 * r1
+            - Le nombre de bits parcourus est fixe: self.redc_bits, le nombre de bits de n (contexte REDC),
+                ce qui ne révèle pas la longueur de l'exposant. Un exposant plus long (ou négatif) est refusé:
+                il peut être réduit au préalable (modulo l'ordre du groupe, phi(n) < n)
+            - Les opérandes sont choisis sans branchement: r0 et r1 sont échangés (ou non) avec un masque
+                (0 ou -1, tous les bits à 1) calculé à partir du bit, avant et après les deux multiplications
+            - Les multiplications sont faites avec la multiplication de Montgomery (self.mult), dont la soustraction
+                finale est masquée (mult_montgomery_redc_masque)
+
+        Args:
+            a (long): Le nombre à élever à une puissance
+            w (long): La puissance (0 <= w < 2^k, où k est le nombre de bits de n)
+
+        Returns:
+            long: La valeur de a^w mod(n)
+
+        Raises:
+            ValueError: L'exposant est négatif ou a plus de bits que n
+        """
+        if self.N == 1:
+            return 0
+        if w < 0 or w >> self.redc_bits:
+            raise ValueError(
+                "Erreur: l'exposant de l'échelle de Montgomery doit être positif et d'au plus {} bits".format(
+                    self.redc_bits
+                )
+            )
+        mult = self.mult
+        r0 = self.unite
+        r1 = mult(a % self.N, self.B2)
+        for i in range(self.redc_bits - 1, -1, -1):
+            mask = -((w >> i) & 1)
+            d = (r0 ^ r1) & mask
+            r0 = r0 ^ d
+            r1 = r1 ^ d
+            r1 = mult(r0, r1)
+            r0 = mult(r0, r0)
+            d = (r0 ^ r1) & mask
+            r0 = r0 ^ d
+            r1 = r1 ^ d
+        return mult(r0, 1)
+
+    @classmethod
+    def fenetre_plan(cls, w):
+        """Découpe l'exposant en fenêtres glissantes, une seule fois pour tout un lot (voir power_struct_fenetre):
+
+            - Chaque étape du plan est un couple (carres, indice):
+                + carres: le nombre de mises au carré à faire avant la multiplication
+                + indice: l'indice de la puissance impaire a^(2 * indice + 1) dans la table précalculée
+            - Les mises au carré de la première étape (celles de l'unité) sont à ignorer
+            - Les mises au carré qui suivent la dernière fenêtre (bits à 0 de poids faible) sont retournées à part
+
+        Args:
+            w (long): La puissance (w > 0)
+
+        Returns:
+            ([(int, int)], int): Le plan et le nombre de mises au carré finales
+        """
+        k = cls.fenetre_taille(w.bit_length())
+        plan = []
+        carres = 0
+        i = w.bit_length() - 1
+        while i >= 0:
+            if not (w >> i) & 1:
+                carres += 1
+                i -= 1
+                continue
+            j = max(i - k + 1, 0)
+            while not (w >> j) & 1:
+                j += 1
+            carres += i - j + 1
+            plan.append((carres, ((w >> j) & ((1 << (i - j + 1)) - 1)) >> 1))
+            carres = 0
+            i = j - 1
+        return plan, carres
+
+    def power_groupe(self, bases, w):
+        """Méthode de la fenêtre glissante appliquée à un groupe de nombres qui partagent le même exposant:
+
+            - Le plan de l'exposant (fenetre_plan) est calculé une seule fois pour tout le groupe
+            - Le plan est ensuite parcouru pour chaque nombre, l'un après l'autre: les mises au carré
+                ne peuvent pas être partagées (a^2 et b^2 sont deux calculs distincts), seul le découpage
+                de l'exposant l'est
+            - Seules les puissances impaires utilisées par le plan sont précalculées
+            - Utilise self.mult et self.unite (les nombres doivent déjà être sous forme "tilde" au besoin)
+
+        Args:
+            bases ([long]): Les nombres à élever à la puissance w (déjà réduits modulo n)
+            w (long): La puissance
+
+        Returns:
+            [long]: Les valeurs de a^w mod(n), dans l'ordre de bases
+        """
+        mult = self.mult
+        if w == 0:
+            return [self.unite] * len(bases)
+        plan, fin = self.fenetre_plan(w)
+        taille = max(indice for _, indice in plan) + 1
+        premier = plan[0][1]
+        suite = plan[1:]
+        res = []
+        for a in bases:
+            table = [a]
+            if taille > 1:
+                a2 = mult(a, a)
+                for _ in range(1, taille):
+                    table.append(mult(table[-1], a2))
+            r = table[premier]
+            for carres, indice in suite:
+                for _ in range(carres):
+                    r = mult(r, r)
+                r = mult(r, table[indice])
+            for _ in range(fin):
+                r = mult(r, r)
+            res.append(r)
+        return res
+
+    def power_many(self, bases, exponents, as_array=False):
+        """Mise à une puissance d'un lot de nombres, modulo le même n:
+
+            - Les nombres sont convertis sous forme "tilde" (Montgomery) une seule fois, au début du lot,
+                puis reconvertis une seule fois à la fin
+            - Les nombres sont regroupés par exposant: le parcours de l'exposant (fenêtre glissante)
+                est partagé par tous les nombres qui ont le même exposant (voir power_groupe)
+            - exponents peut être un seul exposant (le même pour tout le lot) ou un exposant par nombre
+            - POWER_MOD_STD utilise pow() pour chaque nombre
+            - POWER_LADDER utilise power_ladder pour chaque nombre (le temps de calcul ne doit pas dépendre
+                de l'exposant, il n'est donc pas partagé)
+            - Ce n'est pas plus rapide qu'une boucle: le coût est dominé par les multiplications, qui restent
+                les mêmes pour chaque nombre. À 2048 bits (64 nombres, même exposant), power_many prend à peu
+                près le même temps qu'une boucle d'appels à power (EXPOSANT_FENETRE), et n'est jamais plus
+                rapide qu'une boucle d'appels à pow() de Python. Seuls la conversion "tilde", le découpage de
+                l'exposant et les appels de méthode sont économisés
+
+        Args:
+            bases ([long]): Les nombres à élever à une puissance (liste, tuple ou tableau numpy)
+            exponents (long ou [long]): La puissance commune, ou une puissance par nombre
+            as_array (bool): Retourne un tableau numpy (dtype=object) plutôt qu'une liste
+
+        Returns:
+            [long]: Les valeurs de a^w mod(n), dans l'ordre de bases
+
+        Raises:
+            ValueError: Le nombre d'exposants ne correspond pas au nombre de bases
+        """
+        bases = [int(a) % self.N for a in bases]
+        if isinstance(exponents, collections.abc.Iterable):
+            exponents = [int(w) for w in exponents]
+            if len(exponents) != len(bases):
+                raise ValueError(
+                    "Erreur: {} exposants pour {} bases".format(len(exponents), len(bases))
+                )
+        else:
+            exponents = [int(exponents)] * len(bases)
+
+        if self.type == self.POWER_MOD_STD:
+            res = [pow(a, w, self.N) for a, w in zip(bases, exponents)]
+        elif self.type == self.POWER_LADDER:
+            res = [self.power_ladder(a, w) for a, w in zip(bases, exponents)]
+        else:
+            mult = self.mult
+            montgomery = self.type in self.TYPES_MONTGOMERY
+            if montgomery:
+                bases = [mult(a, self.B2) for a in bases]
+            groupes = {}
+            for i, w in enumerate(exponents):
+                groupes.setdefault(w, []).append(i)
+            res = [0] * len(bases)
+            for w, indices in groupes.items():
+                for i, r in zip(indices, self.power_groupe([bases[i] for i in indices], w)):
+                    res[i] = r
+            if montgomery:
+                res = [mult(r, 1) for r in res]
+
+        if as_array:
+            return numpy.array(res, dtype=object)
+        return res
+
+    @staticmethod
+    def fenetre_positions(w, k):
+        """Découpe l'exposant en fenêtres glissantes d'au plus k bits, repérées par leur position absolue:
+
+            - Même découpage que power_struct_fenetre: chaque fenêtre commence et se termine par un bit à 1
+            - Chaque fenêtre est un couple (j, indice):
+                + j: la position du bit le plus faible de la fenêtre
+                + indice: l'indice de la puissance impaire a^(2 * indice + 1) dans la table précalculée
+
+        Args:
+            w (long): La puissance
+            k (int): La taille maximale des fenêtres, en bits
+
+        Returns:
+            [(int, int)]: Les fenêtres, du bit le plus significatif au moins significatif
+        """
+        positions = []
+        i = w.bit_length() - 1
+        while i >= 0:
+            if not (w >> i) & 1:
+                i -= 1
+                continue
+            j = max(i - k + 1, 0)
+            while not (w >> j) & 1:
+                j += 1
+            positions.append((j, ((w >> j) & ((1 << (i - j + 1)) - 1)) >> 1))
+            i = j - 1
+        return positions
+
+    def multi_power(self, termes):
+        """Multi-exponentiation simultanée (Straus/Shamir): calcule a^x * b^y * c^z * ... mod(n)
+
+            - Une seule chaîne de mises au carré est partagée par tous les termes
+            - Chaque exposant est découpé en fenêtres glissantes (fenetre_positions), entrelacées selon leur position:
+                + à la position j, après la mise au carré, une multiplication par la puissance impaire précalculée
+                    de chaque terme dont une fenêtre se termine en j
+            - La table conjointe contient les puissances impaires de chaque terme (seulement celles qui sont utilisées)
+            - Coût: les mises au carré d'une seule exponentiation (du plus long exposant),
+                plus environ bits / (k + 1) multiplications par terme et la table
+            - Les nombres sont convertis sous forme "tilde" une seule fois (Montgomery)
+            - Utilise self.mult, quel que soit le type de calcul (pas à temps constant pour POWER_LADDER)
+
+        Args:
+            termes ([(long, long)]): Les couples (nombre, puissance)
+
+        Returns:
+            long: La valeur du produit des a^w mod(n)
+        """
+        mult = self.mult
+        montgomery = self.type in self.TYPES_MONTGOMERY
+        evenements = {}
+        bits = 0
+        for a, w in termes:
+            w = int(w)
+            if not w:
+                continue
+            a = int(a) % self.N
+            if montgomery:
+                a = mult(a, self.B2)
+            positions = self.fenetre_positions(w, self.fenetre_taille(w.bit_length()))
+            taille = max(indice for _, indice in positions) + 1
+            table = [a]
+            if taille > 1:
+                a2 = mult(a, a)
+                for _ in range(1, taille):
+                    table.append(mult(table[-1], a2))
+            for j, indice in positions:
+                evenements.setdefault(j, []).append(table[indice])
+            bits = max(bits, w.bit_length())
+
+        res = None
+        for i in range(bits - 1, -1, -1):
+            if res is not None:
+                res = mult(res, res)
+            for valeur in evenements.get(i, ()):
+                res = valeur if res is None else mult(res, valeur)
+        if res is None:
+            res = self.unite
+        if montgomery:
+            return mult(res, 1)
+        return res % self.N
+
+    def init_crt(self, facteurs):
+        """Prépare la mise à une puissance par le théorème des restes chinois (factorisation de n connue):
+
+            - n = p1^e1 * p2^e2 * ... : un objet PowerMod (même type de calcul) est créé pour chaque m = p^e
+            - phi(m) = p^(e-1) * (p - 1) est conservé pour réduire les exposants
+            - Pour la recombinaison de Garner, le produit des modules précédents (prefixe)
+                et son inverse modulo m sont précalculés
+
+        Args:
+            facteurs ([long]): Les facteurs premiers de n, répétés selon leur multiplicité (ex: [p, q] ou [p, p, q])
+
+        Returns:
+            void: La liste self.crt contient (p, e, m, phi, PowerMod, inverse, prefixe) pour chaque facteur
+
+        Raises:
+            ValueError: Le produit des facteurs n'est pas égal à n
+        """
+        compte = collections.Counter(int(p) for p in facteurs)
+        produit = 1
+        for p, e in compte.items():
+            produit *= p**e
+        if produit != self.N:
+            raise ValueError(
+                "Erreur: le produit des facteurs ({}) n'est pas égal à n ({})".format(produit, self.N)
+            )
+        self.crt = []
+        prefixe = 1
+        for p, e in sorted(compte.items()):
+            m = p**e
+            pm = PowerMod(self.type, m, self.base, self.exposant, chiffres=self.chiffres)
+            self.crt.append((p, e, m, m // p * (p - 1), pm, Pgcd.inverse(prefixe, m), prefixe))
+            prefixe *= m
+        return
+
+    def power_crt(self, a, w):
+        """Méthode de mise à une puissance utilisant le théorème des restes chinois:
+
+            - Pour chaque m = p^e (voir init_crt):
+                + si a est premier avec p, l'exposant est réduit modulo phi(m) (p - 1 pour un nombre premier)
+                + sinon a^w mod(m) vaut 0 dès que w >= e
+                + la mise à une puissance est faite avec un nombre d'environ la moitié (RSA) des bits de n
+            - Les résultats sont recombinés avec la formule de Garner:
+                + x = x + ((r - x) * prefixe^-1 mod(m)) * prefixe, où prefixe est le produit des modules précédents
+
+        Args:
+            a (long): Le nombre à élever à une puissance
+            w (long): La puissance
+
+        Returns:
+            long: La valeur de a^w mod(n)
+        """
+        res = 0
+        for p, e, m, phi, pm, inverse, prefixe in self.crt:
+            a_m = a % m
+            if a_m % p:
+                r = pm.power(a_m, w % phi)
+            elif w >= e:
+                r = 0
+            else:
+                r = pm.power(a_m, w)
+            res = res + ((r - res) * inverse % m) * prefixe
+        return res
+
+    def montgomery_int(self, a):
+        """Crée un entier conservé sous forme "tilde" (domaine de Montgomery) lié à cet objet PowerMod
+
+        Args:
+            a (long): La valeur de l'entier
+
+        Returns:
+            MontgomeryInt: L'entier a mod(n), sous forme "tilde"
+        """
+        return MontgomeryInt(self, a)
+
+    def fixed_base(self, a, max_bits, k=None):
+        """Prépare la mise à une puissance répétée d'un même nombre a (générateur fixe, Diffie-Hellman, ElGamal):
+
+            - Voir la classe FixedBase: la table est calculée une seule fois,
+                chaque appel à power(w) ne fait ensuite qu'environ max_bits / k multiplications, sans mise au carré
+
+        Args:
+            a (long): Le nombre (fixe) à élever à une puissance
+            max_bits (int): Le nombre maximal de bits des exposants
+            k (int): La taille des fenêtres, en bits (choisie selon max_bits si None)
+
+        Returns:
+            FixedBase: L'objet qui calcule a^w mod(n) pour tout w d'au plus max_bits bits
+        """
+        return FixedBase(self, a, max_bits, k)
+
+
+class FixedBase:
+    """Classe FixedBase, mise à une puissance d'un nombre fixe a par fenêtres fixes précalculées (BGMW):
+
+    - L'exposant w est découpé en chiffres de k bits: w = somme des d_i * 2^(k*i)
+    - La table contient a^(d * 2^(k*i)) pour chaque fenêtre i et chaque chiffre d de 1 à 2^k - 1:
+        + ceil(max_bits / k) * (2^k - 1) éléments, calculés une seule fois
+    - a^w est alors le produit des éléments table[i][d_i]: au plus ceil(max_bits / k) - 1 multiplications,
+        aucune mise au carré
+    - Compromis taille/vitesse: chaque bit de plus pour k double (à peu près) la table,
+        mais réduit le nombre de multiplications de max_bits / k à max_bits / (k + 1)
+    - Utilise la multiplication de l'objet PowerMod (standard ou Montgomery, la table est alors sous forme "tilde")
+    - Le temps de calcul dépend du nombre de chiffres non nuls de l'exposant (pas à temps constant)
+
+    """
+
+    def __init__(self, pm, a, max_bits, k=None):
+        """Calcule la table des puissances de a
+
+        Args:
+            pm (PowerMod): L'objet PowerMod qui définit n et la multiplication à utiliser
+            a (long): Le nombre (fixe) à élever à une puissance
+            max_bits (int): Le nombre maximal de bits des exposants
+            k (int): La taille des fenêtres, en bits (choisie selon max_bits si None)
+
+        Returns:
+            void: La table self.table est calculée
+        """
+        self.pm = pm
+        self.mult = pm.mult
+        self.max_bits = max(int(max_bits), 1)
+        self.k = k if k is not None else max(pm.fenetre_taille(self.max_bits), 2)
+        self.mask = (1 << self.k) - 1
+        self.montgomery = pm.type in pm.TYPES_MONTGOMERY
+        self.unite = pm.unite
+
+        g = a % pm.N
+        if self.montgomery:
+            g = self.mult(g, pm.B2)
+        self.table = []
+        for _ in range((self.max_bits + self.k - 1) // self.k):
+            ligne = [self.unite, g]
+            for _ in range(2, 1 << self.k):
+                ligne.append(self.mult(ligne[-1], g))
+            self.table.append(ligne)
+            g = self.mult(ligne[-1], g)
+
+    def power(self, w):
+        """Calcule a^w mod(n) à partir de la table (aucune mise au carré)
+
+        Args:
+            w (long): La puissance (0 <= w < 2^max_bits)
+
+        Returns:
+            long: La valeur de a^w mod(n)
+
+        Raises:
+            ValueError: L'exposant dépasse max_bits bits
+        """
+        if w < 0 or w.bit_length() > self.max_bits:
+            raise ValueError(
+                "Erreur: l'exposant doit avoir au plus {} bits".format(self.max_bits)
+            )
+        mult = self.mult
+        k = self.k
+        mask = self.mask
+        res = None
+        for ligne in self.table:
+            d = w & mask
+            if d:
+                res = ligne[d] if res is None else mult(res, ligne[d])
+            w = w >> k
+            if not w:
+                break
+        if res is None:
+            res = self.unite
+        if self.montgomery:
+            return mult(res, 1)
+        return res % self.pm.N
+
+
+class MontgomeryInt:
+    """Classe MontgomeryInt, entier modulo n conservé sous forme "tilde" (domaine de Montgomery):
+
+    - La conversion vers la forme "tilde" (multiplication par B^2) est faite une seule fois, à la création
+    - Les opérations restent dans le domaine de Montgomery, sans conversion:
+        + * : une multiplication de Montgomery (self.pm.mult)
+        + +, - : addition et soustraction modulo n (la forme "tilde" est linéaire)
+        + ** : la structure d'exponentiation de l'objet PowerMod (exposant négatif: inverse modulo n)
+    - La conversion inverse (multiplication de Montgomery par 1) n'est faite que par value()
+    - Les opérandes de type int sont convertis automatiquement
+    - Deux MontgomeryInt ne sont compatibles que s'ils ont le même contexte (domaine(): n, base, type, chiffres):
+        la forme "tilde" dépend de B, un mélange de contextes lève ValueError;
+        l'égalité entre deux MontgomeryInt exige le même contexte et la même valeur
+    - Un MontgomeryInt est égal à l'entier int égal à sa valeur (0 <= valeur < n), comme 5 == 5.0:
+        le hachage est donc celui de la valeur (hash(x) == hash(int(x))), ce qui permet de mélanger
+        MontgomeryInt et int comme clés d'un dictionnaire
+    - Fonctionne aussi avec la multiplication standard (B^2 = 1, aucune conversion)
+    - L'objet PowerMod est normalement obtenu du cache des contextes (PowerMod(op_type, n, base))
+
+    """
+
+    __slots__ = ("pm", "x")
+
+    def __init__(self, pm, a, tilde=False):
+        """Initialisation d'un entier sous forme "tilde"
+
+        Args:
+            pm (PowerMod): L'objet PowerMod qui définit n et la multiplication
+            a (long): La valeur de l'entier
+            tilde (bool): a est déjà sous forme "tilde" (et réduit modulo n)
+
+        Returns:
+            void: self.x contient la forme "tilde" de a mod(n)
+        """
+        self.pm = pm
+        self.x = a if tilde else pm.mult(a % pm.N, pm.B2)
+
+    def domaine(self):
+        """Retourne l'identification du contexte (la forme "tilde" n'a de sens que dans ce contexte)
+
+        Returns:
+            tuple: La clé du contexte (n, base, type, chiffres), voir ContexteCache.cle
+        """
+        pm = self.pm
+        return labo_config.ContexteCache.cle(pm.N, pm.base, pm.type, pm.chiffres)
+
+    def operande(self, autre):
+        """Retourne la forme "tilde" de l'autre opérande (converti s'il s'agit d'un int)
+
+        Args:
+            autre (MontgomeryInt ou long): L'autre opérande
+
+        Returns:
+            long: La forme "tilde" de l'opérande
+
+        Raises:
+            ValueError: Les deux opérandes n'ont pas le même contexte (modulo, base, type ou chiffres)
+        """
+        if isinstance(autre, MontgomeryInt):
+            if autre.pm is not self.pm and autre.domaine() != self.domaine():
+                raise ValueError(
+                    "Erreur: contextes différents ({} et {})".format(self.domaine(), autre.domaine())
+                )
+            return autre.x
+        return self.pm.mult(int(autre) % self.pm.N, self.pm.B2)
+
+    def value(self):
+        """Retourne la valeur de l'entier (conversion hors du domaine de Montgomery)
+
+        Returns:
+            long: La valeur, entre 0 et n - 1
+        """
+        return self.pm.mult(self.x, 1) % self.pm.N
+
+    def __mul__(self, autre):
+        return MontgomeryInt(self.pm, self.pm.mult(self.x, self.operande(autre)), True)
+
+    __rmul__ = __mul__
+
+    def __add__(self, autre):
+        return MontgomeryInt(self.pm, (self.x + self.operande(autre)) % self.pm.N, True)
+
+    __radd__ = __add__
+
+    def __sub__(self, autre):
+        return MontgomeryInt(self.pm, (self.x - self.operande(autre)) % self.pm.N, True)
+
+    def __rsub__(self, autre):
+        return MontgomeryInt(self.pm, (self.operande(autre) - self.x) % self.pm.N, True)
+
+    def __neg__(self):
+        return MontgomeryInt(self.pm, (-self.x) % self.pm.N, True)
+
+    def __pow__(self, w):
+        pm = self.pm
+        x = self.x
+        if w < 0:
+            x = pm.mult(pm.mult(Pgcd.inverse(x, pm.N), pm.B2), pm.B2)
+            w = -w
+        return MontgomeryInt(pm, pm.exposant_struct(x, w) % pm.N, True)
+
+    def __eq__(self, autre):
+        if isinstance(autre, MontgomeryInt):
+            return self.domaine() == autre.domaine() and self.x % self.pm.N == autre.x % autre.pm.N
+        if isinstance(autre, int):
+            return self.value() == autre
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.value())
+
+    def __int__(self):
+        return self.value()
+
+    def __repr__(self):
+        return "MontgomeryInt({}, n={})".format(self.value(), self.pm.N)
+
+
+class PowerModPool:
+    """Classe PowerModPool, mise à une puissance en parallèle sur plusieurs processus (ProcessPoolExecutor):
+
+    - Les calculs de Python sur les grands entiers gardent le GIL: seuls des processus distincts
+        permettent d'utiliser plusieurs coeurs
+    - Les tâches (a, w, n) sont regroupées par modulo n, puis découpées en paquets (chunk_size tâches):
+        + un seul envoi (pickle) par paquet plutôt que par tâche
+        + chaque paquet est calculé avec PowerMod.power_many (conversion Montgomery une seule fois par paquet)
+    - Contextes de Montgomery:
+        + chaque processus conserve ses contextes dans le cache LRU PowerModBase.contextes:
+            un modulo n'est initialisé qu'une seule fois par processus, jamais par tâche
+        + les contextes des modulos passés au constructeur (modules) sont calculés une seule fois
+            et envoyés à chaque processus au démarrage
+    - stats() retourne le débit (tâches/s) de chaque processus
+
+    """
+
+    CHUNK_SIZE = 64
+
+    def __init__(
+        self,
+        op_type=labo_config.PowerModBase.MULT_MONTGOMERY_REDC,
+        base=10,
+        exposant=labo_config.PowerModBase.EXPOSANT_BINAIRE,
+        max_workers=None,
+        chunk_size=CHUNK_SIZE,
+        modules=(),
+    ):
+        """Démarre les processus
+
+        Args:
+            op_type (int): Le type de calcul (voir PowerModBase)
+            base (long): La base de calcul (Montgomery par chiffre)
+            exposant (int): La structure de l'exponentiation (voir PowerModBase)
+            max_workers (int): Le nombre de processus (nombre de coeurs si None)
+            chunk_size (int): Le nombre de tâches par paquet
+            modules ([long]): Les modulos connus d'avance, dont le contexte est envoyé à chaque processus au démarrage
+
+        Returns:
+            void: Les processus sont prêts à recevoir des paquets
+        """
+        self.op_type = op_type
+        self.base = base
+        self.exposant = exposant
+        self.chunk_size = max(int(chunk_size), 1)
+        contextes = []
+        if op_type in PowerMod.TYPES_MONTGOMERY:
+            for n in modules:
+                pm = PowerMod(op_type, n, base, exposant)
+                cle = labo_config.ContexteCache.cle(n, base, op_type, pm.chiffres)
+                contextes.append((cle, pm.contexte_montgomery()))
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers, initializer=PowerModPool.worker_init, initargs=(contextes,)
+        )
+        self.debits = {}
+
+    @staticmethod
+    def worker_init(contextes):
+        """Initialisation d'un processus: les contextes reçus sont ajoutés au cache PowerModBase.contextes
+
+        Args:
+            contextes ([(tuple, ContexteMontgomery)]): Les couples (clé, contexte)
+
+        Returns:
+            void: Le cache du processus contient les contextes
+        """
+        for cle, contexte in contextes:
+            labo_config.PowerModBase.contextes.put(cle, contexte)
+
+    @staticmethod
+    def worker_power(op_type, base, exposant, n, bases, exponents):
+        """Calcul d'un paquet de tâches (même modulo n) dans un processus
+
+        Args:
+            op_type (int): Le type de calcul
+            base (long): La base de calcul
+            exposant (int): La structure de l'exponentiation
+            n (long): Le modulo commun au paquet
+            bases ([long]): Les nombres à élever à une puissance
+            exponents ([long]): Les puissances
+
+        Returns:
+            (int, [long], float): Le numéro du processus, les résultats et le temps de calcul
+        """
+        debut = timeit.default_timer()
+        res = PowerMod(op_type, n, base, exposant).power_many(bases, exponents)
+        return os.getpid(), res, timeit.default_timer() - debut
+
+    def power_many(self, jobs):
+        """Calcule a^w mod(n) pour chacune des tâches, en parallèle
+
+        Args:
+            jobs ([(long, long, long)]): Les tâches (a, w, n)
+
+        Returns:
+            [long]: Les résultats, dans l'ordre des tâches
+        """
+        groupes = {}
+        for i, (a, w, n) in enumerate(jobs):
+            groupes.setdefault(n, []).append((i, a, w))
+        paquets = []
+        for n, taches in groupes.items():
+            for debut in range(0, len(taches), self.chunk_size):
+                paquet = taches[debut : debut + self.chunk_size]
+                futur = self.executor.submit(
+                    PowerModPool.worker_power,
+                    self.op_type,
+                    self.base,
+                    self.exposant,
+                    n,
+                    [a for _, a, _ in paquet],
+                    [w for _, _, w in paquet],
+                )
+                paquets.append(([i for i, _, _ in paquet], futur))
+        res = [0] * sum(len(indices) for indices, _ in paquets)
+        for indices, futur in paquets:
+            pid, valeurs, temps = futur.result()
+            taches, total = self.debits.get(pid, (0, 0.0))
+            self.debits[pid] = (taches + len(indices), total + temps)
+            for i, valeur in zip(indices, valeurs):
+                res[i] = valeur
+        return res
+
+    def stats(self):
+        """Retourne le débit de chaque processus depuis sa création
+
+        Returns:
+            dict: Pour chaque processus (pid): tâches, temps (s) et débit (tâches/s)
+        """
+        return {
+            pid: {"taches": taches, "temps": temps, "debit": taches / temps if temps > 0 else 0.0}
+            for pid, (taches, temps) in self.debits.items()
+        }
+
+    def close(self):
+        """Arrête les processus
+
+        Returns:
+            void: L'objet ne peut plus être utilisé
+        """
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class AsyncPowerMod:
+    """Classe AsyncPowerMod, frontal asyncio qui regroupe les demandes de mise à une puissance (micro-lots):
+
+    - Chaque appel à power(a, w, n) est mis en file d'attente et retourne un futur (await)
+    - La file est vidée après fenetre secondes (à partir de la première demande en attente),
+        ou dès que max_lot demandes sont en attente
+    - Les demandes d'un lot sont regroupées par modulo n, et chaque groupe est calculé par
+        PowerModPool.worker_power (PowerMod.power_many, contexte de Montgomery partagé par le cache)
+        dans un exécuteur (executor): fils d'exécution par défaut, ou un ProcessPoolExecutor
+    - metrics() donne la profondeur de la file, la taille des lots et les latences (moyenne et p99),
+        pour ajuster le compromis latence/débit (fenetre et max_lot)
+
+    """
+
+    FENETRE = 0.002
+    MAX_LOT = 256
+    HISTORIQUE = 10000
+
+    def __init__(
+        self,
+        op_type=labo_config.PowerModBase.MULT_MONTGOMERY_REDC,
+        base=10,
+        exposant=labo_config.PowerModBase.EXPOSANT_BINAIRE,
+        fenetre=FENETRE,
+        max_lot=MAX_LOT,
+        executor=None,
+    ):
+        """Initialisation du frontal
+
+        Args:
+            op_type (int): Le type de calcul (voir PowerModBase)
+            base (long): La base de calcul (Montgomery par chiffre)
+            exposant (int): La structure de l'exponentiation (voir PowerModBase)
+            fenetre (float): Le délai maximal (en secondes) d'accumulation d'un lot
+            max_lot (int): Le nombre de demandes qui déclenche le calcul d'un lot sans attendre
+            executor (concurrent.futures.Executor): L'exécuteur (exécuteur par défaut de la boucle si None)
+
+        Returns:
+            void: Le frontal est prêt à recevoir des demandes
+        """
+        self.op_type = op_type
+        self.base = base
+        self.exposant = exposant
+        self.fenetre = fenetre
+        self.max_lot = max(int(max_lot), 1)
+        self.executor = executor
+        self.attente = []
+        self.minuterie = None
+        self.taches = set()
+        self.latences = collections.deque(maxlen=self.HISTORIQUE)
+        self.lots = collections.deque(maxlen=self.HISTORIQUE)
+
+    async def power(self, a, w, n):
+        """Demande le calcul de a^w mod(n)
+
+        Args:
+            a (long): Le nombre à élever à une puissance
+            w (long): La puissance
+            n (long): Le modulo
+
+        Returns:
+            long: La valeur de a^w mod(n)
+        """
+        loop = asyncio.get_running_loop()
+        futur = loop.create_future()
+        self.attente.append((a, w, n, futur, timeit.default_timer()))
+        if len(self.attente) >= self.max_lot:
+            self.vider()
+        elif self.minuterie is None:
+            self.minuterie = loop.call_later(self.fenetre, self.vider)
+        return await futur
+
+    def vider(self):
+        """Envoie toutes les demandes en attente au calcul, un groupe par modulo
+
+        Returns:
+            void: Une tâche asyncio est créée pour chaque groupe
+        """
+        if self.minuterie is not None:
+            self.minuterie.cancel()
+            self.minuterie = None
+        lot, self.attente = self.attente, []
+        if not lot:
+            return
+        self.lots.append(len(lot))
+        groupes = {}
+        for demande in lot:
+            groupes.setdefault(demande[2], []).append(demande)
+        for n, demandes in groupes.items():
+            tache = asyncio.ensure_future(self.calculer(n, demandes))
+            self.taches.add(tache)
+            tache.add_done_callback(self.taches.discard)
+
+    async def calculer(self, n, demandes):
+        """Calcule un groupe de demandes (même modulo) dans l'exécuteur, puis résout les futurs
+
+        Args:
+            n (long): Le modulo commun au groupe
+            demandes ([tuple]): Les demandes (a, w, n, futur, début)
+
+        Returns:
+            void: Chaque futur reçoit son résultat (ou l'exception levée par le calcul)
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            _, valeurs, _ = await loop.run_in_executor(
+                self.executor,
+                PowerModPool.worker_power,
+                self.op_type,
+                self.base,
+                self.exposant,
+                n,
+                [demande[0] for demande in demandes],
+                [demande[1] for demande in demandes],
+            )
+        except Exception as erreur:
+            for demande in demandes:
+                if not demande[3].done():
+                    demande[3].set_exception(erreur)
+            return
+        fin = timeit.default_timer()
+        for demande, valeur in zip(demandes, valeurs):
+            self.latences.append(fin - demande[4])
+            if not demande[3].done():
+                demande[3].set_result(valeur)
+
+    def metrics(self):
+        """Retourne les mesures du frontal (sur les HISTORIQUE derniers lots et demandes)
+
+        Returns:
+            dict: profondeur_file, groupes_en_cours, lots, taille_lot_moyenne, taille_lot_max,
+                latence_moyenne et latence_p99 (en secondes)
+        """
+        latences = sorted(self.latences)
+        return {
+            "profondeur_file": len(self.attente),
+            "groupes_en_cours": len(self.taches),
+            "lots": len(self.lots),
+            "taille_lot_moyenne": sum(self.lots) / len(self.lots) if self.lots else 0.0,
+            "taille_lot_max": max(self.lots, default=0),
+            "latence_moyenne": sum(latences) / len(latences) if latences else 0.0,
+            "latence_p99": latences[min(len(latences) - 1, int(0.99 * len(latences)))] if latences else 0.0,
+        }
+
+    async def close(self):
+        """Calcule les demandes en attente et attend la fin de tous les groupes en cours
+
+        Returns:
+            void: Toutes les demandes reçues sont résolues
+        """
+        self.vider()
+        if self.taches:
+            await asyncio.gather(*self.taches, return_exceptions=True)
+
+
+class Primalite:
+    """Classe Primalite, tests de primalité basés sur PowerMod:
+
+    - Division d'essai: un seul pgcd (Pgcd.pgcd_lehmer) avec la primorielle des nombres premiers
+        plus petits que PREMIERS_SEUIL (calculée une seule fois)
+    - Miller-Rabin: toutes les rondes d'un même candidat partagent un seul contexte de Montgomery (REDC),
+        et restent dans le domaine de Montgomery (1 "tilde" et -1 "tilde" sont comparés directement)
+    - n < 2^64: Miller-Rabin avec les témoins déterministes TEMOINS_64 (aucune erreur possible)
+    - n >= 2^64: BPSW, soit Miller-Rabin en base 2 et le test de Lucas fort (paramètres de Selfridge),
+        plus des rondes de Miller-Rabin supplémentaires (témoins aléatoires) si demandé
+    - is_prime_many: test d'un lot de candidats
+
+    """
+
+    PREMIERS_SEUIL = 1000
+    TEMOINS_64 = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+    petits_premiers = ()
+    primorielle = 1
+
+    @staticmethod
+    def crible(limite):
+        """Crible d'Ératosthène
+
+        Args:
+            limite (int): La borne supérieure (exclue)
+
+        Returns:
+            (int, ...): Les nombres premiers plus petits que limite
+        """
+        crible = numpy.ones(max(limite, 2), dtype=bool)
+        crible[:2] = False
+        for p in range(2, math.isqrt(limite - 1) + 1 if limite > 1 else 2):
+            if crible[p]:
+                crible[p * p :: p] = False
+        return tuple(int(p) for p in numpy.flatnonzero(crible))
+
+    @classmethod
+    def init_primorielle(cls):
+        """Calcule (une seule fois) les nombres premiers plus petits que PREMIERS_SEUIL (crible) et leur produit
+
+        Returns:
+            void: Les champs de classe petits_premiers et primorielle sont calculés
+        """
+        if cls.petits_premiers:
+            return
+        cls.petits_premiers = cls.crible(cls.PREMIERS_SEUIL)
+        primorielle = 1
+        for p in cls.petits_premiers:
+            primorielle *= p
+        cls.primorielle = primorielle
+
+    @classmethod
+    def division_essai(cls, n):
+        """Division d'essai par tous les nombres premiers plus petits que PREMIERS_SEUIL, en un seul pgcd
+
+        Args:
+            n (long): Le candidat (n >= 2)
+
+        Returns:
+            bool: Vrai si n n'a aucun petit facteur premier (ou s'il est lui-même un petit nombre premier)
+        """
+        cls.init_primorielle()
+        if n < cls.PREMIERS_SEUIL:
+            return n in cls.petits_premiers
+        return Pgcd.pgcd_lehmer(cls.primorielle, n) == 1
+
+    @staticmethod
+    def miller_rabin(n, temoins, pm=None):
+        """Rondes de Miller-Rabin, toutes avec le même contexte de Montgomery:
+
+            - n - 1 = d * 2^s, avec d impair
+            - Pour chaque témoin a: x = a^d (forme "tilde"), puis s - 1 mises au carré au plus
+            - n est composé si x ne vaut jamais 1 (d'abord) ou -1
+
+        Args:
+            n (long): Le candidat (impair, n > 2)
+            temoins ([long]): Les témoins
+            pm (PowerMod): Le contexte de Montgomery de n (créé s'il n'est pas fourni)
+
+        Returns:
+            bool: Faux si n est composé, Vrai s'il est probablement premier
+        """
+        if pm is None:
+            pm = PowerMod(PowerMod.MULT_MONTGOMERY_REDC, n, exposant=PowerMod.EXPOSANT_FENETRE, cache=False)
+        d = n - 1
+        s = (d & -d).bit_length() - 1
+        d = d >> s
+        un = pm.unite
+        moins_un = n - un
+        for a in temoins:
+            a = a % n
+            if a == 0 or a == 1 or a == n - 1:
+                continue
+            x = pm.exposant_struct(pm.mult(a, pm.B2), d)
+            if x == un or x == moins_un:
+                continue
+            for _ in range(s - 1):
+                x = pm.mult(x, x)
+                if x == moins_un:
+                    break
+            else:
+                return False
+        return True
+
+    @staticmethod
+    def jacobi(a, n):
+        """Symbole de Jacobi (a / n), pour n impair positif
+
+        Args:
+            a (long): Le numérateur
+            n (long): Le dénominateur (impair, positif)
+
+        Returns:
+            int: -1, 0 ou 1
+        """
+        a = a % n
+        res = 1
+        while a:
+            while not a & 1:
+                a = a >> 1
+                if n & 7 in (3, 5):
+                    res = -res
+            a, n = n, a
+            if a & 3 == 3 and n & 3 == 3:
+                res = -res
+            a = a % n
+        return res if n == 1 else 0
+
+    @classmethod
+    def lucas_fort(cls, n):
+        """Test de Lucas fort (paramètres de Selfridge, méthode A), deuxième moitié de BPSW:
+
+            - D est le premier de 5, -7, 9, -11, ... tel que (D / n) = -1; P = 1 et Q = (1 - D) / 4
+            - n + 1 = d * 2^s, avec d impair
+            - n est probablement premier si U_d = 0 ou si V_(d * 2^r) = 0 pour un r < s
+            - Les carrés parfaits sont rejetés (aucun D ne conviendrait)
+
+        Args:
+            n (long): Le candidat (impair, sans petit facteur)
+
+        Returns:
+            bool: Faux si n est composé, Vrai s'il est probablement premier
+        """
+        if math.isqrt(n) ** 2 == n:
+            return False
+        D = 5
+        while True:
+            j = cls.jacobi(D, n)
+            if j == -1:
+                break
+            if j == 0 and abs(D) != n:
+                return False
+            D = -D - 2 if D > 0 else -D + 2
+        P = 1
+        Q = (1 - D) // 4
+        d = n + 1
+        s = (d & -d).bit_length() - 1
+        d = d >> s
+
+        U = 1
+        V = P
+        Qk = Q % n
+        for bit in bin(d)[3:]:
+            U = U * V % n
+            V = (V * V - 2 * Qk) % n
+            Qk = Qk * Qk % n
+            if bit == "1":
+                U, V = P * U + V, D * U + P * V
+                if U & 1:
+                    U = U + n
+                if V & 1:
+                    V = V + n
+                U = (U >> 1) % n
+                V = (V >> 1) % n
+                Qk = Qk * Q % n
+        if U == 0 or V == 0:
+            return True
+        for _ in range(s - 1):
+            V = (V * V - 2 * Qk) % n
+            Qk = Qk * Qk % n
+            if V == 0:
+                return True
+        return False
+
+    @classmethod
+    def is_prime(cls, n, rondes=0):
+        """Test de primalité:
+
+            - Division d'essai (primorielle), puis n < PREMIERS_SEUIL^2 est premier s'il n'a aucun petit facteur
+            - n < 2^64: Miller-Rabin avec les témoins déterministes TEMOINS_64
+            - Sinon BPSW (Miller-Rabin en base 2 et Lucas fort), plus rondes témoins aléatoires
+
+        Args:
+            n (long): Le candidat
+            rondes (int): Le nombre de rondes de Miller-Rabin supplémentaires (n >= 2^64)
+
+        Returns:
+            bool: Vrai si n est premier (probablement premier pour n >= 2^64)
+        """
+        n = int(n)
+        if n < 2:
+            return False
+        if not cls.division_essai(n):
+            return False
+        if n < cls.PREMIERS_SEUIL * cls.PREMIERS_SEUIL:
+            return True
+        pm = PowerMod(PowerMod.MULT_MONTGOMERY_REDC, n, exposant=PowerMod.EXPOSANT_FENETRE, cache=False)
+        if n < 1 << 64:
+            return cls.miller_rabin(n, cls.TEMOINS_64, pm)
+        if not cls.miller_rabin(n, (2,), pm):
+            return False
+        if not cls.lucas_fort(n):
+            return False
+        if rondes:
+            gen = random.SystemRandom()
+            return cls.miller_rabin(n, [gen.randrange(2, n - 1) for _ in range(rondes)], pm)
+        return True
+
+    @classmethod
+    def is_prime_many(cls, candidats, rondes=0, as_array=False):
+        """Test de primalité d'un lot de candidats (voir is_prime)
+
+        Args:
+            candidats ([long]): Les candidats (liste, tuple ou tableau numpy)
+            rondes (int): Le nombre de rondes de Miller-Rabin supplémentaires (n >= 2^64)
+            as_array (bool): Retourne un tableau numpy de booléens plutôt qu'une liste
+
+        Returns:
+            [bool]: Le résultat du test pour chaque candidat, dans l'ordre
+        """
+        res = [cls.is_prime(n, rondes) for n in candidats]
+        if as_array:
+            return numpy.array(res, dtype=bool)
+        return res
+
+
+class GenerateurPremiers:
+    """Classe GenerateurPremiers, génération de nombres premiers (et de clés RSA) par crible incrémental:
+
+    - Une fenêtre de candidats impairs x0, x0 + 2, ..., x0 + 2 * (fenetre - 1) est criblée
+        par tous les nombres premiers impairs plus petits que crible_seuil:
+        + les restes x0 mod(p) sont conservés dans un tableau numpy (table des résidus)
+        + pour chaque p, les candidats divisibles par p sont marqués d'un seul coup (tranche numpy de pas p)
+    - Pour passer à la fenêtre suivante, les restes sont mis à jour (r = (r + 2 * fenetre) mod(p)),
+        sans aucune division de grand entier
+    - Seuls les survivants du crible sont testés (Primalite.is_prime, basé sur PowerMod)
+    - Les deux bits de poids fort sont à 1: le produit de deux nombres premiers de b bits a exactement 2b bits
+    - Clés RSA: p et q viennent de deux points de départ indépendants, |p - q| >= 2^(b - ECART_BITS)
+    - premiers() et cles_rsa() produisent un flux (générateur Python); premiers_paralleles()
+        et cles_rsa_paralleles() répartissent le travail (une recherche par tâche) sur plusieurs processus
+
+    """
+
+    FENETRE = 4096
+    CRIBLE_SEUIL = 1 << 16
+    ECART_BITS = 100
+
+    def __init__(self, bits, fenetre=FENETRE, crible_seuil=CRIBLE_SEUIL):
+        """Initialisation du générateur
+
+        Args:
+            bits (int): Le nombre de bits des nombres premiers (bits >= 3)
+            fenetre (int): Le nombre de candidats impairs par fenêtre
+            crible_seuil (int): Les nombres premiers du crible sont plus petits que crible_seuil
+
+        Returns:
+            void: La table des nombres premiers du crible est prête
+        """
+        self.bits = int(bits)
+        self.fenetre = max(int(fenetre), 1)
+        premiers = numpy.array(Primalite.crible(crible_seuil)[1:], dtype=numpy.int64)
+        self.table_premiers = premiers[premiers < (1 << (self.bits - 2))]
+        self.inverses2 = (self.table_premiers + 1) // 2
+        self.hasard = random.SystemRandom()
+        self.criblages = 0
+        self.tests = 0
+
+    def depart(self):
+        """Choisit un premier candidat au hasard (impair, deux bits de poids fort à 1)
+
+        Returns:
+            long: Le premier candidat
+        """
+        return self.hasard.getrandbits(self.bits) | (3 << (self.bits - 2)) | 1
+
+    def survivants(self, restes):
+        """Crible une fenêtre à partir de la table des résidus
+
+        Args:
+            restes (numpy.ndarray): x0 mod(p) pour chaque nombre premier p du crible
+
+        Returns:
+            numpy.ndarray: Les indices i des candidats x0 + 2i qui n'ont aucun facteur dans le crible
+        """
+        compose = numpy.zeros(self.fenetre, dtype=bool)
+        debuts = ((self.table_premiers - restes) * self.inverses2) % self.table_premiers
+        for p, debut in zip(self.table_premiers.tolist(), debuts.tolist()):
+            compose[debut::p] = True
+        self.criblages += 1
+        return numpy.flatnonzero(~compose)
+
+    def premiers(self):
+        """Flux de nombres premiers de self.bits bits
+
+        Returns:
+            generator: Chaque itération retourne un nouveau nombre premier
+        """
+        while True:
+            x0 = self.depart()
+            restes = numpy.array([x0 % p for p in self.table_premiers.tolist()], dtype=numpy.int64)
+            while x0.bit_length() == self.bits:
+                for i in self.survivants(restes).tolist():
+                    candidat = x0 + 2 * i
+                    if candidat.bit_length() != self.bits:
+                        break
+                    self.tests += 1
+                    if Primalite.is_prime(candidat):
+                        yield candidat
+                x0 = x0 + 2 * self.fenetre
+                restes = (restes + 2 * self.fenetre) % self.table_premiers
+
+    def premier(self):
+        """Retourne un seul nombre premier de self.bits bits
+
+        Returns:
+            long: Le nombre premier
+        """
+        return next(self.premiers())
+
+    def premier_rsa(self, e):
+        """Retourne un nombre premier p de self.bits bits tel que pgcd(e, p - 1) = 1
+
+            - Chaque appel part d'un nouveau point de départ aléatoire (nouveau flux premiers())
+
+        Args:
+            e (long): L'exposant public
+
+        Returns:
+            long: Le nombre premier
+        """
+        return next(p for p in self.premiers() if Pgcd.pgcd_lehmer(e, p - 1) == 1)
+
+    @staticmethod
+    def cle_rsa(bits, e=65537, fenetre=FENETRE):
+        """Génère une paire de clés RSA:
+
+            - p et q sont cherchés chacun à partir de son propre point de départ aléatoire (depart()):
+                deux nombres premiers consécutifs d'un même flux seraient trop proches (méthode de Fermat)
+            - Une paire est rejetée si |p - q| < 2^(bits / 2 - ECART_BITS)
+
+        Args:
+            bits (int): Le nombre de bits du modulo n = p * q (pair, au moins 16)
+            e (long): L'exposant public
+            fenetre (int): Le nombre de candidats impairs par fenêtre du crible
+
+        Returns:
+            (long, long, long, long, long): n, e, d, p, q (d = e^-1 mod ppcm(p - 1, q - 1))
+        """
+        generateur = GenerateurPremiers(bits // 2, fenetre)
+        ecart = 1 << max(bits // 2 - GenerateurPremiers.ECART_BITS, 0)
+        p = generateur.premier_rsa(e)
+        q = generateur.premier_rsa(e)
+        while abs(p - q) < ecart:
+            q = generateur.premier_rsa(e)
+        lambda_n = (p - 1) // Pgcd.pgcd_lehmer(p - 1, q - 1) * (q - 1)
+        return p * q, e, Pgcd.inverse(e, lambda_n), p, q
+
+    def cles_rsa(self, e=65537):
+        """Flux de paires de clés RSA dont le modulo a 2 * self.bits bits
+
+        Args:
+            e (long): L'exposant public
+
+        Returns:
+            generator: Chaque itération retourne (n, e, d, p, q)
+        """
+        while True:
+            yield self.cle_rsa(2 * self.bits, e, self.fenetre)
+
+    @staticmethod
+    def worker_premier(bits, fenetre):
+        """Recherche d'un nombre premier dans un processus
+
+        Args:
+            bits (int): Le nombre de bits
+            fenetre (int): Le nombre de candidats impairs par fenêtre
+
+        Returns:
+            long: Le nombre premier
+        """
+        return GenerateurPremiers(bits, fenetre).premier()
+
+    def premiers_paralleles(self, nombre, max_workers=None):
+        """Flux de nombre nombres premiers, chacun cherché dans sa propre fenêtre par un processus distinct
+
+        Args:
+            nombre (int): Le nombre de nombres premiers à produire
+            max_workers (int): Le nombre de processus (nombre de coeurs si None)
+
+        Returns:
+            generator: Les nombres premiers, dans l'ordre où ils sont trouvés
+        """
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            futurs = [
+                executor.submit(GenerateurPremiers.worker_premier, self.bits, self.fenetre)
+                for _ in range(nombre)
+            ]
+            for futur in concurrent.futures.as_completed(futurs):
+                yield futur.result()
+
+    def cles_rsa_paralleles(self, nombre, e=65537, max_workers=None):
+        """Flux de nombre paires de clés RSA (modulo de 2 * self.bits bits), générées en parallèle
+
+        Args:
+            nombre (int): Le nombre de paires de clés
+            e (long): L'exposant public
+            max_workers (int): Le nombre de processus (nombre de coeurs si None)
+
+        Returns:
+            generator: Les paires de clés (n, e, d, p, q), dans l'ordre où elles sont trouvées
+        """
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            futurs = [
+                executor.submit(GenerateurPremiers.cle_rsa, 2 * self.bits, e, self.fenetre)
+                for _ in range(nombre)
+            ]
+            for futur in concurrent.futures.as_completed(futurs):
+                yield futur.result()
+
+
+class Factorisation:
+    """Classe Factorisation, factorisation par la méthode rho de Pollard (variante de Brent):
+
+    - Itération x <- x^2 + c sous forme "tilde" (multiplication de Montgomery REDC, aucune division)
+    - Les différences |x - y| sont accumulées par produit (sous forme "tilde") sur un bloc de bloc itérations:
+        un seul appel à self.pgcd par bloc
+    - Si le pgcd d'un bloc vaut n (plusieurs facteurs trouvés dans le même bloc), le bloc est repris
+        une itération à la fois à partir de son début (retour en arrière)
+    - En cas d'échec (pgcd = n après le retour en arrière), une autre constante c est essayée
+    - factorise(n): division d'essai (petits nombres premiers), test de primalité (Primalite), puis rho
+        récursivement sur les facteurs composés; factorise_many(nombres) pour un lot
+    - Aucune deuxième phase (ECM ou autre) n'est incluse: facteur() est le point d'extension prévu
+
+    """
+
+    BLOC = 128
+    MAX_ITERATIONS = 1 << 30
+
+    def __init__(self, pgcd_type=labo_config.PgcdBase.PGCD_EUCLIDE, bloc=BLOC, max_iterations=MAX_ITERATIONS):
+        """Initialisation du factoriseur
+
+        Args:
+            pgcd_type (int): Le type de calcul du pgcd (voir PgcdBase)
+            bloc (int): Le nombre d'itérations par pgcd
+            max_iterations (int): Le nombre maximal d'itérations pour une constante c
+
+        Returns:
+            void: L'objet est prêt
+        """
+        self.pgcd = Pgcd(pgcd_type).pgcd
+        self.bloc = max(int(bloc), 1)
+        self.max_iterations = max_iterations
+        self.hasard = random.Random()
+        self.iterations = 0
+        self.pgcds = 0
+
+    def rho_brent(self, n, c, y):
+        """Méthode rho de Pollard, variante de Brent, pour n impair composé:
+
+            - f(x) = x^2 + c (sous forme "tilde"), y est le point de départ
+            - Le cycle est détecté en comparant x (fixé aux puissances de 2) aux itérés suivants y
+            - q accumule le produit des |x - y| (forme "tilde": le facteur B^-k ne change pas le pgcd,
+                puisque B est premier avec n)
+            - La réduction REDC (voir PowerMod.mult_montgomery_redc) est écrite directement dans la boucle:
+                c'est la boucle critique, et l'appel de méthode y coûterait plus cher que la réduction
+
+        Args:
+            n (long): Le nombre à factoriser (impair, composé)
+            c (long): La constante de l'itération (0 < c < n)
+            y (long): Le point de départ (0 <= y < n)
+
+        Returns:
+            long: Un facteur de n (n en cas d'échec)
+        """
+        pm = PowerMod(PowerMod.MULT_MONTGOMERY_REDC, n, cache=False)
+        mult = pm.mult
+        n_prime = pm.n_prime
+        mask = pm.redc_mask
+        bits = pm.redc_bits
+        g = 1
+        r = 1
+        q = pm.unite
+        x = ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = mult(y, y) + c
+                if y >= n:
+                    y = y - n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(self.bloc, r - k)):
+                    t = y * y
+                    y = ((t + ((t & mask) * n_prime & mask) * n) >> bits) + c
+                    if y >= n:
+                        y = y - n
+                        if y >= n:
+                            y = y - n
+                    t = q * (x - y if x > y else y - x)
+                    q = (t + ((t & mask) * n_prime & mask) * n) >> bits
+                g = self.pgcd(q, n)
+                self.pgcds += 1
+                k += self.bloc
+            self.iterations += r
+            r = r << 1
+            if r > self.max_iterations:
+                return n
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = mult(ys, ys) + c
+                if ys >= n:
+                    ys = ys - n
+                g = self.pgcd(x - ys if x > ys else ys - x, n)
+                self.pgcds += 1
+        return g
+
+    def facteur(self, n):
+        """Trouve un facteur non trivial d'un nombre impair composé (rho, avec plusieurs constantes au besoin)
+
+        Args:
+            n (long): Le nombre à factoriser (impair, composé)
+
+        Returns:
+            long: Un facteur d de n, 1 < d < n (ou n si aucune constante n'a réussi)
+        """
+        for _ in range(32):
+            d = self.rho_brent(n, self.hasard.randrange(1, n - 1), self.hasard.randrange(0, n))
+            if 1 < d < n:
+                return d
+        return n
+
+    def factorise(self, n):
+        """Décomposition d'un nombre en facteurs premiers
+
+        Args:
+            n (long): Le nombre à factoriser (n >= 1)
+
+        Returns:
+            [long]: Les facteurs premiers, en ordre croissant, répétés selon leur multiplicité
+
+        Raises:
+            ValueError: Un facteur n'a pas pu être séparé
+        """
+        n = int(n)
+        facteurs = []
+        Primalite.init_primorielle()
+        for p in Primalite.petits_premiers:
+            if p * p > n:
+                break
+            while n % p == 0:
+                facteurs.append(p)
+                n = n // p
+        a_faire = [n] if n > 1 else []
+        while a_faire:
+            m = a_faire.pop()
+            if Primalite.is_prime(m):
+                facteurs.append(m)
+                continue
+            r = math.isqrt(m)
+            d = r if r * r == m else self.facteur(m)
+            if d == m:
+                raise ValueError("Erreur: impossible de factoriser {}".format(m))
+            a_faire.extend((d, m // d))
+        return sorted(facteurs)
+
+    def factorise_many(self, nombres):
+        """Décomposition d'un lot de nombres en facteurs premiers (voir factorise)
+
+        Args:
+            nombres ([long]): Les nombres à factoriser
+
+        Returns:
+            [[long]]: Les facteurs premiers de chacun des nombres, dans l'ordre
+        """
+        return [self.factorise(n) for n in nombres]
+
+
+class LogDiscret:
+    """Classe LogDiscret, logarithme discret modulo n: trouver x tel que g^x = h mod(n):
+
+    - Pas de bébé, pas de géant (bsgs):
+        + les pas de bébé g^j sont conservés dans une table de hachage à adressage ouvert (tableaux numpy):
+            empreinte de 64 bits du résidu (uint64) et indice j (int64), 16 octets par entrée
+        + chaque correspondance d'empreinte est vérifiée (PowerMod.power) avant d'être retournée
+    - Rho de Pollard (rho), pour un sous-groupe d'ordre premier q:
+        + marche aléatoire à RHO_PARTITIONS multiplicateurs g^a * h^b, sous forme "tilde"
+        + seuls les points distingués (empreinte dont les bits faibles sont nuls) sont conservés,
+            au plus max_points (la table est vidée si elle est pleine): la mémoire est bornée
+        + au plus RHO_MAX_PAS * racine(q) pas (environ 1.25 * racine(q) sont attendus)
+        + la marche continue après chaque point distingué; elle est recommencée d'un nouveau point de départ
+            si elle reste trop longtemps sans point distingué (cycle sans point distingué)
+    - Pohlig-Hellman (log): l'ordre de g est factorisé (Factorisation, ou facteurs_ordre),
+        le logarithme est calculé chiffre par chiffre dans chaque sous-groupe d'ordre p^e
+        (bsgs si p < BSGS_SEUIL, rho sinon), puis recombiné (restes chinois, Garner)
+    - Toutes les multiplications de groupe utilisent le même contexte PowerMod (Montgomery REDC par défaut)
+    - stats() donne le nombre de pas (multiplications de groupe), les pas par seconde et la mémoire maximale utilisée
+
+    """
+
+    BSGS_SEUIL = 1 << 32
+    MAX_POINTS = 1 << 16
+    RHO_PARTITIONS = 20
+    RHO_MAX_PAS = 32
+    MASQUE64 = (1 << 64) - 1
+    DORE64 = 0x9E3779B97F4A7C15
+
+    def __init__(
+        self,
+        n,
+        g,
+        ordre=None,
+        facteurs_ordre=None,
+        op_type=labo_config.PowerModBase.MULT_MONTGOMERY_REDC,
+        max_points=MAX_POINTS,
+    ):
+        """Initialisation du calcul des logarithmes en base g modulo n
+
+        Args:
+            n (long): Le modulo
+            g (long): La base des logarithmes
+            ordre (long): Un multiple de l'ordre de g (n - 1 par défaut, si n est premier)
+            facteurs_ordre ([long]): Les facteurs premiers de ordre (calculés par Factorisation si None)
+            op_type (int): Le type de multiplication (voir PowerModBase)
+            max_points (int): Le nombre maximal de points distingués conservés par rho
+
+        Returns:
+            void: L'objet est prêt
+
+        Raises:
+            ValueError: L'ordre n'est pas fourni et n n'est pas premier
+        """
+        self.N = n
+        self.g = g % n
+        if ordre is None:
+            if not Primalite.is_prime(n):
+                raise ValueError("Erreur: l'ordre de g doit être fourni si n n'est pas premier")
+            ordre = n - 1
+        self.ordre = ordre
+        self.facteurs_ordre = facteurs_ordre
+        self.max_points = max(int(max_points), 1)
+        self.pm = PowerMod(op_type, n)
+        self.hasard = random.Random()
+        self.pas = 0
+        self.temps = 0.0
+        self.memoire = 0
+
+    def tilde(self, a):
+        """Forme "tilde" (domaine de Montgomery) de a mod(n)"""
+        return self.pm.mult(a % self.N, self.pm.B2)
+
+    def empreinte(self, x):
+        """Empreinte de 64 bits d'un résidu (sous forme "tilde")"""
+        return (x ^ (x >> 64)) & self.MASQUE64
+
+    def bsgs(self, g, h, ordre):
+        """Pas de bébé, pas de géant: x tel que g^x = h mod(n), 0 <= x < ordre
+
+            - m = plafond(racine(ordre)); pas de bébé g^j (0 <= j < m) dans la table d'empreintes
+            - pas de géant h * g^(-m*i) (0 <= i <= m), recherchés dans la table
+            - Table à adressage ouvert (sondage linéaire), de taille puissance de 2 au moins égale à 2m
+
+        Args:
+            g (long): La base
+            h (long): Le nombre dont on cherche le logarithme
+            ordre (long): Un multiple de l'ordre de g
+
+        Returns:
+            long: Le logarithme x (None si h n'est pas une puissance de g)
+        """
+        debut = timeit.default_timer()
+        mult = self.pm.mult
+        g = g % self.N
+        h = h % self.N
+        m = math.isqrt(ordre - 1) + 1 if ordre > 1 else 1
+        log_taille = max(4, (2 * m).bit_length())
+        decalage = 64 - log_taille
+        cles = numpy.zeros(1 << log_taille, dtype=numpy.uint64)
+        valeurs = numpy.full(1 << log_taille, -1, dtype=numpy.int64)
+        masque = (1 << log_taille) - 1
+        self.memoire = max(self.memoire, cles.nbytes + valeurs.nbytes)
+
+        g_t = self.tilde(g)
+        h_t = self.tilde(h)
+        e = self.pm.unite
+        for j in range(m):
+            if e == h_t:
+                self.pas += j
+                self.temps += timeit.default_timer() - debut
+                return j
+            fp = self.empreinte(e)
+            case = ((fp * self.DORE64) & self.MASQUE64) >> decalage
+            while valeurs[case] != -1:
+                case = (case + 1) & masque
+            cles[case] = fp
+            valeurs[case] = j
+            e = mult(e, g_t)
+
+        facteur = self.tilde(self.pm.power(Pgcd.inverse(g, self.N), m))
+        gamma = h_t
+        res = None
+        for i in range(m + 1):
+            fp = self.empreinte(gamma)
+            case = ((fp * self.DORE64) & self.MASQUE64) >> decalage
+            while valeurs[case] != -1:
+                if int(cles[case]) == fp:
+                    x = i * m + int(valeurs[case])
+                    if self.pm.power(g, x) == h and (res is None or x < res):
+                        res = x
+                case = (case + 1) & masque
+            if res is not None:
+                break
+            gamma = mult(gamma, facteur)
+        self.pas += m + i
+        self.temps += timeit.default_timer() - debut
+        return res
+
+    def rho(self, g, h, q):
+        """Rho de Pollard pour le logarithme discret dans un sous-groupe d'ordre premier q (points distingués)
+
+            - Chaque point est x = g^a * h^b; la marche multiplie x par M_k = g^a_k * h^b_k,
+                k choisi selon les bits faibles de x (RHO_PARTITIONS multiplicateurs)
+            - Deux représentations d'un même point donnent a1 + x * b1 = a2 + x * b2 mod(q)
+            - Le nombre de bits nuls d'un point distingué est choisi pour garder environ max_points / 4 points
+
+        Args:
+            g (long): La base (d'ordre q)
+            h (long): Le nombre dont on cherche le logarithme
+            q (long): L'ordre (premier) de g
+
+        Returns:
+            long: Le logarithme x (None si h n'est pas une puissance de g)
+        """
+        debut = timeit.default_timer()
+        mult = self.pm.mult
+        g = g % self.N
+        h = h % self.N
+        if h == 1:
+            return 0
+        longueur = math.isqrt(q) + 1
+        d_bits = max(0, longueur.bit_length() - max(1, self.max_points // 4).bit_length())
+        d_masque = (1 << d_bits) - 1
+        limite = 20 << d_bits
+        partitions = self.RHO_PARTITIONS
+        multiplicateurs = []
+        for _ in range(partitions):
+            a = self.hasard.randrange(q)
+            b = self.hasard.randrange(q)
+            multiplicateurs.append((mult(self.tilde(self.pm.power(g, a)), self.tilde(self.pm.power(h, b))), a, b))
+        points = {}
+        pas_max = self.pas + self.RHO_MAX_PAS * longueur + 1024
+        while True:
+            a = self.hasard.randrange(q)
+            b = self.hasard.randrange(q)
+            x = mult(self.tilde(self.pm.power(g, a)), self.tilde(self.pm.power(h, b)))
+            depuis = 0
+            while depuis < limite:
+                fp = self.empreinte(x)
+                if not fp & d_masque:
+                    connu = points.get(fp)
+                    if connu is not None and connu[1] != b:
+                        log = (connu[0] - a) * Pgcd.inverse((b - connu[1]) % q, q) % q
+                        if self.pm.power(g, log) == h:
+                            self.temps += timeit.default_timer() - debut
+                            return log
+                    if len(points) >= self.max_points:
+                        points.clear()
+                    points[fp] = (a, b)
+                    self.memoire = max(self.memoire, sys.getsizeof(points) + len(points) * 120)
+                    depuis = 0
+                m_t, m_a, m_b = multiplicateurs[fp % partitions]
+                x = mult(x, m_t)
+                a = a + m_a
+                if a >= q:
+                    a = a - q
+                b = b + m_b
+                if b >= q:
+                    b = b - q
+                depuis = depuis + 1
+                self.pas += 1
+                if self.pas > pas_max:
+                    self.temps += timeit.default_timer() - debut
+                    return None
+
+    def log_premier(self, g, h, p):
+        """Logarithme dans un sous-groupe d'ordre premier p (bsgs si p < BSGS_SEUIL, rho sinon)"""
+        if g == 1:
+            return 0 if h == 1 else None
+        if p < self.BSGS_SEUIL:
+            return self.bsgs(g, h, p)
+        return self.rho(g, h, p)
+
+    def log(self, h):
+        """Logarithme discret de h en base g (Pohlig-Hellman)
+
+            - Pour chaque p^e qui divise l'ordre: g_i = g^(ordre / p^e), h_i = h^(ordre / p^e), g_i d'ordre p^f (f <= e),
+                puis x_i = d_0 + d_1 * p + ... (chaque chiffre d_k est un logarithme dans le sous-groupe d'ordre p)
+            - Si h_i^(p^f) != 1, h n'est pas une puissance de g: l'erreur est levée avant tout calcul de chiffre
+            - Les x_i sont recombinés avec la formule de Garner
+
+        Args:
+            h (long): Le nombre dont on cherche le logarithme
+
+        Returns:
+            long: x, avec g^x = h mod(n) et 0 <= x < ordre de g
+
+        Raises:
+            ValueError: h n'est pas une puissance de g, ou ordre n'est pas un multiple de l'ordre de g
+        """
+        pm = self.pm
+        if self.facteurs_ordre is None:
+            self.facteurs_ordre = Factorisation().factorise(self.ordre)
+        res = 0
+        prefixe = 1
+        for p, e in sorted(collections.Counter(self.facteurs_ordre).items()):
+            pe = p**e
+            g_i = pm.power(self.g, self.ordre // pe)
+            h_i = pm.power(h, self.ordre // pe)
+            # L'ordre de g_i est p^f, f <= e (g n'est pas forcément un générateur)
+            f = 0
+            t = g_i
+            while t != 1:
+                if f == e:
+                    raise ValueError(
+                        "Erreur: {} n'est pas un multiple de l'ordre de {} modulo {}".format(self.ordre, self.g, self.N)
+                    )
+                t = pm.power(t, p)
+                f = f + 1
+            pe = p**f
+            # h est dans le sous-groupe engendré par g seulement si h_i^(p^f) = 1 (vérifié avant les chiffres)
+            if pm.power(h_i, pe) != 1:
+                raise ValueError("Erreur: {} n'est pas une puissance de {} modulo {}".format(h, self.g, self.N))
+            if f == 0:
+                continue
+            g_i_inverse = Pgcd.inverse(g_i, self.N)
+            gamma = pm.power(g_i, p ** (f - 1))
+            x = 0
+            for k in range(f):
+                h_k = pm.power(pm.mult_standard(pm.power(g_i_inverse, x), h_i), p ** (f - 1 - k))
+                d = self.log_premier(gamma, h_k, p)
+                if d is None:
+                    raise ValueError("Erreur: {} n'est pas une puissance de {} modulo {}".format(h, self.g, self.N))
+                x = x + d * p**k
+            res = res + ((x - res) * Pgcd.inverse(prefixe, pe) % pe) * prefixe
+            prefixe = prefixe * pe
+        if pm.power(self.g, res) != h % self.N:
+            raise ValueError("Erreur: {} n'est pas une puissance de {} modulo {}".format(h, self.g, self.N))
+        return res
+
+    def stats(self):
+        """Retourne les mesures des calculs effectués
+
+        Returns:
+            dict: pas (multiplications de groupe), temps (s), pas_par_seconde et memoire (octets, maximum)
+        """
+        return {
+            "pas": self.pas,
+            "temps": self.temps,
+            "pas_par_seconde": self.pas / self.temps if self.temps > 0 else 0.0,
+            "memoire": self.memoire,
+        }
 
 
 class Mult(labo_config.MultBase, labo_config.UtilFuncs):
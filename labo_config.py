@@ -8,6 +8,10 @@ Permet de configurer le système et simplifier la modification du fichier labo.p
 Copyright 2007-2022, F. Mailhot et Université de Sherbrooke
 """
 
+import collections
+import math
+import sys
+import threading
 import numpy
 
 
@@ -16,6 +20,8 @@ class PgcdBase:
 
     - PGCD_EUCLIDE: utilisation de l'algorithme de Euclide
     - PGCD_BINAIRE: utilisation de la méthode binaire du calcul du pgcd
+    - PGCD_LEHMER: utilisation de l'algorithme de Lehmer (Euclide simulé sur les mots de tête)
+    - PGCD_HGCD: utilisation de l'algorithme récursif du demi-pgcd (half-gcd), sous-quadratique
 
     Cette classe doit être héritée par la classe PGCD du fichier labo.py
     """
@@ -23,12 +29,21 @@ class PgcdBase:
     PGCD_EUCLIDE = 1
     PGCD_BINAIRE = 2
     PGCD_STD = 3
+    PGCD_LEHMER = 4
+    PGCD_HGCD = 5
+
+    # Nombre de bits de tête utilisés par l'algorithme de Lehmer pour simuler Euclide
+    LEHMER_WORD_BITS = 64
+
+    # Taille (en bits) sous laquelle le demi-pgcd laisse la place à Euclide / Lehmer
+    HGCD_SEUIL = 512
 
     def __init__(self, op_type):
         """Constructeur d'un objet de type PgcdBase:
 
         Args:
-            op_type (int): Le type de calcul de pgcd effectué (PGCD_EUCLIDE, PGCD_BINAIRE ou PGCD_STD)
+            op_type (int): Le type de calcul de pgcd effectué
+                (PGCD_EUCLIDE, PGCD_BINAIRE, PGCD_STD, PGCD_LEHMER ou PGCD_HGCD)
 
         Returns:
             void: ne fait que l'initialisation de l'objet de type PgcdBase
@@ -41,6 +56,10 @@ class PgcdBase:
             self.pgcd = self.pgcd_binaire
         elif self.type == self.PGCD_STD:
             self.pgcd = self.pgcd_std
+        elif self.type == self.PGCD_LEHMER:
+            self.pgcd = self.pgcd_lehmer
+        elif self.type == self.PGCD_HGCD:
+            self.pgcd = self.pgcd_hgcd
 
         else:
             print("Erreur: Pas de pgcd de ce type")
@@ -69,6 +88,63 @@ class PgcdBase:
             b = t
         return a
 
+    @classmethod
+    def pgcd_lehmer(cls, a, b):
+        """L'algorithme de Lehmer est fourni:
+            - Euclide est simulé sur les LEHMER_WORD_BITS bits de tête de a et b (petits nombres, donc rapide)
+            - Les quotients obtenus sont accumulés dans une matrice de cofacteurs 2x2 (A, B, C, D)
+            - La simulation s'arrête dès que le quotient n'est plus garanti (test des deux bornes de Knuth)
+            - La matrice est ensuite appliquée en une seule passe aux grands nombres:
+                a, b = A * a + B * b, C * a + D * b
+            - Si aucun quotient n'a pu être simulé (B == 0), une seule étape d'Euclide est faite
+            - Lorsque b tient dans un mot, l'algorithme d'Euclide termine le calcul
+
+        Args:
+            a (long): Le premier nombre
+            b (long): Le deuxième nombre
+
+        Returns:
+            long: Le plus grand common diviseur (pgcd) entre les nombres a et b
+        """
+        a = abs(a)
+        b = abs(b)
+        if a < b:
+            a, b = b, a
+        word_bits = cls.LEHMER_WORD_BITS
+        while b >> word_bits:
+            shift = a.bit_length() - word_bits
+            x = a >> shift
+            y = b >> shift
+            A, B, C, D = 1, 0, 0, 1
+            while y + C != 0 and y + D != 0:
+                q = (x + A) // (y + C)
+                if q != (x + B) // (y + D):
+                    break
+                A, C = C, A - q * C
+                B, D = D, B - q * D
+                x, y = y, x - q * y
+            if B == 0:
+                a, b = b, a % b
+            else:
+                a, b = A * a + B * b, C * a + D * b
+        return cls.pgcd_euclide(a, b)
+
+    def pgcd_hgcd(self, a, b):
+        """L'algorithme du demi-pgcd (half-gcd) est défini dans le fichier labo.py
+
+        La méthode pgcd_hgcd n'est qu'un espace réservé (placeholder):
+            - Elle est redéfinie par la classe Pgcd, qui utilise les multiplications de la classe Mult
+            - Par défaut, l'algorithme de Lehmer est utilisé
+
+        Args:
+            a (long): Le premier nombre
+            b (long): Le deuxième nombre
+
+        Returns:
+            long: Le plus grand common diviseur (pgcd) entre les nombres a et b
+        """
+        return self.pgcd_lehmer(a, b)
+
     @staticmethod
     def pgcd_binaire(a, b):
         """L'algorithme de calcul binaire du pgcd doit apparaître dans le fichier labo.py
@@ -89,6 +165,8 @@ class PgcdBase:
     def pgcd_std(a, b):
         """Calcule le pgcd en utilisant la version de numpy (méthode statique de la classe PgcdBase)
 
+            - numpy.gcd est limité aux entiers de 64 bits: au-delà, math.gcd est utilisé
+
         Args:
             a (long): Le premier nombre
             b (long): Le deuxième nombre
@@ -96,21 +174,240 @@ class PgcdBase:
         Returns:
             long: Le plus grand common diviseur (pgcd) entre les nombres a et b
         """
+        if max(abs(a), abs(b)) >> 63:
+            return math.gcd(a, b)
         return numpy.gcd(a, b)
 
 
+ContexteMontgomery = collections.namedtuple(
+    "ContexteMontgomery",
+    [
+        "B",
+        "B2",
+        "num_shift",
+        "unite",
+        "ordered_multiples",
+        "n_prime",
+        "redc_bits",
+        "redc_mask",
+        "util",
+        "super_base",
+        "super_prime",
+        "super_shift",
+    ],
+)
+
+
+class ContexteCache:
+    """Classe ContexteCache, cache LRU (moins récemment utilisé) des contextes de Montgomery:
+
+    - Les contextes (ContexteMontgomery) sont immuables et indexés par (n, base, mode, chiffres)
+    - Un contexte contient tout ce que calcule init_Montgomery: B, B^2, num_shift, unite,
+        le tableau ordered_multiples (un tuple), n', redc_bits, redc_mask, l'objet UtilFuncs
+        et les paramètres de la super-base (super_base, super_prime, super_shift)
+    - La taille du cache est bornée par un nombre d'entrées (max_entrees) et par une mémoire estimée (max_octets):
+        + les contextes les moins récemment utilisés sont évincés en premier
+        + un contexte plus grand que max_octets n'est jamais conservé
+    - Les compteurs hits, misses et evictions permettent de mesurer l'efficacité du cache
+    - Les accès sont protégés par un verrou (le cache peut être partagé par plusieurs fils d'exécution)
+
+    """
+
+    MAX_ENTREES = 256
+    MAX_OCTETS = 64 * 1024 * 1024
+
+    def __init__(self, max_entrees=MAX_ENTREES, max_octets=MAX_OCTETS):
+        """Initialisation d'un cache vide
+
+        Args:
+            max_entrees (int): Le nombre maximal de contextes conservés
+            max_octets (int): La mémoire maximale (estimée, en octets) occupée par les contextes conservés
+
+        Returns:
+            void: Le cache est vide et ses compteurs sont à zéro
+        """
+        self.max_entrees = max_entrees
+        self.max_octets = max_octets
+        self.contextes = collections.OrderedDict()
+        self.tailles = {}
+        self.octets = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.verrou = threading.Lock()
+
+    @staticmethod
+    def cle(n, base, mode, chiffres):
+        """Construit la clé d'un contexte (seule façon de construire une clé: get, put et le préchargement
+        des processus de PowerModPool doivent utiliser exactement la même clé)
+
+        Args:
+            n (long): Le modulo
+            base (long): La base de calcul
+            mode (int): Le type de multiplication (voir PowerModBase)
+            chiffres (int): Le nombre de chiffres par itération (super-base)
+
+        Returns:
+            tuple: La clé (n, base, mode, chiffres)
+        """
+        return n, base, mode, chiffres
+
+    @staticmethod
+    def taille(contexte):
+        """Estime la mémoire occupée par un contexte (les entiers et le tableau des multiples de n)
+
+        Args:
+            contexte (ContexteMontgomery): Le contexte à évaluer
+
+        Returns:
+            int: La taille estimée, en octets
+        """
+        octets = sys.getsizeof(contexte) + sys.getsizeof(contexte.ordered_multiples)
+        for valeur in contexte[:4] + contexte[5:8] + contexte[9:] + tuple(contexte.ordered_multiples):
+            octets += sys.getsizeof(valeur)
+        return octets
+
+    def get(self, cle):
+        """Retourne le contexte associé à la clé (et le marque comme le plus récemment utilisé)
+
+        Args:
+            cle (tuple): La clé (n, base, mode, chiffres)
+
+        Returns:
+            ContexteMontgomery: Le contexte, ou None s'il n'est pas dans le cache
+        """
+        with self.verrou:
+            contexte = self.contextes.get(cle)
+            if contexte is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.contextes.move_to_end(cle)
+            return contexte
+
+    def put(self, cle, contexte):
+        """Ajoute un contexte au cache, puis évince les contextes les moins récemment utilisés au besoin
+
+        Args:
+            cle (tuple): La clé (n, base, mode, chiffres)
+            contexte (ContexteMontgomery): Le contexte à conserver
+
+        Returns:
+            void: Le contexte est conservé (sauf s'il dépasse à lui seul max_octets)
+        """
+        taille = self.taille(contexte)
+        with self.verrou:
+            if taille > self.max_octets or self.max_entrees <= 0:
+                return
+            if cle in self.contextes:
+                self.octets -= self.tailles[cle]
+            self.contextes[cle] = contexte
+            self.contextes.move_to_end(cle)
+            self.tailles[cle] = taille
+            self.octets += taille
+            self.evince()
+
+    def evince(self):
+        """Retire les contextes les moins récemment utilisés jusqu'à respecter max_entrees et max_octets
+            (le verrou doit être détenu par l'appelant)
+
+        Returns:
+            void: Le compteur evictions est mis à jour
+        """
+        while len(self.contextes) > self.max_entrees or self.octets > self.max_octets:
+            cle, _ = self.contextes.popitem(last=False)
+            self.octets -= self.tailles.pop(cle)
+            self.evictions += 1
+
+    def configure(self, max_entrees=None, max_octets=None):
+        """Modifie les limites du cache (les contextes en trop sont évincés immédiatement)
+
+        Args:
+            max_entrees (int): Le nombre maximal de contextes conservés (inchangé si None)
+            max_octets (int): La mémoire maximale estimée, en octets (inchangée si None)
+
+        Returns:
+            void: Les nouvelles limites sont appliquées
+        """
+        with self.verrou:
+            if max_entrees is not None:
+                self.max_entrees = max_entrees
+            if max_octets is not None:
+                self.max_octets = max_octets
+            self.evince()
+
+    def clear(self):
+        """Vide le cache et remet les compteurs à zéro
+
+        Returns:
+            void: Le cache est vide
+        """
+        with self.verrou:
+            self.contextes.clear()
+            self.tailles.clear()
+            self.octets = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """Retourne l'état du cache
+
+        Returns:
+            dict: hits, misses, evictions, entrees et octets
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entrees": len(self.contextes),
+            "octets": self.octets,
+        }
+
+
 class PowerModBase:
     """Classe PowerModBase, utilisée pour définir les types de base:
 
     - MULT_STANDARD: utilisation de la multiplication standard pour la mise à une puissance
     - MULT_MONTGOMERY: utilisation de la multiplication de Montgomery pour la mise à une puissance
     - POWER_MOD_STD: utilisation de la méthode d'exponentiation de numpy
+    - MULT_MONTGOMERY_REDC: utilisation de la multiplication de Montgomery par mot (REDC, une seule réduction)
+    - POWER_LADDER: échelle de Montgomery (Montgomery ladder) à temps constant, avec la multiplication REDC
+    - MULT_BARRETT: utilisation de la réduction de Barrett (mu précalculé, aucune division par produit)
+
+    La structure de l'exponentiation est choisie indépendamment de la multiplication:
+
+    - EXPOSANT_BINAIRE: méthode binaire des exposants (un bit à la fois)
+    - EXPOSANT_K_AIRE: méthode k-aire (fenêtres fixes de k bits)
+    - EXPOSANT_FENETRE: méthode de la fenêtre glissante (puissances impaires précalculées)
+    - EXPOSANT_COMPILE: fenêtre glissante, avec le plan de l'exposant compilé une seule fois par exposant (cache)
+    - EXPOSANT_WNAF: comme EXPOSANT_COMPILE, mais avec des chiffres signés (wNAF, utilise l'inverse de a)
+
+    Si la factorisation de n est connue (paramètre facteurs du constructeur), la mise à une puissance
+    est faite modulo chacune des puissances de nombres premiers, puis recombinée (théorème des restes chinois).
+
+    Les contextes de Montgomery sont partagés par toutes les instances (cache LRU PowerModBase.contextes):
+    un même modulo (n, base, mode, chiffres) n'est initialisé qu'une seule fois par processus.
 
     """
 
     MULT_STANDARD = 1
     MULT_MONTGOMERY = 2
     POWER_MOD_STD = 3
+    MULT_MONTGOMERY_REDC = 4
+    POWER_LADDER = 5
+    MULT_BARRETT = 6
+
+    # Types de calcul dont les nombres sont conservés sous forme "tilde" (domaine de Montgomery)
+    TYPES_MONTGOMERY = (MULT_MONTGOMERY, MULT_MONTGOMERY_REDC, POWER_LADDER)
+
+    EXPOSANT_BINAIRE = 1
+    EXPOSANT_K_AIRE = 2
+    EXPOSANT_FENETRE = 3
+    EXPOSANT_COMPILE = 4
+    EXPOSANT_WNAF = 5
+
+    contextes = ContexteCache()
 
     def init_Montgomery(self):
         """Initialise l'objet de type PowerModBase pour préparer l'utilisation de la multiplication de Montgomery
@@ -125,6 +422,11 @@ class PowerModBase:
 
             - MULT_STANDARD et POWER_MOD_STD utilisent la multiplication standard
             - MULT_MONTGOMERY utilise la multiplication de Montgomery
+                (par chiffre, ou par groupe de chiffres si self.chiffres > 1)
+            - MULT_MONTGOMERY_REDC utilise la multiplication de Montgomery par mot (REDC)
+            - POWER_LADDER utilise la multiplication de Montgomery par mot (REDC), avec une soustraction finale
+                masquée (sans branchement), et l'échelle de Montgomery
+            - MULT_BARRETT utilise la réduction de Barrett (power_barrett, sans conversion de domaine)
 
         Returns:
             void: Ne fait que définir l'opérateur de multiplication dans l'objet
@@ -133,42 +435,182 @@ class PowerModBase:
             self.mult = self.mult_standard
             self.power = self.power_mod
         elif self.type == self.MULT_MONTGOMERY:
-            self.mult = self.mult_montgomery
+            if self.chiffres > 1:
+                self.mult = self.mult_montgomery_super
+            else:
+                self.mult = self.mult_montgomery
             self.power = self.power_monty
         elif self.type == self.POWER_MOD_STD:
             self.mult = self.mult_standard
             self.power = self.power_std
+        elif self.type == self.MULT_MONTGOMERY_REDC:
+            self.mult = self.mult_montgomery_redc
+            self.power = self.power_monty
+        elif self.type == self.POWER_LADDER:
+            self.mult = self.mult_montgomery_redc_masque
+            self.power = self.power_ladder
+        elif self.type == self.MULT_BARRETT:
+            self.mult = self.mult_barrett
+            self.power = self.power_barrett
         else:
             print("Erreur: Pas de mise à une puissance de ce type")
         return
 
-    def __init__(self, op_type, n, base=10):
+    def set_exposant(self):
+        """Définit la structure de l'exponentiation utilisée par power_mod et power_monty:
+
+            - EXPOSANT_BINAIRE utilise self.power_struct
+            - EXPOSANT_K_AIRE utilise self.power_struct_k_aire
+            - EXPOSANT_FENETRE utilise self.power_struct_fenetre
+            - EXPOSANT_COMPILE utilise self.power_struct_compile
+            - EXPOSANT_WNAF utilise self.power_struct_wnaf
+
+        Returns:
+            void: Ne fait que définir la structure d'exponentiation (self.exposant_struct) dans l'objet
+        """
+        if self.exposant == self.EXPOSANT_BINAIRE:
+            self.exposant_struct = self.power_struct
+        elif self.exposant == self.EXPOSANT_K_AIRE:
+            self.exposant_struct = self.power_struct_k_aire
+        elif self.exposant == self.EXPOSANT_FENETRE:
+            self.exposant_struct = self.power_struct_fenetre
+        elif self.exposant == self.EXPOSANT_COMPILE:
+            self.exposant_struct = self.power_struct_compile
+        elif self.exposant == self.EXPOSANT_WNAF:
+            self.exposant_struct = self.power_struct_wnaf
+        else:
+            print("Erreur: Pas de structure d'exponentiation de ce type")
+        return
+
+    def contexte_montgomery(self):
+        """Crée le contexte de Montgomery (immuable) à partir des champs calculés par init_Montgomery
+
+        Returns:
+            ContexteMontgomery: Le contexte, qui peut être conservé dans le cache PowerModBase.contextes
+        """
+        return ContexteMontgomery(
+            self.B,
+            self.B2,
+            self.num_shift,
+            self.unite,
+            tuple(self.ordered_multiples),
+            self.n_prime,
+            self.redc_bits,
+            self.redc_mask,
+            self.util,
+            self.super_base,
+            self.super_prime,
+            self.super_shift,
+        )
+
+    def set_contexte(self, contexte):
+        """Copie dans l'objet les champs d'un contexte de Montgomery (obtenu du cache)
+
+        Args:
+            contexte (ContexteMontgomery): Le contexte à utiliser
+
+        Returns:
+            void: Les champs B, B2, num_shift, unite, ordered_multiples, n_prime, redc_bits, redc_mask, util,
+                super_base, super_prime et super_shift sont définis
+        """
+        (
+            self.B,
+            self.B2,
+            self.num_shift,
+            self.unite,
+            self.ordered_multiples,
+            self.n_prime,
+            self.redc_bits,
+            self.redc_mask,
+            self.util,
+            self.super_base,
+            self.super_prime,
+            self.super_shift,
+        ) = contexte
+        return
+
+    def init_barrett(self):
+        """Initialise l'objet de type PowerModBase pour préparer l'utilisation de la réduction de Barrett
+
+        Returns:
+            void : Si utilisée, cette méthode doit être redéfinie dans labo.py
+        """
+        return
+
+    def init_crt(self, _):
+        """Initialise l'objet de type PowerModBase pour utiliser le théorème des restes chinois
+
+        Returns:
+            void : Si utilisée, cette méthode doit être redéfinie dans labo.py
+        """
+        return
+
+    def __init__(self, op_type, n, base=10, exposant=EXPOSANT_BINAIRE, facteurs=None, chiffres=1, cache=True):
         """La méthode __init__ est utilisée par le constructeur des objets de type POWER_MOD_BASE:
 
-            - Appelle self.init_Montgomery, qui doit être définie dans la classe qui hérite de POWER_MOD_BASE
+            - Consulte le cache des contextes de Montgomery (PowerModBase.contextes), indexé par (n, base, mode, chiffres)
+            - Appelle self.init_Montgomery, qui doit être définie dans la classe qui hérite de POWER_MOD_BASE,
+                seulement si le contexte n'est pas dans le cache (le nouveau contexte est alors ajouté au cache)
+            - Si les facteurs premiers de n sont fournis, appelle self.init_crt et utilise self.power_crt
 
         Args:
-            op_type (int): Le type de calcul à effectuer (MULT_STANDARD ou MULT_MONTGOMERY)
+            op_type (int): Le type de calcul à effectuer (MULT_STANDARD, MULT_MONTGOMERY, POWER_MOD_STD,
+                MULT_MONTGOMERY_REDC, POWER_LADDER ou MULT_BARRETT)
             n (long): Le nombre avec lequel le modulo sera réalisé
             base (long): La base de calcul.  Utilisé pour les multiplications de Montgomery.  Inutilisé autrement.
+            exposant (int): La structure de l'exponentiation (EXPOSANT_BINAIRE, EXPOSANT_K_AIRE, EXPOSANT_FENETRE,
+                EXPOSANT_COMPILE ou EXPOSANT_WNAF)
+            facteurs ([long]): Les facteurs premiers de n, répétés selon leur multiplicité (None si inconnus)
+            chiffres (int): Le nombre de chiffres (dans la base) traités à la fois par MULT_MONTGOMERY (super-base base^chiffres)
+            cache (bool): Utiliser le cache des contextes (False pour un modulo utilisé une seule fois,
+                par exemple un candidat d'un test de primalité, pour ne pas évincer les modulos fréquents)
 
         Returns:
             void: L'objet de type POWER_MOD_BASE est annoté avec les paramètres requis
         """
         self.type = op_type
+        self.exposant = exposant
+        self.exposant_struct = None
         self.N = n
         self.base = base
-        self.unite = 1
+        self.unite = 1 % n
         self.res_ok = False
         self.mult = None
         self.power = None
         self.num_shift = 0
+        self.B = 1
         self.B2 = 1
         self.ordered_multiples = []
+        self.n_prime = 0
+        self.redc_bits = 0
+        self.redc_mask = 0
+        self.barrett_k = 0
+        self.barrett_mu = 0
+        self.chiffres = max(int(chiffres), 1)
+        self.super_base = 1
+        self.super_prime = 0
+        self.super_shift = 0
+        self.facteurs = facteurs
+        self.crt = []
         self.set_mult()
-        self.util = UtilFuncs(self.base)
-        if self.type == self.MULT_MONTGOMERY:
-            self.init_Montgomery()
+        self.set_exposant()
+        if self.type in self.TYPES_MONTGOMERY:
+            cle = ContexteCache.cle(self.N, self.base, self.type, self.chiffres)
+            contexte = self.contextes.get(cle) if cache else None
+            if contexte is None:
+                self.util = UtilFuncs(self.base)
+                self.init_Montgomery()
+                if cache:
+                    self.contextes.put(cle, self.contexte_montgomery())
+            else:
+                self.set_contexte(contexte)
+        else:
+            self.util = UtilFuncs(self.base)
+        if self.type == self.MULT_BARRETT:
+            self.init_barrett()
+        if facteurs:
+            self.init_crt(facteurs)
+            self.power = self.power_crt
 
         return
 
@@ -202,6 +644,66 @@ class PowerModBase:
         """
         return 42
 
+    def mult_montgomery_super(self, a, b):
+        """Méthode de multiplication de Montgomery, plusieurs chiffres à la fois (super-base):
+
+            - Cette méthode est une coquille vide et doit être redéfinie dans labo.py
+            - self.N (long): Le nombre avec lequel le modulo est effectué
+
+        Args:
+            a (long): Le multiplicande
+            b (long): Le multiplicateur
+
+        Returns:
+            long: La valeur de a * b mod(n)
+        """
+        return 42
+
+    def mult_montgomery_redc(self, a, b):
+        """Méthode de multiplication de Montgomery par mot (REDC):
+
+            - Cette méthode est une coquille vide et doit être redéfinie dans labo.py
+            - self.N (long): Le nombre avec lequel le modulo est effectué
+
+        Args:
+            a (long): Le multiplicande
+            b (long): Le multiplicateur
+
+        Returns:
+            long: La valeur de a * b / R mod(n)
+        """
+        return 42
+
+    def mult_montgomery_redc_masque(self, a, b):
+        """Méthode de multiplication de Montgomery par mot (REDC), soustraction finale sans branchement:
+
+            - Cette méthode est une coquille vide et doit être redéfinie dans labo.py
+            - self.N (long): Le nombre avec lequel le modulo est effectué
+
+        Args:
+            a (long): Le multiplicande
+            b (long): Le multiplicateur
+
+        Returns:
+            long: La valeur de a * b / R mod(n)
+        """
+        return 42
+
+    def mult_barrett(self, a, b):
+        """Méthode de multiplication avec réduction de Barrett:
+
+            - Cette méthode est une coquille vide et doit être redéfinie dans labo.py
+            - self.N (long): Le nombre avec lequel le modulo est effectué
+
+        Args:
+            a (long): Le multiplicande
+            b (long): Le multiplicateur
+
+        Returns:
+            long: La valeur de a * b mod(n)
+        """
+        return 42
+
     def power_std(self, a, w):
         """Méthode de mise à une puissance utilisant la méthode standard fournie par Python:
 
@@ -255,6 +757,51 @@ class PowerModBase:
         """
         return 42
 
+    def power_crt(self, _, __):
+        """Méthode de mise à une puissance utilisant le théorème des restes chinois (facteurs de n connus):
+
+            - Cette méthode est une coquille vide et doit être redéfinie dans labo.py
+            - self.N (long): Le nombre avec lequel le modulo est effectué
+
+        Args:
+            _ (long): Le nombre à élever à une puissance
+            __ (long): La puissance
+
+        Returns:
+            long: La valeur de a^w mod(n)
+        """
+        return 42
+
+    def power_barrett(self, _, __):
+        """Méthode de mise à une puissance avec la réduction de Barrett:
+
+            - Cette méthode est une coquille vide et doit être redéfinie dans labo.py
+            - self.N (long): Le nombre avec lequel le modulo est effectué
+
+        Args:
+            _ (long): Le nombre à élever à une puissance
+            __ (long): La puissance
+
+        Returns:
+            long: La valeur de a^w mod(n)
+        """
+        return 42
+
+    def power_ladder(self, _, __):
+        """Méthode de mise à une puissance à temps constant (échelle de Montgomery):
+
+            - Cette méthode est une coquille vide et doit être redéfinie dans labo.py
+            - self.N (long): Le nombre avec lequel le modulo est effectué
+
+        Args:
+            _ (long): Le nombre à élever à une puissance
+            __ (long): La puissance
+
+        Returns:
+            long: La valeur de a^w mod(n)
+        """
+        return 42
+
 
 class MultBase:
     """Classe MultBase, utilisée pour définir les types de base:
@@ -7,8 +7,15 @@
 #  Copyright 2007-2022 F. Mailhot et Université de Sherbrooke
 #
 
+import asyncio
+import concurrent.futures
+import itertools
+import math
 import numpy
+import os
 import argparse
+import random
+import statistics
 import timeit
 import labo
 
@@ -38,6 +45,33 @@ class TestLabo:
     TESTLABO_MULT = 7
     TESTLABO_MULT_N2 = 8
     TESTLABO_MULT_KO = 9
+    TESTLABO_PGCD_LEHMER = 10
+    TESTLABO_PGCD_HGCD = 11
+    TESTLABO_EXPOSANT_MONTGOMERY_REDC = 12
+    TESTLABO_EXPOSANT_LADDER = 13
+    TESTLABO_EXPOSANT_BARRETT = 14
+    TESTLABO_CLE_RSA = 15
+    TESTLABO_EXPOSANT_K_AIRE = 16
+    TESTLABO_EXPOSANT_FENETRE = 17
+    TESTLABO_EXPOSANT_LOT = 18
+    TESTLABO_EXPOSANT_LOT_STD = 19
+    TESTLABO_EXPOSANT_FIXE = 20
+    TESTLABO_EXPOSANT_CRT = 21
+    TESTLABO_EXPOSANT_MULTI = 22
+    TESTLABO_EXPOSANT_MULTI_STD = 23
+    TESTLABO_EXPOSANT_COMPILE = 24
+    TESTLABO_EXPOSANT_WNAF = 25
+    TESTLABO_PGCD_REDUCE = 26
+    TESTLABO_PGCD_MANY = 27
+    TESTLABO_PGCD_MANY_STD = 28
+    TESTLABO_EXPOSANT_POOL = 29
+    TESTLABO_EXPOSANT_ASYNC = 30
+    TESTLABO_FACTORISATION = 31
+    TESTLABO_LOG_DISCRET = 32
+    TESTLABO_PGCD_BATCH = 33
+    TESTLABO_PGCD_BATCH_STD = 34
+    TESTLABO_INVERSE_MANY = 35
+    TESTLABO_INVERSE_MANY_STD = 36
 
     @staticmethod
     def get_pgcd_num(iterations, init):
@@ -117,6 +151,24 @@ class TestLabo:
         """
         self.pgcd.pgcd_binaire(param1, param2)
 
+    def test_lehmer(self, param1, param2):
+        """Test du calcul du pgcd (plus grand commun diviseur) utilisant l'algorithme de Lehmer:
+            - Appel de la méthode définie dans le fichier labo_config.py
+
+        Returns:
+            long: Le résultat du calcul du pgcd basé sur l'algorithme de Lehmer
+        """
+        self.pgcd.pgcd_lehmer(param1, param2)
+
+    def test_hgcd(self, param1, param2):
+        """Test du calcul du pgcd (plus grand commun diviseur) utilisant le demi-pgcd (half-gcd):
+            - Appel de la méthode définie dans le fichier labo.py
+
+        Returns:
+            long: Le résultat du calcul du pgcd basé sur le demi-pgcd
+        """
+        self.pgcd.pgcd_hgcd(param1, param2)
+
     def test_pgcd_std(self, param1, param2):
         """Test du calcul du pgcd (plus grand commun diviseur) standard, définie dans numpy:
             - Appel de la méthode définie dans le fichier labo_config.py
@@ -126,6 +178,33 @@ class TestLabo:
         """
         self.pgcd.pgcd_std(param1, param2)
 
+    def test_lcm_reduce(self, param1, _):
+        """Test du calcul du ppcm de tous les nombres d'un tableau numpy (lcm_reduce):
+            - Appel de la méthode définie dans le fichier labo.py
+
+        Returns:
+            long: Le ppcm de tous les nombres du tableau
+        """
+        self.pgcd.lcm_reduce(param1)
+
+    def test_pgcd_many(self, param1, param2):
+        """Test du calcul du pgcd de nombreuses paires en un seul appel (pgcd_many, tableaux uint64):
+            - Appel de la méthode définie dans le fichier labo.py
+
+        Returns:
+            numpy.ndarray: Le pgcd de chacune des paires
+        """
+        labo.Pgcd.pgcd_many(param1, param2)
+
+    def test_gcd_boucle(self, param1, param2):
+        """Test du calcul du pgcd de nombreuses paires, un appel à math.gcd par paire:
+            - Référence pour test_pgcd_many
+
+        Returns:
+            [long]: Le pgcd de chacune des paires
+        """
+        [math.gcd(a, b) for a, b in zip(param1, param2)]
+
     def test_power_mod(self, param1, param2):
         """Test de la mise à une puissance (modulo) utilisant la méthode binaire des exposants:
             - Appel de la méthode définie dans le fichier labo.py
@@ -144,6 +223,15 @@ class TestLabo:
         """
         self.pm.power_monty(param1, param2)
 
+    def test_power_ladder(self, param1, param2):
+        """Test de la mise à une puissance (modulo) utilisant l'échelle de Montgomery (temps constant):
+            - Appel de la méthode définie dans le fichier labo.py
+
+        Returns:
+            long: Le résultat de l'exponentiation basée sur l'échelle de Montgomery
+        """
+        self.pm.power_ladder(param1, param2)
+
     def test_power_std(self, param1, param2):
         """Test de la mise à une puissance (modulo) standard de Python:
             - Appel de la méthode définie dans le fichier labo_config.py
@@ -153,6 +241,146 @@ class TestLabo:
         """
         self.pm.power_std(param1, param2)
 
+    def test_power_many(self, param1, param2):
+        """Test de la mise à une puissance d'un lot de nombres (même modulo, même exposant):
+            - Appel de la méthode définie dans le fichier labo.py
+
+        Returns:
+            [long]: Les résultats de l'exponentiation de chacun des nombres du lot
+        """
+        self.pm.power_many(param1, param2)
+
+    def test_pow_many(self, param1, param2):
+        """Test de la mise à une puissance d'un lot de nombres, un appel à pow de Python par nombre:
+            - Référence pour test_power_many
+
+        Returns:
+            [long]: Les résultats de l'exponentiation de chacun des nombres du lot
+        """
+        [pow(a, param2, self.power_n) for a in param1]
+
+    def test_fixed_base(self, _, param2):
+        """Test de la mise à une puissance d'un nombre fixe (table précalculée, méthode BGMW):
+            - Appel de la méthode définie dans le fichier labo.py (la table est calculée une seule fois)
+
+        Returns:
+            long: Le résultat de l'exponentiation
+        """
+        self.fb.power(param2)
+
+    def test_power_crt(self, param1, param2):
+        """Test de la mise à une puissance par le théorème des restes chinois (facteurs de n connus):
+            - Appel de la méthode définie dans le fichier labo.py (power_crt, si la factorisation de n a réussi)
+
+        Returns:
+            long: Le résultat de l'exponentiation recombinée (Garner)
+        """
+        self.pm.power(param1, param2)
+
+    def test_multi_power(self, param1, _):
+        """Test de la multi-exponentiation simultanée (Straus): produit des a^w mod(n)
+            - Appel de la méthode définie dans le fichier labo.py
+
+        Returns:
+            long: Le produit des exponentiations
+        """
+        self.pm.multi_power(param1)
+
+    def test_pow_multi(self, param1, _):
+        """Test du produit des a^w mod(n), un appel à pow de Python par terme:
+            - Référence pour test_multi_power
+
+        Returns:
+            long: Le produit des exponentiations
+        """
+        res = 1
+        for a, w in param1:
+            res = res * pow(a, w, self.power_n) % self.power_n
+
+    def test_power_pool(self, param1, _):
+        """Test d'un lot d'exponentiations calculé en parallèle sur plusieurs processus (PowerModPool):
+            - Appel de la méthode définie dans le fichier labo.py (les processus sont démarrés une seule fois)
+
+        Returns:
+            [long]: Les résultats de chacune des tâches (a, w, n)
+        """
+        self.pool.power_many(param1)
+
+    async def power_async(self, taches):
+        """Envoie toutes les demandes (a, w, n) au frontal asyncio en même temps, puis attend leurs résultats
+
+        Args:
+            taches ([(long, long, long)]): Les demandes (a, w, n)
+
+        Returns:
+            [long]: Les résultats, dans l'ordre des demandes
+        """
+        return await asyncio.gather(*(self.frontal.power(a, w, n) for a, w, n in taches))
+
+    def test_power_async(self, param1, _):
+        """Test d'un lot d'exponentiations demandées une à une au frontal asyncio (AsyncPowerMod, micro-lots):
+            - Appel de la méthode définie dans le fichier labo.py (une boucle asyncio par appel)
+
+        Returns:
+            [long]: Les résultats de chacune des demandes (a, w, n)
+        """
+        asyncio.run(self.power_async(param1))
+
+    def test_factorise(self, param1, _):
+        """Test de la décomposition d'un nombre en facteurs premiers (rho de Pollard, variante de Brent):
+            - Appel de la méthode définie dans le fichier labo.py
+
+        Returns:
+            [long]: Les facteurs premiers, en ordre croissant
+        """
+        self.factorisation.factorise(param1)
+
+    def test_log_discret(self, param1, _):
+        """Test du logarithme discret (Pohlig-Hellman, pas de bébé et pas de géant dans chaque sous-groupe):
+            - Appel de la méthode définie dans le fichier labo.py
+
+        Returns:
+            long: x, avec g^x = h mod(n)
+        """
+        self.log_discret.log(param1)
+
+    def test_pgcd_batch(self, param1, _):
+        """Test du pgcd de chacun des modules avec le produit de tous les autres (BatchPgcd, arbres de Bernstein):
+            - Appel de la méthode définie dans le fichier labo.py
+
+        Returns:
+            [long]: pgcd(N[i], produit des N[j], j != i), pour chacun des modules
+        """
+        self.batch.pgcd_batch(param1)
+
+    def test_gcd_produit(self, param1, _):
+        """Test du pgcd de chacun des modules avec le produit de tous les autres, un appel à math.gcd par module:
+            - Référence pour test_pgcd_batch (le produit P est calculé une seule fois, puis pgcd(N[i], P / N[i]))
+
+        Returns:
+            [long]: pgcd(N[i], produit des N[j], j != i), pour chacun des modules
+        """
+        produit = math.prod(param1)
+        [math.gcd(n, produit // n) for n in param1]
+
+    def test_inverse_many(self, param1, param2):
+        """Test de l'inversion d'un lot de nombres modulo n (astuce de Montgomery, une seule inversion):
+            - Appel de la méthode définie dans le fichier labo.py
+
+        Returns:
+            [long]: Les inverses de chacun des nombres
+        """
+        labo.Pgcd.inverse_many(param1, param2)
+
+    def test_pow_inverse(self, param1, param2):
+        """Test de l'inversion d'un lot de nombres modulo n, un appel à pow(v, -1, n) de Python par nombre:
+            - Référence pour test_inverse_many
+
+        Returns:
+            [long]: Les inverses de chacun des nombres
+        """
+        [pow(int(v), -1, param2) for v in param1]
+
     def test_mult(self, param1, param2):
         """Test de la multiplication par défaut de Python:
             - Appel de la méthode définie dans le fichier labo_config.py
@@ -180,6 +408,36 @@ class TestLabo:
         """
         self.m.mult_ko(param1, param2)
 
+    def test_cle_rsa(self, param1, param2):
+        """Test de la génération d'une paire de clés RSA (crible incrémental):
+            - Appel de la méthode définie dans le fichier labo.py
+
+        Returns:
+            long: La paire de clés (n, e, d, p, q)
+        """
+        labo.GenerateurPremiers.cle_rsa(param1, param2)
+
+    def valide_cle_rsa(self, cle):
+        """Validation d'une paire de clés RSA:
+            - n = p * q a exactement self.rsa_bits bits
+            - |p - q| >= 2^(self.rsa_bits / 2 - 100) (sinon, n est factorisé par la méthode de Fermat)
+            - Le chiffrement suivi du déchiffrement redonne le message
+
+        Args:
+            cle ((long, long, long, long, long)): La paire de clés (n, e, d, p, q)
+
+        Returns:
+            bool: Vrai si la paire de clés est valide, Faux autrement
+        """
+        n, e, d, p, q = cle
+        ecart = 1 << max(self.rsa_bits // 2 - 100, 0)
+        return (
+            n == p * q
+            and n.bit_length() == self.rsa_bits
+            and abs(p - q) >= ecart
+            and pow(pow(self.power_a, e, n), d, n) == self.power_a % n
+        )
+
     def inner_loop(self, called_func, params):
         """Appel en rafale de la fonction passée en paramètres:
             - Temps initial mesuré
@@ -217,6 +475,8 @@ class TestLabo:
             test_type == self.TESTLABO_PGCD_EUCLID
             or test_type == self.TESTLABO_PGCD_BINAIRE
             or test_type == self.TESTLABO_PGCD_STD
+            or test_type == self.TESTLABO_PGCD_LEHMER
+            or test_type == self.TESTLABO_PGCD_HGCD
         ):
             if test_type == self.TESTLABO_PGCD_EUCLID:
                 print("PGCD Euclide:\t\t\t\t\t\t\t\t", end="")
@@ -226,20 +486,71 @@ class TestLabo:
                 print("PGCD binaire:\t\t\t\t\t\t\t\t", end="")
                 self.called_func = self.test_binaire
                 op_type = labo.Pgcd.PGCD_BINAIRE
+            elif test_type == self.TESTLABO_PGCD_LEHMER:
+                print("PGCD Lehmer:\t\t\t\t\t\t\t\t", end="")
+                self.called_func = self.test_lehmer
+                op_type = labo.Pgcd.PGCD_LEHMER
+            elif test_type == self.TESTLABO_PGCD_HGCD:
+                print("PGCD demi-pgcd (half-gcd):\t\t\t\t\t", end="")
+                self.called_func = self.test_hgcd
+                op_type = labo.Pgcd.PGCD_HGCD
             else:  # test_type == self.TESTLABO_PGCD_STD:
                 print("PGCD standard (version numpy):\t\t\t\t", end="")
                 self.called_func = self.test_pgcd_std
                 op_type = labo.Pgcd.PGCD_STD
             self.pgcd = labo.Pgcd(op_type)
             labo_res = self.pgcd.pgcd(self.pgcd1, self.pgcd2)
-            real_res = numpy.gcd(self.pgcd1, self.pgcd2)
+            real_res = math.gcd(self.pgcd1, self.pgcd2)
             self.empty_func = self.test_vide2
             self.params = [self.pgcd1, self.pgcd2]
+        elif test_type == self.TESTLABO_PGCD_REDUCE:
+            print("PPCM d'un tableau numpy.int64 (lcm_reduce):\t", end="")
+            self.called_func = self.test_lcm_reduce
+            # Chaque nombre tient dans un int64, mais leur ppcm dépasse 2^63
+            nombres = numpy.array([2**40, 3**25, 5**20, 7**15, 11**12], dtype=numpy.int64)
+            self.pgcd = labo.Pgcd(labo.Pgcd.PGCD_STD)
+            ppcm = self.pgcd.lcm_reduce(nombres)
+            pgcd = self.pgcd.pgcd_reduce(nombres * 6)
+            labo_res = (ppcm, pgcd, type(ppcm), type(pgcd))
+            real_res = (math.lcm(*nombres.tolist()), math.gcd(*(nombres * 6).tolist()), int, int)
+            self.empty_func = self.test_vide2
+            self.params = [nombres, None]
+        elif test_type == self.TESTLABO_PGCD_MANY or test_type == self.TESTLABO_PGCD_MANY_STD:
+            # Paires de 64 bits qui partagent souvent un petit facteur (pgcd non trivial)
+            gen = numpy.random.default_rng(1)
+            facteurs = gen.integers(1, 1 << 16, size=self.paires, dtype=numpy.uint64)
+            a = gen.integers(1, 1 << 48, size=self.paires, dtype=numpy.uint64) * facteurs
+            b = gen.integers(1, 1 << 48, size=self.paires, dtype=numpy.uint64) * facteurs
+            real_res = [math.gcd(x, y) for x, y in zip(a.tolist(), b.tolist())]
+            if test_type == self.TESTLABO_PGCD_MANY:
+                print("PGCD d'un tableau de paires uint64 (pgcd_many):\t", end="")
+                self.called_func = self.test_pgcd_many
+                labo_res = labo.Pgcd.pgcd_many(a, b).tolist()
+                # Paires mixtes (grands nombres et nombres de 64 bits), validées mais non mesurées
+                grands = [self.pgcd1, 12, -18, 1 << 70]
+                autres = [self.pgcd2, 0, 12, 3 << 65]
+                labo_res = (labo_res, labo.Pgcd.pgcd_many(grands, autres).tolist())
+                real_res = (real_res, [math.gcd(x, y) for x, y in zip(grands, autres)])
+                self.params = [a, b]
+            else:  # test_type == self.TESTLABO_PGCD_MANY_STD:
+                print("PGCD des paires, boucle de math.gcd:\t\t", end="")
+                self.called_func = self.test_gcd_boucle
+                labo_res = real_res
+                self.params = [a.tolist(), b.tolist()]
+            self.empty_func = self.test_vide2
         elif (
             test_type == self.TESTLABO_EXPOSANT_BINAIRE
             or test_type == self.TESTLABO_EXPOSANT_MONTGOMERY
             or test_type == self.TESTLABO_EXPOSANT_STD
+            or test_type == self.TESTLABO_EXPOSANT_MONTGOMERY_REDC
+            or test_type == self.TESTLABO_EXPOSANT_LADDER
+            or test_type == self.TESTLABO_EXPOSANT_BARRETT
+            or test_type == self.TESTLABO_EXPOSANT_K_AIRE
+            or test_type == self.TESTLABO_EXPOSANT_FENETRE
+            or test_type == self.TESTLABO_EXPOSANT_COMPILE
+            or test_type == self.TESTLABO_EXPOSANT_WNAF
         ):
+            exposant = labo.PowerMod.EXPOSANT_BINAIRE
             if test_type == self.TESTLABO_EXPOSANT_BINAIRE:
                 print("Methode binaire des exposants:\t\t\t\t", end="")
                 self.called_func = tl.test_power_mod
@@ -248,15 +559,196 @@ class TestLabo:
                 print("Methode de Montgomery:\t\t\t\t\t\t", end="")
                 self.called_func = tl.test_power_monty
                 op_type = labo.PowerMod.MULT_MONTGOMERY
+            elif test_type == self.TESTLABO_EXPOSANT_MONTGOMERY_REDC:
+                print("Methode de Montgomery par mot (REDC):\t\t", end="")
+                self.called_func = tl.test_power_monty
+                op_type = labo.PowerMod.MULT_MONTGOMERY_REDC
+            elif test_type == self.TESTLABO_EXPOSANT_LADDER:
+                print("Echelle de Montgomery (temps constant):\t\t", end="")
+                self.called_func = tl.test_power_ladder
+                op_type = labo.PowerMod.POWER_LADDER
+            elif test_type == self.TESTLABO_EXPOSANT_BARRETT:
+                print("Methode binaire avec reduction de Barrett:\t", end="")
+                self.called_func = tl.test_power_mod
+                op_type = labo.PowerMod.MULT_BARRETT
+            elif test_type == self.TESTLABO_EXPOSANT_K_AIRE:
+                print("Methode k-aire (REDC):\t\t\t\t\t\t", end="")
+                self.called_func = tl.test_power_monty
+                op_type = labo.PowerMod.MULT_MONTGOMERY_REDC
+                exposant = labo.PowerMod.EXPOSANT_K_AIRE
+            elif test_type == self.TESTLABO_EXPOSANT_FENETRE:
+                print("Methode de la fenetre glissante (REDC):\t\t", end="")
+                self.called_func = tl.test_power_monty
+                op_type = labo.PowerMod.MULT_MONTGOMERY_REDC
+                exposant = labo.PowerMod.EXPOSANT_FENETRE
+            elif test_type == self.TESTLABO_EXPOSANT_COMPILE:
+                print("Plan d'exposant compile (REDC):\t\t\t\t", end="")
+                self.called_func = tl.test_power_monty
+                op_type = labo.PowerMod.MULT_MONTGOMERY_REDC
+                exposant = labo.PowerMod.EXPOSANT_COMPILE
+            elif test_type == self.TESTLABO_EXPOSANT_WNAF:
+                print("Plan d'exposant compile, wNAF (REDC):\t\t", end="")
+                self.called_func = tl.test_power_monty
+                op_type = labo.PowerMod.MULT_MONTGOMERY_REDC
+                exposant = labo.PowerMod.EXPOSANT_WNAF
             else:  # test_type == self.TESTLABO_EXPOSANT_STD:
                 print("Methode Python standard d'exponentiation:\t", end="")
                 self.called_func = tl.test_power_std
                 op_type = labo.PowerMod.POWER_MOD_STD
-            self.pm = labo.PowerMod(op_type, self.power_n, self.base)
+            self.pm = labo.PowerMod(op_type, self.power_n, self.base, exposant, chiffres=self.chiffres)
             labo_res = self.pm.power(self.power_a, self.power_w)
             real_res = pow(tl.power_a, tl.power_w, tl.power_n)
             self.empty_func = tl.test_vide2
             self.params = [tl.power_a, tl.power_w]
+        elif test_type == self.TESTLABO_EXPOSANT_LOT or test_type == self.TESTLABO_EXPOSANT_LOT_STD:
+            if test_type == self.TESTLABO_EXPOSANT_LOT:
+                print("Lot d'exponentiations (power_many, REDC):\t", end="")
+                self.called_func = self.test_power_many
+            else:  # test_type == self.TESTLABO_EXPOSANT_LOT_STD:
+                print("Lot d'exponentiations (pow Python):\t\t\t", end="")
+                self.called_func = self.test_pow_many
+            bases = [self.power_a + i for i in range(self.lot)]
+            self.pm = labo.PowerMod(labo.PowerMod.MULT_MONTGOMERY_REDC, self.power_n, self.base)
+            labo_res = self.pm.power_many(bases, self.power_w)
+            real_res = [pow(a, self.power_w, self.power_n) for a in bases]
+            self.empty_func = self.test_vide2
+            self.params = [bases, self.power_w]
+        elif test_type == self.TESTLABO_EXPOSANT_FIXE:
+            print("Base fixe (table precalculee, REDC):\t\t", end="")
+            self.called_func = self.test_fixed_base
+            self.pm = labo.PowerMod(labo.PowerMod.MULT_MONTGOMERY_REDC, self.power_n, self.base)
+            self.fb = self.pm.fixed_base(self.power_a, max(self.power_w.bit_length(), 1))
+            labo_res = self.fb.power(self.power_w)
+            real_res = pow(self.power_a, self.power_w, self.power_n)
+            self.empty_func = self.test_vide2
+            self.params = [self.power_a, self.power_w]
+        elif test_type == self.TESTLABO_EXPOSANT_CRT:
+            print("Restes chinois (facteurs de n, REDC):\t\t", end="")
+            self.called_func = self.test_power_crt
+            try:
+                # Factorisation bornée: un n difficile à factoriser ne doit pas bloquer le banc d'essai
+                facteurs = labo.Factorisation(max_iterations=1 << 14).factorise(self.power_n)
+            except ValueError:
+                print("(n non factorise, sans restes chinois)\t", end="")
+                facteurs = None
+            self.pm = labo.PowerMod(
+                labo.PowerMod.MULT_MONTGOMERY_REDC, self.power_n, self.base, facteurs=facteurs
+            )
+            labo_res = self.pm.power(self.power_a, self.power_w)
+            real_res = pow(self.power_a, self.power_w, self.power_n)
+            self.empty_func = self.test_vide2
+            self.params = [self.power_a, self.power_w]
+        elif test_type == self.TESTLABO_EXPOSANT_MULTI or test_type == self.TESTLABO_EXPOSANT_MULTI_STD:
+            if test_type == self.TESTLABO_EXPOSANT_MULTI:
+                print("Multi-exponentiation (Straus, REDC):\t\t", end="")
+                self.called_func = self.test_multi_power
+            else:  # test_type == self.TESTLABO_EXPOSANT_MULTI_STD:
+                print("Multi-exponentiation (pow Python):\t\t\t", end="")
+                self.called_func = self.test_pow_multi
+            termes = [(self.power_a + i, self.power_w + i) for i in range(self.termes)]
+            self.pm = labo.PowerMod(labo.PowerMod.MULT_MONTGOMERY_REDC, self.power_n, self.base)
+            labo_res = self.pm.multi_power(termes)
+            real_res = 1
+            for a, w in termes:
+                real_res = real_res * pow(a, w, self.power_n) % self.power_n
+            self.empty_func = self.test_vide2
+            self.params = [termes, None]
+        elif test_type == self.TESTLABO_EXPOSANT_POOL:
+            print("Lot d'exponentiations parallele (PowerModPool):\t", end="")
+            self.called_func = self.test_power_pool
+            # Les processus (et le contexte de Montgomery de n) sont préparés hors de la mesure du temps;
+            # le lot est découpé en un paquet par coeur
+            self.pool = labo.PowerModPool(
+                labo.PowerMod.MULT_MONTGOMERY_REDC,
+                self.base,
+                chunk_size=-(-self.lot // (os.cpu_count() or 1)),
+                modules=[self.power_n],
+            )
+            taches = [(self.power_a + i, self.power_w, self.power_n) for i in range(self.lot)]
+            labo_res = self.pool.power_many(taches)
+            real_res = [pow(a, w, n) for a, w, n in taches]
+            self.empty_func = self.test_vide2
+            self.params = [taches, None]
+        elif test_type == self.TESTLABO_EXPOSANT_ASYNC:
+            print("Lot d'exponentiations asyncio (AsyncPowerMod):\t", end="")
+            self.called_func = self.test_power_async
+            # Un seul fil de calcul, créé hors de la mesure du temps; un lot complet est envoyé sans attendre
+            self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self.frontal = labo.AsyncPowerMod(
+                labo.PowerMod.MULT_MONTGOMERY_REDC, self.base, max_lot=self.lot, executor=self.executor
+            )
+            taches = [(self.power_a + i, self.power_w, self.power_n) for i in range(self.lot)]
+            labo_res = asyncio.run(self.power_async(taches))
+            real_res = [pow(a, w, n) for a, w, n in taches]
+            self.empty_func = self.test_vide2
+            self.params = [taches, None]
+        elif test_type == self.TESTLABO_FACTORISATION:
+            print("Factorisation de 12 * p * q (rho de Brent):\t", end="")
+            self.called_func = self.test_factorise
+            # n = 12 * p * q: division d'essai pour 2 et 3, puis rho pour séparer p et q
+            generateur = labo.GenerateurPremiers(self.facteur_bits)
+            p = generateur.premier()
+            q = p
+            while q == p:
+                q = generateur.premier()
+            n = 12 * p * q
+            self.factorisation = labo.Factorisation()
+            facteurs = self.factorisation.factorise(n)
+            labo_res = (facteurs, math.prod(facteurs))
+            real_res = (sorted([2, 2, 3, p, q]), n)
+            self.empty_func = self.test_vide2
+            self.params = [n, None]
+        elif test_type == self.TESTLABO_LOG_DISCRET:
+            print("Logarithme discret (Pohlig-Hellman):\t\t", end="")
+            self.called_func = self.test_log_discret
+            # n = 2 * k * q + 1 premier (k petit, q premier de self.log_bits bits): l'ordre n - 1 est factorisé
+            # une seule fois, au premier appel (hors de la mesure du temps)
+            q = labo.GenerateurPremiers(self.log_bits).premier()
+            k = 1
+            while not labo.Primalite.is_prime(2 * k * q + 1):
+                k = k + 1
+            n = 2 * k * q + 1
+            h = pow(3, random.randrange(n - 1), n)
+            self.log_discret = labo.LogDiscret(n, 3)
+            labo_res = pow(3, self.log_discret.log(h), n)
+            real_res = h
+            self.empty_func = self.test_vide2
+            self.params = [h, None]
+        elif test_type == self.TESTLABO_PGCD_BATCH or test_type == self.TESTLABO_PGCD_BATCH_STD:
+            # self.lot modules de deux premiers de 64 bits; le premier et le dernier partagent un facteur
+            premiers = list(itertools.islice(labo.GenerateurPremiers(64).premiers(), 2 * self.lot))
+            modules = [premiers[2 * i] * premiers[2 * i + 1] for i in range(self.lot)]
+            modules[-1] = premiers[0] * premiers[-1]
+            real_res = [
+                math.gcd(n, math.prod(modules[:i] + modules[i + 1 :])) for i, n in enumerate(modules)
+            ]
+            if test_type == self.TESTLABO_PGCD_BATCH:
+                print("PGCD par lot, arbres de Bernstein (BatchPgcd):\t", end="")
+                self.called_func = self.test_pgcd_batch
+                self.batch = labo.BatchPgcd()
+                labo_res = self.batch.pgcd_batch(modules)
+            else:  # test_type == self.TESTLABO_PGCD_BATCH_STD:
+                print("PGCD par lot, boucle de math.gcd (N, P / N):\t", end="")
+                self.called_func = self.test_gcd_produit
+                produit = math.prod(modules)
+                labo_res = [math.gcd(n, produit // n) for n in modules]
+            self.empty_func = self.test_vide2
+            self.params = [modules, None]
+        elif test_type == self.TESTLABO_INVERSE_MANY or test_type == self.TESTLABO_INVERSE_MANY_STD:
+            # self.lot nombres inversibles modulo n, dans un tableau numpy.int64 (leur produit dépasse 2^63)
+            inversibles = (v for v in itertools.count(self.power_a) if math.gcd(v, self.power_n) == 1)
+            valeurs = numpy.array(list(itertools.islice(inversibles, self.lot)), dtype=numpy.int64)
+            real_res = [pow(int(v), -1, self.power_n) for v in valeurs]
+            if test_type == self.TESTLABO_INVERSE_MANY:
+                print("Inversion d'un lot (inverse_many):\t\t", end="")
+                self.called_func = self.test_inverse_many
+                labo_res = labo.Pgcd.inverse_many(valeurs, self.power_n)
+            else:  # test_type == self.TESTLABO_INVERSE_MANY_STD:
+                print("Inversion d'un lot (pow(v, -1, n) Python):\t", end="")
+                self.called_func = self.test_pow_inverse
+                labo_res = real_res
+            self.empty_func = self.test_vide2
+            self.params = [valeurs, self.power_n]
         elif (
             test_type == self.TESTLABO_MULT
             or test_type == self.TESTLABO_MULT_N2
@@ -279,6 +771,16 @@ class TestLabo:
             real_res = self.m1 * self.m2
             self.empty_func = self.test_vide2
             self.params = [self.m1, self.m2]
+        elif test_type == self.TESTLABO_CLE_RSA:
+            print("Generation de cles RSA (ecart p - q):\t\t", end="")
+            self.called_func = self.test_cle_rsa
+            labo_res = all(
+                self.valide_cle_rsa(labo.GenerateurPremiers.cle_rsa(self.rsa_bits, 65537))
+                for _ in range(self.iterations)
+            )
+            real_res = True
+            self.empty_func = self.test_vide2
+            self.params = [self.rsa_bits, 65537]
         else:
             print("Unknown test")
             self.called_func = None
@@ -343,8 +845,149 @@ class TestLabo:
             self.setup_iterations(test_type)
             self.multiple_calls()
             self.print_one_test_result()
+            if test_type == self.TESTLABO_EXPOSANT_LADDER:
+                self.print_hamming_variance()
+            if test_type == self.TESTLABO_EXPOSANT_POOL:
+                self.print_pool_stats()
+            if test_type == self.TESTLABO_EXPOSANT_ASYNC:
+                self.print_async_metrics()
+            if test_type == self.TESTLABO_LOG_DISCRET:
+                self.print_log_stats()
         return
 
+    def hamming_exposants(self, bits):
+        """Génère des exposants de même longueur, mais de poids de Hamming différents:
+            - Tous les exposants ont exactement bits bits (le bit de poids fort est toujours à 1)
+            - Poids de Hamming: 1, bits/4, bits/2, 3*bits/4 et bits
+            - Les positions des bits à 1 sont tirées au hasard (germe fixe, résultats reproductibles)
+
+        Args:
+            bits (int): Le nombre de bits des exposants
+
+        Returns:
+            [long]: La liste des exposants, en ordre croissant de poids de Hamming
+        """
+        gen = random.Random(bits)
+        exposants = []
+        for poids in sorted({1, max(1, bits // 4), max(1, bits // 2), max(1, 3 * bits // 4), bits}):
+            w = 1 << (bits - 1)
+            for position in gen.sample(range(bits - 1), poids - 1):
+                w |= 1 << position
+            exposants.append(w)
+        return exposants
+
+    def time_one_exposant(self, called_func, w):
+        """Mesure le temps moyen d'un appel pour un exposant donné:
+            - Une première série d'appels (non mesurée) sert de réchauffement (caches, allocation des entiers)
+            - self.iterations mesures indépendantes de self.inner_iterations appels chacune
+            - Le temps d'un appel "à vide" est soustrait de chaque mesure
+
+        Args:
+            called_func (None): La fonction à mesurer
+            w (long): L'exposant à utiliser
+
+        Returns:
+            [float]: Le temps moyen d'un appel, pour chacune des mesures
+        """
+        params = [self.power_a, w]
+        self.inner_loop(called_func, params)
+        self.inner_loop(self.test_vide2, params)
+        mesures = []
+        for _ in range(0, self.iterations):
+            delay = self.inner_loop(called_func, params) - self.inner_loop(self.test_vide2, params)
+            mesures.append(delay / self.inner_iterations)
+        return mesures
+
+    def print_hamming_variance(self):
+        """Banc d'essai de l'échelle de Montgomery selon le poids de Hamming de l'exposant:
+            - Les exposants ont tous la longueur (en bits) du modulo, seul le poids de Hamming varie
+            - Pour chaque exposant: temps médian des mesures (après réchauffement), débit (exponentiations/s)
+                et écart-type des mesures
+                + échelle de Montgomery (POWER_LADDER)
+                + méthode binaire des exposants avec la même multiplication (MULT_MONTGOMERY_REDC)
+            - À la fin, l'écart relatif entre les médianes ((max - min) / moyenne) de chacune des méthodes:
+                + l'échelle de Montgomery devrait être à peu près insensible au poids de Hamming
+                + la méthode binaire fait une multiplication de plus par bit à 1
+
+        Returns:
+            void: Les résultats sont imprimés à l'écran
+        """
+        pm_ladder = self.pm
+        pm_binaire = labo.PowerMod(labo.PowerMod.MULT_MONTGOMERY_REDC, self.power_n, self.base)
+        methodes = [
+            ("Echelle", pm_ladder, self.test_power_ladder),
+            ("Binaire (REDC)", pm_binaire, self.test_power_monty),
+        ]
+        medianes = {nom: [] for nom, _, _ in methodes}
+        print("\tPoids\tMethode\t\t\tTemps median\tExp/s\t\tEcart-type")
+        for w in self.hamming_exposants(self.power_n.bit_length()):
+            for nom, pm, called_func in methodes:
+                self.pm = pm
+                mesures = self.time_one_exposant(called_func, w)
+                mediane = statistics.median(mesures)
+                medianes[nom].append(mediane)
+                print(
+                    "\t{}\t{:<16}\t{:.2e}\t{:.2e}\t{:.2e}".format(
+                        bin(w).count("1"),
+                        nom,
+                        mediane,
+                        1 / mediane if mediane > 0 else float("inf"),
+                        statistics.pstdev(mesures),
+                    )
+                )
+        self.pm = pm_ladder
+        for nom, _, _ in methodes:
+            print(
+                "\tEcart relatif selon le poids de Hamming ({}):\t{:.1%}".format(
+                    nom,
+                    (max(medianes[nom]) - min(medianes[nom])) / statistics.mean(medianes[nom]),
+                )
+            )
+
+    def print_pool_stats(self):
+        """Débit de chacun des processus de PowerModPool (stats()), puis arrêt des processus:
+            - Pour chaque processus: nombre de tâches calculées, temps de calcul cumulé et débit (tâches/s)
+            - Le temps d'envoi des paquets entre les processus n'est pas compris dans le temps de calcul
+
+        Returns:
+            void: Les résultats sont imprimés à l'écran
+        """
+        print("\tProcessus\tTaches\t\tTemps\t\tTaches/s")
+        for pid, mesure in sorted(self.pool.stats().items()):
+            print("\t{}\t\t{}\t\t{:.2e}\t{:.2e}".format(pid, mesure["taches"], mesure["temps"], mesure["debit"]))
+        self.pool.close()
+        self.pool = None
+
+    def print_async_metrics(self):
+        """Mesures du frontal AsyncPowerMod (metrics()), puis arrêt du fil de calcul:
+            - Profondeur de la file, nombre et taille des lots
+            - Latence moyenne et p99 d'une demande (de l'appel à power jusqu'au résultat), en secondes
+
+        Returns:
+            void: Les résultats sont imprimés à l'écran
+        """
+        for nom, valeur in self.frontal.metrics().items():
+            if isinstance(valeur, float):
+                valeur = "{:.2e}".format(valeur)
+            print("\t{:<24}{}".format(nom, valeur))
+        self.executor.shutdown()
+        self.executor = None
+        self.frontal = None
+
+    def print_log_stats(self):
+        """Mesures du logarithme discret (LogDiscret.stats()), cumulées sur tous les appels:
+            - Nombre de pas (multiplications de groupe), temps (s) et pas par seconde
+            - Mémoire maximale utilisée par les tables (octets)
+
+        Returns:
+            void: Les résultats sont imprimés à l'écran
+        """
+        for nom, valeur in self.log_discret.stats().items():
+            if isinstance(valeur, float):
+                valeur = "{:.2e}".format(valeur)
+            print("\t{:<24}{}".format(nom, valeur))
+        self.log_discret = None
+
     def register_test(self, reg_type):
         """Enregistre un test à effectuer d'un certain type:
             - Une validation est effectuée pour empêcher la duplication de tests
@@ -379,6 +1022,9 @@ class TestLabo:
         self.called_func = None
         self.empty_func = None
         self.params = []
+        self.pool = None
+        self.frontal = None
+        self.executor = None
 
         # Les grands nombres suivants sont prédéfinis pour faire les
         # tests, mais si vous le désirez vous pouvez en utiliser d'autres
@@ -399,6 +1045,13 @@ class TestLabo:
         self.m1 = 1234567890123456789012345678901234567890123456789012345678901234567890123456789012345678901234567890
         self.m2 = 9876543210987654321098765432109876543210987654321098765432109876543210987654321098765432109876543210
         self.base = 10
+        self.chiffres = 1
+        self.rsa_bits = 512
+        self.lot = 64
+        self.termes = 4
+        self.paires = 4096
+        self.facteur_bits = 24
+        self.log_bits = 24
 
         # self.args contient tout ce que le parser de ligne de commande a obtenu
         if self.args.it:
@@ -409,6 +1062,11 @@ class TestLabo:
             self.pgcd1 = int(self.args.pgcd1)
         if self.args.pgcd2:
             self.pgcd2 = int(self.args.pgcd2)
+        if self.args.pgcd_bits:
+            # Chaque itération de get_pgcd_num ajoute log2(nombre d'or) bits (environ 0.694)
+            pgcd_it = int(self.args.pgcd_bits / 0.6942)
+            self.pgcd1 = self.get_pgcd_num(pgcd_it + 1, 1)
+            self.pgcd2 = self.get_pgcd_num(pgcd_it, 1)
         if self.args.a:
             self.power_a = int(self.args.a)
         if self.args.w:
@@ -421,6 +1079,20 @@ class TestLabo:
             self.m2 = int(self.args.m2)
         if self.args.base:
             self.base = int(self.args.base)
+        if self.args.chiffres:
+            self.chiffres = int(self.args.chiffres)
+        if self.args.rsa_bits:
+            self.rsa_bits = int(self.args.rsa_bits)
+        if self.args.lot:
+            self.lot = int(self.args.lot)
+        if self.args.termes:
+            self.termes = int(self.args.termes)
+        if self.args.paires:
+            self.paires = int(self.args.paires)
+        if self.args.facteur_bits:
+            self.facteur_bits = int(self.args.facteur_bits)
+        if self.args.log_bits:
+            self.log_bits = int(self.args.log_bits)
         return
 
     # Si mode verbose, refléter les valeurs des paramètres passés sur la ligne de commande
@@ -441,8 +1113,16 @@ class TestLabo:
             print("Nombre à élever à une puissance: " + str(self.power_a))
             print("Puissance à utiliser: " + str(self.power_w))
             print("Modulo pour l'élévation à une puissance: " + str(self.power_n))
+            print("Base de calcul de Montgomery: " + str(self.base))
+            print("Chiffres par itération de Montgomery: " + str(self.chiffres))
             print("Premier nombre pour multiplication: " + str(self.m1))
             print("Deuxième nombre pour multiplication: " + str(self.m2))
+            print("Taille (en bits) des clés RSA: " + str(self.rsa_bits))
+            print("Nombre de nombres par lot d'exponentiations: " + str(self.lot))
+            print("Nombre de termes de la multi-exponentiation: " + str(self.termes))
+            print("Nombre de paires du calcul de pgcd_many: " + str(self.paires))
+            print("Taille (en bits) des facteurs p et q à factoriser: " + str(self.facteur_bits))
+            print("Taille (en bits) du plus grand facteur premier de l'ordre (logarithme discret): " + str(self.log_bits))
 
             print("")
             if self.args.all:
@@ -451,6 +1131,8 @@ class TestLabo:
                 if self.args.pgcd:
                     print("Test de la méthode d'Euclide pour le PGCD")
                     print("Test de la méthode binaire pour le PGCD")
+                    print("Test de la méthode de Lehmer pour le PGCD")
+                    print("Test de la méthode du demi-pgcd pour le PGCD")
                     print("Test de la méthode standard de calcul du PGCD avec numpy")
                 else:
                     if self.args.euclide:
@@ -459,16 +1141,40 @@ class TestLabo:
                     if self.args.pgcd_binaire:
                         print("Test de la méthode binaire pour le PGCD")
 
+                    if self.args.pgcd_lehmer:
+                        print("Test de la méthode de Lehmer pour le PGCD")
+
+                    if self.args.pgcd_hgcd:
+                        print("Test de la méthode du demi-pgcd pour le PGCD")
+
                     if self.args.pgcd_std:
                         print(
                             "Test de la méthode standard de calcul du PGCD avec numpy"
                         )
 
+                if self.args.pgcd_reduce:
+                    print("Test du ppcm et du pgcd d'un tableau numpy.int64 (ppcm > 2^63)")
+
+                if self.args.pgcd_many:
+                    print("Test du pgcd d'un tableau de paires (pgcd_many et boucle de math.gcd)")
+
                 if self.args.exposant:
                     print("Test de la méthode binaire des exposants")
                     print(
                         "Test de la méthode de Montgomery appliquée au calcul des exposants"
                     )
+                    print("Test de la méthode de Montgomery par mot (REDC)")
+                    print("Test de l'échelle de Montgomery (temps constant)")
+                    print("Test de la méthode binaire avec réduction de Barrett")
+                    print("Test de la méthode k-aire des exposants")
+                    print("Test de la méthode de la fenêtre glissante")
+                    print("Test d'un lot d'exponentiations (power_many et pow de Python)")
+                    print("Test de la mise à une puissance d'un nombre fixe (table précalculée)")
+                    print("Test de la mise à une puissance par les restes chinois")
+                    print("Test de la multi-exponentiation simultanée (Straus et pow de Python)")
+                    print("Test des plans d'exposant compilés (fenêtre glissante et wNAF)")
+                    print("Test d'un lot d'exponentiations en parallèle (PowerModPool)")
+                    print("Test d'un lot d'exponentiations par le frontal asyncio (AsyncPowerMod)")
                     print("Test de la méthode Python standard de calcul des exposants")
                 else:
                     if self.args.exposant_binaire:
@@ -478,6 +1184,38 @@ class TestLabo:
                         print(
                             "Test de la méthode de Montgomery appliquée au calcul des exposants"
                         )
+                        print("Test de la méthode de Montgomery par mot (REDC)")
+
+                    if self.args.exposant_ladder:
+                        print("Test de l'échelle de Montgomery (temps constant)")
+
+                    if self.args.exposant_barrett:
+                        print("Test de la méthode binaire avec réduction de Barrett")
+
+                    if self.args.exposant_fenetre:
+                        print("Test de la méthode k-aire des exposants")
+                        print("Test de la méthode de la fenêtre glissante")
+
+                    if self.args.exposant_lot:
+                        print("Test d'un lot d'exponentiations (power_many et pow de Python)")
+
+                    if self.args.exposant_fixe:
+                        print("Test de la mise à une puissance d'un nombre fixe (table précalculée)")
+
+                    if self.args.exposant_crt:
+                        print("Test de la mise à une puissance par les restes chinois")
+
+                    if self.args.exposant_multi:
+                        print("Test de la multi-exponentiation simultanée (Straus et pow de Python)")
+
+                    if self.args.exposant_compile:
+                        print("Test des plans d'exposant compilés (fenêtre glissante et wNAF)")
+
+                    if self.args.exposant_pool:
+                        print("Test d'un lot d'exponentiations en parallèle (PowerModPool)")
+
+                    if self.args.exposant_async:
+                        print("Test d'un lot d'exponentiations par le frontal asyncio (AsyncPowerMod)")
 
                     if self.args.exposant_std:
                         print(
@@ -498,6 +1236,21 @@ class TestLabo:
                     if self.args.mult_KO:
                         print("Test de la multiplication de Karatsuba-Ofman")
 
+                if self.args.cle_rsa:
+                    print("Test de la génération de clés RSA")
+
+                if self.args.factorisation:
+                    print("Test de la factorisation (rho de Pollard, variante de Brent)")
+
+                if self.args.log_discret:
+                    print("Test du logarithme discret (Pohlig-Hellman)")
+
+                if self.args.pgcd_batch:
+                    print("Test du pgcd par lot (BatchPgcd et boucle de math.gcd)")
+
+                if self.args.inverse_many:
+                    print("Test de l'inversion d'un lot (inverse_many et pow de Python)")
+
             print("")
         return
 
@@ -505,16 +1258,37 @@ class TestLabo:
     # Vous devez choisir une procedure à tester:
     #   -euclide                : pgcd Euclide
     #   -pgcd_binaire           : pgcd binaire
+    #   -pgcd_lehmer            : pgcd de Lehmer
+    #   -pgcd_hgcd              : pgcd basé sur le demi-pgcd (half-gcd)
     #   -pgcd_std               : Méthode standard en Python pour le pgcd
-    #   -pgcd                   : Effectue le test des trois méthodes de calcul du pgcd
+    #   -pgcd                   : Effectue le test des cinq méthodes de calcul du pgcd
+    #   -pgcd_reduce            : ppcm et pgcd d'un tableau numpy.int64 (ppcm plus grand que 2^63)
+    #   -pgcd_many              : pgcd de nombreuses paires (pgcd_many), comparé à une boucle de math.gcd
     #   -exposant_binaire       : Méthode binaire des exposants
     #   -exposant_Montgomery    : Méthode de Montgomery avec methode binaire des exposants
+    #                             (un chiffre à la fois et par mot, REDC)
+    #   -exposant_ladder        : Échelle de Montgomery (temps constant), avec mesure de la
+    #                             variance selon le poids de Hamming de l'exposant
+    #   -exposant_barrett       : Méthode binaire des exposants avec réduction de Barrett
+    #   -exposant_fenetre       : Méthodes k-aire et de la fenêtre glissante (multiplication REDC)
+    #   -exposant_lot           : Lot d'exponentiations (power_many), comparé à un appel à pow par nombre
+    #   -exposant_fixe          : Mise à une puissance d'un nombre fixe (table précalculée une seule fois)
+    #   -exposant_crt           : Restes chinois (n est d'abord factorisé, hors de la mesure du temps)
+    #   -exposant_multi         : Multi-exponentiation simultanée (Straus), comparée au produit des pow
+    #   -exposant_compile       : Plans d'exposant compilés (fenêtre glissante et wNAF, multiplication REDC)
+    #   -exposant_pool          : Lot d'exponentiations en parallèle (PowerModPool), débit de chaque processus
+    #   -exposant_async         : Lot d'exponentiations par le frontal asyncio (AsyncPowerMod), latences
     #   -exposant_std           : Méthode standard (avec numpy) de calcul des exposants
-    #   -exposant               : Effectue le test des trois méthodes de calcul des exposants
+    #   -exposant               : Effectue le test de toutes les méthodes de calcul des exposants
     #   -mult_std               : Multiplication standard en Python
     #   -mult_prim              : Multiplication traditionnelle
     #   -mult_KO                : Multiplication de Karatsuba-Ofman
     #   -mult                   : Effectue le test des trois méthodes de calcul des exposants
+    #   -cle_rsa                : Génération de clés RSA (validation de l'écart entre p et q)
+    #   -factorisation          : Factorisation de 12 * p * q (rho de Pollard, variante de Brent)
+    #   -log_discret            : Logarithme discret modulo un premier n = 2 * k * q + 1 (Pohlig-Hellman)
+    #   -pgcd_batch             : pgcd de chaque module avec le produit des autres (BatchPgcd), comparé à math.gcd
+    #   -inverse_many           : Inversion d'un lot modulo n (inverse_many), comparée à pow(v, -1, n)
     # ------------------------------------------------------------------------------
 
     def setup_and_parse_cli(self):
@@ -532,12 +1306,26 @@ class TestLabo:
             help="Tester l'algorithme d'Euclide standard",
         )
         parser.add_argument("-pgcd_binaire", action="store_true", help="PGCD binaire")
+        parser.add_argument("-pgcd_lehmer", action="store_true", help="PGCD de Lehmer")
+        parser.add_argument(
+            "-pgcd_hgcd", action="store_true", help="PGCD basé sur le demi-pgcd"
+        )
         parser.add_argument(
             "-pgcd", action="store_true", help="PGCD binaire et méthode d'Euclide"
         )
         parser.add_argument(
             "-pgcd_std", action="store_true", help="PGCD standard avec numpy"
         )
+        parser.add_argument(
+            "-pgcd_reduce",
+            action="store_true",
+            help="ppcm et pgcd d'un tableau numpy.int64 (ppcm plus grand que 2^63)",
+        )
+        parser.add_argument(
+            "-pgcd_many",
+            action="store_true",
+            help="pgcd de nombreuses paires (pgcd_many), comparé à une boucle de math.gcd",
+        )
         parser.add_argument(
             "-exposant_binaire",
             action="store_true",
@@ -548,6 +1336,56 @@ class TestLabo:
             action="store_true",
             help="Méthode d'exponentiation de Montgomery",
         )
+        parser.add_argument(
+            "-exposant_ladder",
+            action="store_true",
+            help="Échelle de Montgomery (temps constant) et variance selon le poids de Hamming",
+        )
+        parser.add_argument(
+            "-exposant_barrett",
+            action="store_true",
+            help="Méthode binaire des exposants avec réduction de Barrett",
+        )
+        parser.add_argument(
+            "-exposant_fenetre",
+            action="store_true",
+            help="Méthodes k-aire et de la fenêtre glissante (multiplication REDC)",
+        )
+        parser.add_argument(
+            "-exposant_lot",
+            action="store_true",
+            help="Lot d'exponentiations (power_many), comparé à un appel à pow par nombre",
+        )
+        parser.add_argument(
+            "-exposant_fixe",
+            action="store_true",
+            help="Mise à une puissance d'un nombre fixe (table précalculée une seule fois)",
+        )
+        parser.add_argument(
+            "-exposant_crt",
+            action="store_true",
+            help="Mise à une puissance par les restes chinois (n est factorisé)",
+        )
+        parser.add_argument(
+            "-exposant_multi",
+            action="store_true",
+            help="Multi-exponentiation simultanée (Straus), comparée au produit des pow",
+        )
+        parser.add_argument(
+            "-exposant_compile",
+            action="store_true",
+            help="Plans d'exposant compilés (fenêtre glissante et wNAF, multiplication REDC)",
+        )
+        parser.add_argument(
+            "-exposant_pool",
+            action="store_true",
+            help="Lot d'exponentiations en parallèle (PowerModPool), débit de chaque processus",
+        )
+        parser.add_argument(
+            "-exposant_async",
+            action="store_true",
+            help="Lot d'exponentiations par le frontal asyncio (AsyncPowerMod), latences",
+        )
         parser.add_argument(
             "-exposant_std",
             action="store_true",
@@ -572,6 +1410,31 @@ class TestLabo:
             action="store_true",
             help="Test des trois méthodes de multiplication",
         )
+        parser.add_argument(
+            "-cle_rsa",
+            action="store_true",
+            help="Génération de clés RSA (validation de l'écart entre p et q)",
+        )
+        parser.add_argument(
+            "-factorisation",
+            action="store_true",
+            help="Factorisation de 12 * p * q (rho de Pollard, variante de Brent)",
+        )
+        parser.add_argument(
+            "-log_discret",
+            action="store_true",
+            help="Logarithme discret modulo un premier n = 2 * k * q + 1 (Pohlig-Hellman)",
+        )
+        parser.add_argument(
+            "-pgcd_batch",
+            action="store_true",
+            help="pgcd de chaque module avec le produit des autres (BatchPgcd), comparé à math.gcd",
+        )
+        parser.add_argument(
+            "-inverse_many",
+            action="store_true",
+            help="Inversion d'un lot modulo n (inverse_many), comparée à pow(v, -1, n)",
+        )
         parser.add_argument(
             "-all",
             action="store_true",
@@ -581,6 +1444,11 @@ class TestLabo:
         parser.add_argument("-inner_it", type=int, help="Nombre d'itérations internes")
         parser.add_argument("-pgcd1", type=int, help="Nombre 1 pour calculer pgcd")
         parser.add_argument("-pgcd2", type=int, help="Nombre 2 pour calculer pgcd")
+        parser.add_argument(
+            "-pgcd_bits",
+            type=int,
+            help="Taille (en bits) des nombres générés pour calculer pgcd (remplace pgcd1 et pgcd2)",
+        )
         parser.add_argument("-a", type=int, help="Nombre à élever à une puissance")
         parser.add_argument("-w", type=int, help="Puissance à utiliser")
         parser.add_argument(
@@ -591,6 +1459,31 @@ class TestLabo:
             type=int,
             help="Base utilisée pour le calcul de Montgomery (typiquement 2 ou 10)",
         )
+        parser.add_argument(
+            "-chiffres",
+            type=int,
+            help="Nombre de chiffres traités à la fois par la multiplication de Montgomery (super-base)",
+        )
+        parser.add_argument(
+            "-rsa_bits", type=int, help="Taille (en bits) du modulo des clés RSA"
+        )
+        parser.add_argument(
+            "-lot", type=int, help="Nombre de nombres par lot d'exponentiations"
+        )
+        parser.add_argument(
+            "-termes", type=int, help="Nombre de termes de la multi-exponentiation"
+        )
+        parser.add_argument(
+            "-paires", type=int, help="Nombre de paires du calcul de pgcd_many"
+        )
+        parser.add_argument(
+            "-facteur_bits", type=int, help="Taille (en bits) des facteurs p et q à factoriser"
+        )
+        parser.add_argument(
+            "-log_bits",
+            type=int,
+            help="Taille (en bits) du plus grand facteur premier de l'ordre (logarithme discret)",
+        )
         parser.add_argument("-m1", type=int, help="Nombre 1 pour calculer produit")
         parser.add_argument("-m2", type=int, help="Nombre 2 pour calculer produit")
         parser.add_argument(
@@ -620,16 +1513,66 @@ class TestLabo:
         if self.args.pgcd_std:
             self.register_test(self.TESTLABO_PGCD_STD)
             pas_de_test = False
+        if self.args.pgcd_lehmer:
+            self.register_test(self.TESTLABO_PGCD_LEHMER)
+            pas_de_test = False
+        if self.args.pgcd_hgcd:
+            self.register_test(self.TESTLABO_PGCD_HGCD)
+            pas_de_test = False
         if self.args.pgcd:
             self.register_test(self.TESTLABO_PGCD_EUCLID)
             self.register_test(self.TESTLABO_PGCD_BINAIRE)
+            self.register_test(self.TESTLABO_PGCD_LEHMER)
+            self.register_test(self.TESTLABO_PGCD_HGCD)
             self.register_test(self.TESTLABO_PGCD_STD)
             pas_de_test = False
+        if self.args.pgcd_reduce:
+            self.register_test(self.TESTLABO_PGCD_REDUCE)
+            pas_de_test = False
+        if self.args.pgcd_many:
+            self.register_test(self.TESTLABO_PGCD_MANY)
+            self.register_test(self.TESTLABO_PGCD_MANY_STD)
+            pas_de_test = False
         if self.args.exposant_binaire:
             self.register_test(self.TESTLABO_EXPOSANT_BINAIRE)
             pas_de_test = False
         if self.args.exposant_Montgomery:
             self.register_test(self.TESTLABO_EXPOSANT_MONTGOMERY)
+            self.register_test(self.TESTLABO_EXPOSANT_MONTGOMERY_REDC)
+            pas_de_test = False
+        if self.args.exposant_ladder:
+            self.register_test(self.TESTLABO_EXPOSANT_LADDER)
+            pas_de_test = False
+        if self.args.exposant_barrett:
+            self.register_test(self.TESTLABO_EXPOSANT_BARRETT)
+            pas_de_test = False
+        if self.args.exposant_fenetre:
+            self.register_test(self.TESTLABO_EXPOSANT_K_AIRE)
+            self.register_test(self.TESTLABO_EXPOSANT_FENETRE)
+            pas_de_test = False
+        if self.args.exposant_lot:
+            self.register_test(self.TESTLABO_EXPOSANT_LOT)
+            self.register_test(self.TESTLABO_EXPOSANT_LOT_STD)
+            pas_de_test = False
+        if self.args.exposant_fixe:
+            self.register_test(self.TESTLABO_EXPOSANT_FIXE)
+            pas_de_test = False
+        if self.args.exposant_crt:
+            self.register_test(self.TESTLABO_EXPOSANT_CRT)
+            pas_de_test = False
+        if self.args.exposant_multi:
+            self.register_test(self.TESTLABO_EXPOSANT_MULTI)
+            self.register_test(self.TESTLABO_EXPOSANT_MULTI_STD)
+            pas_de_test = False
+        if self.args.exposant_compile:
+            self.register_test(self.TESTLABO_EXPOSANT_COMPILE)
+            self.register_test(self.TESTLABO_EXPOSANT_WNAF)
+            pas_de_test = False
+        if self.args.exposant_pool:
+            self.register_test(self.TESTLABO_EXPOSANT_POOL)
+            pas_de_test = False
+        if self.args.exposant_async:
+            self.register_test(self.TESTLABO_EXPOSANT_ASYNC)
             pas_de_test = False
         if self.args.exposant_std:
             self.register_test(self.TESTLABO_EXPOSANT_STD)
@@ -637,6 +1580,21 @@ class TestLabo:
         if self.args.exposant:
             self.register_test(self.TESTLABO_EXPOSANT_BINAIRE)
             self.register_test(self.TESTLABO_EXPOSANT_MONTGOMERY)
+            self.register_test(self.TESTLABO_EXPOSANT_MONTGOMERY_REDC)
+            self.register_test(self.TESTLABO_EXPOSANT_LADDER)
+            self.register_test(self.TESTLABO_EXPOSANT_BARRETT)
+            self.register_test(self.TESTLABO_EXPOSANT_K_AIRE)
+            self.register_test(self.TESTLABO_EXPOSANT_FENETRE)
+            self.register_test(self.TESTLABO_EXPOSANT_LOT)
+            self.register_test(self.TESTLABO_EXPOSANT_LOT_STD)
+            self.register_test(self.TESTLABO_EXPOSANT_FIXE)
+            self.register_test(self.TESTLABO_EXPOSANT_CRT)
+            self.register_test(self.TESTLABO_EXPOSANT_MULTI)
+            self.register_test(self.TESTLABO_EXPOSANT_MULTI_STD)
+            self.register_test(self.TESTLABO_EXPOSANT_COMPILE)
+            self.register_test(self.TESTLABO_EXPOSANT_WNAF)
+            self.register_test(self.TESTLABO_EXPOSANT_POOL)
+            self.register_test(self.TESTLABO_EXPOSANT_ASYNC)
             self.register_test(self.TESTLABO_EXPOSANT_STD)
             pas_de_test = False
         if self.args.mult_std:
@@ -653,16 +1611,60 @@ class TestLabo:
             self.register_test(self.TESTLABO_MULT_N2)
             self.register_test(self.TESTLABO_MULT_KO)
             pas_de_test = False
+        if self.args.cle_rsa:
+            self.register_test(self.TESTLABO_CLE_RSA)
+            pas_de_test = False
+        if self.args.factorisation:
+            self.register_test(self.TESTLABO_FACTORISATION)
+            pas_de_test = False
+        if self.args.log_discret:
+            self.register_test(self.TESTLABO_LOG_DISCRET)
+            pas_de_test = False
+        if self.args.pgcd_batch:
+            self.register_test(self.TESTLABO_PGCD_BATCH)
+            self.register_test(self.TESTLABO_PGCD_BATCH_STD)
+            pas_de_test = False
+        if self.args.inverse_many:
+            self.register_test(self.TESTLABO_INVERSE_MANY)
+            self.register_test(self.TESTLABO_INVERSE_MANY_STD)
+            pas_de_test = False
         if self.args.all:
             self.register_test(self.TESTLABO_PGCD_BINAIRE)
             self.register_test(self.TESTLABO_PGCD_EUCLID)
+            self.register_test(self.TESTLABO_PGCD_LEHMER)
+            self.register_test(self.TESTLABO_PGCD_HGCD)
             self.register_test(self.TESTLABO_PGCD_STD)
+            self.register_test(self.TESTLABO_PGCD_REDUCE)
+            self.register_test(self.TESTLABO_PGCD_MANY)
+            self.register_test(self.TESTLABO_PGCD_MANY_STD)
             self.register_test(self.TESTLABO_EXPOSANT_BINAIRE)
             self.register_test(self.TESTLABO_EXPOSANT_MONTGOMERY)
+            self.register_test(self.TESTLABO_EXPOSANT_MONTGOMERY_REDC)
+            self.register_test(self.TESTLABO_EXPOSANT_LADDER)
+            self.register_test(self.TESTLABO_EXPOSANT_BARRETT)
+            self.register_test(self.TESTLABO_EXPOSANT_K_AIRE)
+            self.register_test(self.TESTLABO_EXPOSANT_FENETRE)
+            self.register_test(self.TESTLABO_EXPOSANT_LOT)
+            self.register_test(self.TESTLABO_EXPOSANT_LOT_STD)
+            self.register_test(self.TESTLABO_EXPOSANT_FIXE)
+            self.register_test(self.TESTLABO_EXPOSANT_CRT)
+            self.register_test(self.TESTLABO_EXPOSANT_MULTI)
+            self.register_test(self.TESTLABO_EXPOSANT_MULTI_STD)
+            self.register_test(self.TESTLABO_EXPOSANT_COMPILE)
+            self.register_test(self.TESTLABO_EXPOSANT_WNAF)
+            self.register_test(self.TESTLABO_EXPOSANT_POOL)
+            self.register_test(self.TESTLABO_EXPOSANT_ASYNC)
             self.register_test(self.TESTLABO_EXPOSANT_STD)
             self.register_test(self.TESTLABO_MULT_N2)
             self.register_test(self.TESTLABO_MULT_KO)
             self.register_test(self.TESTLABO_MULT)
+            self.register_test(self.TESTLABO_CLE_RSA)
+            self.register_test(self.TESTLABO_FACTORISATION)
+            self.register_test(self.TESTLABO_LOG_DISCRET)
+            self.register_test(self.TESTLABO_PGCD_BATCH)
+            self.register_test(self.TESTLABO_PGCD_BATCH_STD)
+            self.register_test(self.TESTLABO_INVERSE_MANY)
+            self.register_test(self.TESTLABO_INVERSE_MANY_STD)
             pas_de_test = False
         if pas_de_test:
             print("Pas de test à effectuer!")